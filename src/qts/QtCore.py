@@ -2,31 +2,51 @@
 #       https://github.com/python-qt-tools/qts/issues/8
 # mypy: implicit_reexport
 
-# start-after qts.is_* example
+import typing
+
 import qts
+import qts._lazy
 
 
 if qts.wrapper is None:
     qts.autoset_wrapper()
 
-if qts.is_pyqt_5_wrapper:
-    from PyQt5.QtCore import *
-elif qts.is_pyqt_6_wrapper:
-    from PyQt6.QtCore import *
-elif qts.is_pyside_5_wrapper:
-    from PySide2.QtCore import *
-elif qts.is_pyside_6_wrapper:
-    from PySide6.QtCore import *
+if typing.TYPE_CHECKING:
+    # Type checkers see the complete wrapper namespace.  At runtime the attributes
+    # are instead resolved lazily on first access, see below.
+
+    # start-after qts.is_* example
+    if qts.is_pyqt_5_wrapper:
+        from PyQt5.QtCore import *
+    elif qts.is_pyqt_6_wrapper:
+        from PyQt6.QtCore import *
+    elif qts.is_pyside_5_wrapper:
+        from PySide2.QtCore import *
+    elif qts.is_pyside_6_wrapper:
+        from PySide6.QtCore import *
+    else:
+        raise qts.InvalidWrapperError(wrapper=qts.wrapper)
+    # end-before qts.is_* example
+
+    if qts.is_pyqt_5_wrapper or qts.is_pyqt_6_wrapper:
+        Signal = pyqtSignal
+        del pyqtSignal
+
+        SignalInstance = pyqtBoundSignal
+        del pyqtBoundSignal
 else:
-    raise qts.InvalidWrapperError(wrapper=qts.wrapper)
-# end-before qts.is_* example
+    _wrapped = qts._lazy.import_wrapped(name="QtCore")
 
-if qts.is_pyqt_5_wrapper or qts.is_pyqt_6_wrapper:
-    Signal = pyqtSignal
-    del pyqtSignal
+    if qts.is_pyqt_5_wrapper or qts.is_pyqt_6_wrapper:
+        Signal = _wrapped.pyqtSignal
+        SignalInstance = _wrapped.pyqtBoundSignal
+        _hidden = {"pyqtSignal", "pyqtBoundSignal"}
+    else:
+        Signal = _wrapped.Signal
+        SignalInstance = _wrapped.SignalInstance
+        _hidden = set()
 
-    SignalInstance = pyqtBoundSignal
-    del pyqtBoundSignal
+    qts._lazy.forward_attributes(namespace=globals(), wrapped=_wrapped, hidden=_hidden)
 
 
 Signal = Signal
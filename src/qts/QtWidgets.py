@@ -2,19 +2,27 @@
 #       https://github.com/python-qt-tools/qts/issues/8
 # mypy: implicit_reexport
 
+import typing
+
 import qts
+import qts._lazy
 
 
 if qts.wrapper is None:
     qts.autoset_wrapper()
 
-if qts.is_pyqt_5_wrapper:
-    from PyQt5.QtWidgets import *
-elif qts.is_pyqt_6_wrapper:
-    from PyQt6.QtWidgets import *
-elif qts.is_pyside_5_wrapper:
-    from PySide2.QtWidgets import *
-elif qts.is_pyside_6_wrapper:
-    from PySide6.QtWidgets import *
+if typing.TYPE_CHECKING:
+    if qts.is_pyqt_5_wrapper:
+        from PyQt5.QtWidgets import *
+    elif qts.is_pyqt_6_wrapper:
+        from PyQt6.QtWidgets import *
+    elif qts.is_pyside_5_wrapper:
+        from PySide2.QtWidgets import *
+    elif qts.is_pyside_6_wrapper:
+        from PySide6.QtWidgets import *
+    else:
+        raise qts.InvalidWrapperError(wrapper=qts.wrapper)
 else:
-    raise qts.InvalidWrapperError(wrapper=qts.wrapper)
+    qts._lazy.forward_attributes(
+        namespace=globals(), wrapped=qts._lazy.import_wrapped(name="QtWidgets")
+    )
@@ -10,6 +10,8 @@ from qts._core import (
     available_wrapper,
     available_wrappers,
     check_already_imported_wrappers,
+    inherit_wrapper,
+    invalidate_caches,
     pyqt_5_wrapper,
     pyqt_6_wrapper,
     pyside_5_wrapper,
@@ -19,21 +21,55 @@ from qts._core import (
     wrapper_by_name,
     supported_wrappers,
 )
-from qts._errors import (
-    InternalError,
-    InvalidWrapperError,
-    MultipleWrappersAvailableError,
-    NoWrapperAvailableError,
-    OtherWrapperAlreadyImportedError,
-    QtsError,
-    WrapperAlreadySelectedError,
-    UnsupportedWrappersError,
-)
-from qts._version import get_versions
+import qts._importer
+
+if typing.TYPE_CHECKING:
+    from qts._errors import (
+        InternalError,
+        InvalidWrapperError,
+        MultipleWrappersAvailableError,
+        NoWrapperAvailableError,
+        OtherWrapperAlreadyImportedError,
+        QtsError,
+        WrapperAlreadySelectedError,
+        UnsupportedWrappersError,
+    )
+else:
+    # The exceptions and version are only loaded on first access to keep importing
+    # qts cheap.  Determining the version can even run git in a source checkout.
+
+    _lazy_error_names = {
+        "InternalError",
+        "InvalidWrapperError",
+        "MultipleWrappersAvailableError",
+        "NoWrapperAvailableError",
+        "OtherWrapperAlreadyImportedError",
+        "QtsError",
+        "WrapperAlreadySelectedError",
+        "UnsupportedWrappersError",
+    }
+
+    def __getattr__(name):
+        if name == "__version__":
+            import qts._metadata
+
+            value = qts._metadata.version()
+        elif name in _lazy_error_names:
+            import qts._errors
+
+            value = getattr(qts._errors, name)
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__version__: str = get_versions()["version"]  # type: ignore[no-untyped-call]
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted({*globals(), "__version__", *_lazy_error_names})
+
+
+__version__: str
 """The qts version string."""
-del get_versions
 
 
 wrapper: typing.Optional[Wrapper] = None
@@ -49,3 +85,6 @@ is_pyside_6_wrapper: bool = False
 
 _building_docs: bool = False
 """Set to ``True`` when building the documentation."""
+
+
+qts._importer.install()
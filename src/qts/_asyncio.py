@@ -0,0 +1,313 @@
+import asyncio
+import math
+import selectors
+import time
+import typing
+
+import typing_extensions
+
+import qts._events
+import qts.util
+from qts import QtCore
+
+
+_FileObject = typing.Union[int, "_HasFileno"]
+
+_wake_event_type = qts._events.registered_event_type("qts.util.QtSelector wake")
+
+_T = typing.TypeVar("_T")
+
+
+class _HasFileno(typing_extensions.Protocol):
+    def fileno(self) -> int:
+        ...
+
+
+def _fileno(fileobj: _FileObject) -> int:
+    fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+
+    if fd < 0:
+        raise ValueError(f"Invalid file descriptor: {fd}")
+
+    return fd
+
+
+class _Waker(QtCore.QObject):
+    """Quits the selector's nested event loop when a wake event posted from another
+    thread arrives.
+    """
+
+    def __init__(self, selector: "QtSelector") -> None:
+        super().__init__()
+        self.selector = selector
+
+    def event(self, event: typing.Optional[QtCore.QEvent]) -> bool:
+        if event is not None and event.type() == _wake_event_type:
+            self.selector._wake_posted = False
+            self.selector.interrupt()
+            return True
+
+        return super().event(event)
+
+
+class QtSelector(selectors.BaseSelector):
+    """A :class:`selectors.BaseSelector` that waits by running a nested
+    :class:`QtCore.QEventLoop` so Qt events are handled while asyncio waits.
+    Readiness is reported by a :class:`QtCore.QSocketNotifier` for each registered
+    file and event and the timeout is a :class:`QtCore.QTimer`.
+
+    It must be used from the thread creating it.
+    """
+
+    process_interval = 0.001
+    """The minimum seconds between handling Qt events while asyncio has work
+    ready."""
+
+    def __init__(self) -> None:
+        self._keys: typing.Dict[int, selectors.SelectorKey] = {}
+        self._notifiers: typing.Dict[
+            typing.Tuple[int, int], QtCore.QSocketNotifier
+        ] = {}
+        self._disabled: typing.Set[QtCore.QSocketNotifier] = set()
+        self._ready: typing.Dict[int, int] = {}
+        self._selecting = False
+        self._wake_posted = False
+        self._processed_at = -math.inf
+
+        self._event_loop = QtCore.QEventLoop()
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._event_loop.quit)
+        self._waker = _Waker(selector=self)
+
+    def register(
+        self, fileobj: _FileObject, events: int, data: typing.Any = None
+    ) -> selectors.SelectorKey:
+        fd = _fileno(fileobj)
+        if not events or events & ~(selectors.EVENT_READ | selectors.EVENT_WRITE):
+            raise ValueError(f"Invalid events: {events!r}")
+        if fd in self._keys:
+            raise KeyError(f"{fileobj!r} (FD {fd}) is already registered")
+
+        key = selectors.SelectorKey(fileobj, fd, events, data)
+        self._keys[fd] = key
+
+        for event, notifier_type in [
+            (selectors.EVENT_READ, QtCore.QSocketNotifier.Type.Read),
+            (selectors.EVENT_WRITE, QtCore.QSocketNotifier.Type.Write),
+        ]:
+            if events & event:
+                self._add_notifier(fd=fd, event=event, notifier_type=notifier_type)
+
+        return key
+
+    def _add_notifier(
+        self, fd: int, event: int, notifier_type: QtCore.QSocketNotifier.Type
+    ) -> None:
+        notifier = QtCore.QSocketNotifier(typing.cast(typing.Any, fd), notifier_type)
+
+        def activated(*args: object) -> None:
+            self._activated(fd=fd, event=event, notifier=notifier)
+
+        notifier.activated.connect(activated)
+        self._notifiers[fd, event] = notifier
+
+    def _activated(self, fd: int, event: int, notifier: QtCore.QSocketNotifier) -> None:
+        # Notifiers are level triggered so they stay disabled until the next select
+        # to avoid activating again before asyncio handled the event.
+        notifier.setEnabled(False)
+        self._disabled.add(notifier)
+        self._ready[fd] = self._ready.get(fd, 0) | event
+        self.interrupt()
+
+    def unregister(self, fileobj: _FileObject) -> selectors.SelectorKey:
+        fd = _fileno(fileobj)
+        key = self._keys.pop(fd)
+
+        for event in [selectors.EVENT_READ, selectors.EVENT_WRITE]:
+            notifier = self._notifiers.pop((fd, event), None)
+            if notifier is not None:
+                notifier.setEnabled(False)
+                self._disabled.discard(notifier)
+                notifier.deleteLater()
+
+        self._ready.pop(fd, None)
+
+        return key
+
+    def modify(
+        self, fileobj: _FileObject, events: int, data: typing.Any = None
+    ) -> selectors.SelectorKey:
+        self.unregister(fileobj)
+        return self.register(fileobj, events, data)
+
+    def interrupt(self) -> None:
+        """Return from a :meth:`select` in progress in this thread."""
+        if self._selecting:
+            self._event_loop.quit()
+
+    def wake(self) -> None:
+        """Return from a :meth:`select` in progress.  Can be called from any
+        thread.
+        """
+        if not self._wake_posted:
+            self._wake_posted = True
+            QtCore.QCoreApplication.postEvent(
+                self._waker, QtCore.QEvent(_wake_event_type)
+            )
+
+    def select(
+        self, timeout: typing.Optional[float] = None
+    ) -> typing.List[typing.Tuple[selectors.SelectorKey, int]]:
+        for notifier in self._disabled:
+            notifier.setEnabled(True)
+        self._disabled.clear()
+
+        if not self._ready:
+            if timeout is not None and timeout <= 0:
+                # Qt events are handled at most once per interval while asyncio is
+                # busy since doing it every iteration would double the cost of
+                # switching tasks without making the GUI noticeably more responsive.
+                now = time.monotonic()
+                if now - self._processed_at >= self.process_interval:
+                    self._processed_at = now
+                    QtCore.QCoreApplication.processEvents()
+            else:
+                if timeout is not None:
+                    self._timer.start(math.ceil(timeout * 1000))
+
+                self._selecting = True
+                try:
+                    qts.util.exec(self._event_loop)
+                finally:
+                    self._selecting = False
+                    self._timer.stop()
+                    self._processed_at = time.monotonic()
+
+        ready = self._ready
+        self._ready = {}
+
+        return [
+            (self._keys[fd], events & self._keys[fd].events)
+            for fd, events in ready.items()
+            if fd in self._keys
+        ]
+
+    def close(self) -> None:
+        for notifier in self._notifiers.values():
+            notifier.setEnabled(False)
+            notifier.deleteLater()
+
+        self._notifiers.clear()
+        self._disabled.clear()
+        self._keys.clear()
+        self._ready.clear()
+
+    def get_map(self) -> typing.Mapping[_FileObject, selectors.SelectorKey]:
+        return _SelectorMapping(self._keys)
+
+
+class _SelectorMapping(typing.Mapping[_FileObject, selectors.SelectorKey]):
+    def __init__(self, keys: typing.Dict[int, selectors.SelectorKey]) -> None:
+        self._selector_keys = keys
+
+    def __len__(self) -> int:
+        return len(self._selector_keys)
+
+    def __getitem__(self, fileobj: _FileObject) -> selectors.SelectorKey:
+        try:
+            return self._selector_keys[_fileno(fileobj)]
+        except (KeyError, ValueError, AttributeError):
+            raise KeyError(f"{fileobj!r} is not registered") from None
+
+    def __iter__(self) -> typing.Iterator[_FileObject]:
+        return iter(self._selector_keys)
+
+
+class QtEventLoop(asyncio.SelectorEventLoop):
+    """An :mod:`asyncio` event loop that handles Qt events while it waits, using
+    :class:`QtSelector`.  Qt events are also handled between iterations when
+    asyncio has work ready.  A :class:`QtCore.QCoreApplication` must exist and the
+    loop must be used from the thread creating it.
+    """
+
+    _selector: QtSelector
+
+    def __init__(self) -> None:
+        super().__init__(selector=QtSelector())
+
+    def call_soon(  # type: ignore[override]
+        self,
+        callback: typing.Callable[..., object],
+        *args: typing.Any,
+        context: typing.Any = None,
+    ) -> asyncio.Handle:
+        handle = super().call_soon(callback, *args, context=context)
+        # Called from a Qt slot while the selector waits, such as for a task created
+        # when a button is clicked.
+        self._selector.interrupt()
+        return handle
+
+    def call_at(  # type: ignore[override]
+        self,
+        when: float,
+        callback: typing.Callable[..., object],
+        *args: typing.Any,
+        context: typing.Any = None,
+    ) -> asyncio.TimerHandle:
+        handle = super().call_at(when, callback, *args, context=context)
+        self._selector.interrupt()
+        return handle
+
+    def _write_to_self(self) -> None:
+        # Used by call_soon_threadsafe() to wake the loop.  A posted event wakes the
+        # nested Qt event loop directly instead of through the self pipe.
+        self._selector.wake()
+
+
+class QtEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """An :mod:`asyncio` event loop policy creating :class:`QtEventLoop` loops."""
+
+    def new_event_loop(self) -> asyncio.AbstractEventLoop:
+        return QtEventLoop()
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    if not tasks:
+        return
+
+    for task in tasks:
+        task.cancel()
+
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            loop.call_exception_handler(
+                {
+                    "message": "unhandled exception during qts.util.run() shutdown",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
+
+
+def run(main: typing.Awaitable[_T]) -> _T:
+    """Run a coroutine on a new :class:`qts.util.QtEventLoop` and close the loop
+    afterwards, like :func:`asyncio.run`.  Qt events are handled while it runs so
+    this can take the place of :func:`qts.util.exec` for the application.  A
+    :class:`QtCore.QCoreApplication` must already exist.
+    """
+    loop = QtEventLoop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            _cancel_all_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
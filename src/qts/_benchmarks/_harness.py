@@ -0,0 +1,22 @@
+import json
+import subprocess
+import sys
+import typing
+
+
+def run_script(
+    script: str,
+    env: typing.Optional[typing.Dict[str, str]] = None,
+) -> typing.Dict[str, typing.Any]:
+    """Run the passed Python source in a fresh interpreter and return the JSON object
+    it writes to stdout.
+    """
+    completed_process = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        encoding="utf-8",
+        env=env,
+        stdout=subprocess.PIPE,
+    )
+    result: typing.Dict[str, typing.Any] = json.loads(completed_process.stdout)
+    return result
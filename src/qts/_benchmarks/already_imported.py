@@ -0,0 +1,42 @@
+"""Compare direct lookups of known wrapper modules against scanning all of
+:data:`sys.modules` when checking for already imported wrappers.  A synthetic set of
+20,000 modules is added to :data:`sys.modules` to resemble a large application.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.already_imported
+"""
+
+import sys
+import timeit
+import types
+
+import qts._core
+
+
+def main(module_count: int = 20_000, number: int = 1_000) -> None:
+    names = [f"synthetic_package_{index}.module" for index in range(module_count)]
+    names[::2] = [f"synthetic_module_{index}" for index in range(0, module_count, 2)]
+
+    sys.modules.update((name, types.ModuleType(name)) for name in names)
+    try:
+        print(f"{len(sys.modules)} modules imported, best of 5 x {number} calls")
+        for exhaustive in [False, True]:
+            seconds = min(
+                timeit.repeat(
+                    lambda: qts._core.already_imported_wrapper_names(
+                        exhaustive=exhaustive
+                    ),
+                    number=number,
+                    repeat=5,
+                )
+            )
+            mode = "exhaustive" if exhaustive else "direct"
+            print(f"{mode:<12}{seconds / number * 1e6:>12.2f} us per call")
+    finally:
+        for name in names:
+            del sys.modules[name]
+
+
+if __name__ == "__main__":
+    main()
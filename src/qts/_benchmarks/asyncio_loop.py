@@ -0,0 +1,150 @@
+"""Compare :class:`qts.util.QtEventLoop` with the default :mod:`asyncio` event loop.
+
+Reported are the task switch latency of two tasks yielding to each other, the
+latency of :meth:`asyncio.AbstractEventLoop.call_soon_threadsafe` from another
+thread, and the throughput of echoing data through a local TCP connection.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.asyncio_loop
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+import typing
+
+import qts.util
+from qts import QtCore
+
+
+async def task_switches(count: int) -> float:
+    """Get the seconds per switch between two tasks yielding to each other."""
+
+    async def player() -> None:
+        for _ in range(count // 2):
+            await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(player(), player())
+    return (time.perf_counter() - start) / count
+
+
+async def threadsafe_latencies(count: int) -> typing.List[float]:
+    """Get the seconds from calling in from another thread until the call runs."""
+    loop = asyncio.get_event_loop()
+    latencies: typing.List[float] = []
+
+    for _ in range(count):
+        future: "asyncio.Future[None]" = loop.create_future()
+
+        def resolve(future: "asyncio.Future[None]" = future, called: float = 0) -> None:
+            latencies.append(time.perf_counter() - called)
+            future.set_result(None)
+
+        def call() -> None:
+            loop.call_soon_threadsafe(resolve, future, time.perf_counter())
+
+        thread = threading.Thread(target=call)
+        thread.start()
+        await future
+        thread.join()
+
+    return latencies
+
+
+async def echo_throughput(total: int, chunk: int) -> float:
+    """Get the bytes per second echoed through a local TCP connection."""
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        while True:
+            data = await reader.read(chunk)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, host="127.0.0.1", port=0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection(host="127.0.0.1", port=port)
+    data = b"x" * chunk
+
+    async def send() -> None:
+        for _ in range(total // chunk):
+            writer.write(data)
+            await writer.drain()
+        writer.write_eof()
+
+    start = time.perf_counter()
+    sender = asyncio.ensure_future(send())
+    received = 0
+    while True:
+        block = await reader.read(1 << 20)
+        if not block:
+            break
+        received += len(block)
+    await sender
+    seconds = time.perf_counter() - start
+
+    writer.close()
+    server.close()
+    await server.wait_closed()
+
+    return received / seconds
+
+
+async def measure(
+    switches: int, calls: int, total: int, chunk: int
+) -> typing.Dict[str, float]:
+    latencies = await threadsafe_latencies(count=calls)
+
+    return {
+        "switch": await task_switches(count=switches),
+        "threadsafe_median": statistics.median(latencies),
+        "echo": await echo_throughput(total=total, chunk=chunk),
+    }
+
+
+def main(
+    switches: int = 100_000,
+    calls: int = 1_000,
+    total: int = 256 << 20,
+    chunk: int = 64 << 10,
+) -> None:
+    application = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    print(
+        f"{qts.wrapper}, {switches:,} task switches, {calls:,} threadsafe calls,"
+        f" {total >> 20} MiB echoed in {chunk >> 10} KiB chunks"
+    )
+    print(f"{'':<10}{'switch':>12}{'threadsafe':>14}{'echo':>14}")
+    loops: typing.Dict[str, typing.Callable[[], asyncio.AbstractEventLoop]] = {
+        "asyncio": asyncio.new_event_loop,
+        "qts": qts.util.QtEventLoop,
+    }
+    for name, new_loop in loops.items():
+        loop = new_loop()
+        try:
+            asyncio.set_event_loop(loop)
+            result = loop.run_until_complete(
+                measure(switches=switches, calls=calls, total=total, chunk=chunk)
+            )
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+        print(
+            f"{name:<10}{result['switch'] * 1e6:>9.2f} us"
+            f"{result['threadsafe_median'] * 1e6:>11.1f} us"
+            f"{result['echo'] / (1 << 20):>9.0f} MiB/s"
+        )
+
+    del application
+
+
+if __name__ == "__main__":
+    main()
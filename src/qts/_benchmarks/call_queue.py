@@ -0,0 +1,128 @@
+"""Compare delivering results from worker threads to the GUI thread with one queued
+signal per result and with :class:`qts.util.CallQueue`, with and without keys.
+
+Several threads post results as fast as they can.  Reported are the throughput
+until every result has been handled, the latency from posting to handling, and the
+longest the GUI thread went without handling a timer tick while results arrived.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.call_queue
+"""
+
+import statistics
+import threading
+import time
+import typing
+
+import qts.util
+from qts import QtCore
+
+
+class Emitter(QtCore.QObject):
+    result = QtCore.Signal(int, float)
+
+
+class Receiver(QtCore.QObject):
+    def __init__(self) -> None:
+        super().__init__()
+        self.handled = 0
+        self.latencies: typing.List[float] = []
+
+    def handle(self, value: int, posted: float) -> None:
+        self.handled += 1
+        self.latencies.append(time.perf_counter() - posted)
+
+
+def run(
+    method: str,
+    threads: int,
+    count: int,
+    keys: int,
+) -> typing.Dict[str, float]:
+    receiver = Receiver()
+    emitter = Emitter()
+    emitter.result.connect(receiver.handle)
+    queue = qts.util.CallQueue()
+
+    def produce(thread_index: int) -> None:
+        perf_counter = time.perf_counter
+        if method == "signal":
+            emit = emitter.result.emit
+            for value in range(count):
+                emit(value, perf_counter())
+        elif method == "queue":
+            for value in range(count):
+                queue.post(receiver.handle, value, perf_counter())
+        else:
+            for value in range(count):
+                queue.post(
+                    receiver.handle,
+                    value,
+                    perf_counter(),
+                    key=(thread_index, value % keys),
+                )
+
+    # Measures how responsive the GUI thread stays.
+    ticks: typing.List[float] = []
+    timer = QtCore.QTimer()
+    timer.setInterval(1)
+    timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    timer.start()
+
+    workers = [
+        threading.Thread(target=produce, args=(index,)) for index in range(threads)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+
+    def done() -> bool:
+        if any(worker.is_alive() for worker in workers):
+            return False
+        if method == "keyed":
+            return queue.pending() == 0
+        return receiver.handled == threads * count
+
+    while not done():
+        QtCore.QCoreApplication.processEvents()
+    seconds = time.perf_counter() - start
+    timer.stop()
+
+    for worker in workers:
+        worker.join()
+
+    latencies = sorted(receiver.latencies)
+    gaps = [later - earlier for earlier, later in zip(ticks, ticks[1:])]
+
+    return {
+        "handled": receiver.handled,
+        "throughput": threads * count / seconds,
+        "latency_median": statistics.median(latencies),
+        "latency_p99": latencies[int(0.99 * (len(latencies) - 1))],
+        "max_tick_gap": max(gaps, default=seconds),
+    }
+
+
+def main(threads: int = 4, count: int = 50_000, keys: int = 100) -> None:
+    application = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    print(f"{qts.wrapper}, {threads} threads posting {count:,} results each")
+    print(
+        f"{'':<10}{'handled':>10}{'results/s':>12}{'median':>10}{'p99':>10}"
+        f"{'max gap':>10}"
+    )
+    for method in ["signal", "queue", "keyed"]:
+        result = run(method=method, threads=threads, count=count, keys=keys)
+        print(
+            f"{method:<10}{result['handled']:>10,.0f}{result['throughput']:>12,.0f}"
+            f"{result['latency_median'] * 1e3:>7.1f} ms"
+            f"{result['latency_p99'] * 1e3:>7.1f} ms"
+            f"{result['max_tick_gap'] * 1e3:>7.1f} ms"
+        )
+
+    del application
+
+
+if __name__ == "__main__":
+    main()
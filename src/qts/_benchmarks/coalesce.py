@@ -0,0 +1,142 @@
+"""Compare connecting a slot directly to a signal emitted at 10 kHz from a worker
+thread with connecting it through each mode of :class:`qts.util.Coalescer`.
+
+The slot simulates a repaint by busy waiting.  Reported are the slot calls, the
+process CPU time, and how long the GUI thread took to catch up after the emitter
+stopped.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.coalesce
+"""
+
+import threading
+import time
+import typing
+
+import qts.util
+from qts import QtCore
+
+
+class Emitter(QtCore.QObject):
+    signal = QtCore.Signal(int)
+    finished = QtCore.Signal()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.finished_at = 0.0
+
+
+class Receiver(QtCore.QObject):
+    """Counts and processes values in the GUI thread."""
+
+    def __init__(self, work: float) -> None:
+        super().__init__()
+        self.work = work
+        self.calls = 0
+        self.values = 0
+
+    def slot(self, value: typing.Union[int, typing.List[int]]) -> None:
+        self.calls += 1
+        self.values += len(value) if isinstance(value, list) else 1
+        end = time.perf_counter() + self.work
+        while time.perf_counter() < end:
+            pass
+
+
+def emit_at_rate(emitter: Emitter, rate: float, count: int) -> None:
+    """Emit the values from zero to count at a steady rate."""
+    signal = emitter.signal
+    start = time.perf_counter()
+    emitted = 0
+    while emitted < count:
+        time.sleep(0.001)
+        due = min(count, int((time.perf_counter() - start) * rate))
+        for value in range(emitted, due):
+            signal.emit(value)
+        emitted = max(emitted, due)
+
+    emitter.finished_at = time.perf_counter()
+    emitter.finished.emit()
+
+
+def run(
+    mode: typing.Optional["qts.util.CoalesceMode"],
+    rate: float,
+    seconds: float,
+    work: float,
+    interval: float,
+) -> typing.Dict[str, float]:
+    emitter = Emitter()
+    receiver = Receiver(work=work)
+    count = int(rate * seconds)
+
+    coalescer = None
+    if mode is None:
+        emitter.signal.connect(receiver.slot)
+    else:
+        coalescer = qts.util.Coalescer(emitter.signal, mode=mode, interval=interval)
+        coalescer.add_slot(receiver.slot)
+
+    def consumed() -> int:
+        return receiver.values if coalescer is None else coalescer.received
+
+    loop = QtCore.QEventLoop()
+    emitter.finished.connect(loop.quit)
+    thread = threading.Thread(
+        target=emit_at_rate,
+        kwargs={"emitter": emitter, "rate": rate, "count": count},
+    )
+    process_start = time.process_time()
+    thread.start()
+    qts.util.exec(loop)
+    thread.join()
+
+    while consumed() < count:
+        QtCore.QCoreApplication.processEvents()
+    lag = time.perf_counter() - emitter.finished_at
+
+    # Let trailing deliveries happen.
+    QtCore.QTimer.singleShot(int(3 * interval * 1000), loop.quit)
+    qts.util.exec(loop)
+    cpu = time.process_time() - process_start
+
+    if coalescer is not None:
+        coalescer.close()
+
+    return {"calls": receiver.calls, "cpu": cpu, "lag": lag}
+
+
+def main(
+    rate: float = 10_000,
+    seconds: float = 2,
+    work: float = 200e-6,
+    interval: float = 1 / 60,
+) -> None:
+    application = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    print(
+        f"{qts.wrapper}, {rate:,.0f} Hz for {seconds} s, {work * 1e6:.0f} us per slot"
+        f" call, {interval * 1e3:.1f} ms interval"
+    )
+    print(f"{'':<12}{'slot calls':>12}{'CPU':>10}{'lag':>10}")
+    modes: typing.List[typing.Optional[qts.util.CoalesceMode]] = [
+        None,
+        "latest",
+        "batch",
+        "debounce",
+    ]
+    for mode in modes:
+        result = run(
+            mode=mode, rate=rate, seconds=seconds, work=work, interval=interval
+        )
+        print(
+            f"{mode or 'direct':<12}{result['calls']:>12,.0f}"
+            f"{result['cpu']:>8.2f} s{result['lag']:>8.2f} s"
+        )
+
+    del application
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Measure the cold start cost of importing ``qts.QtCore``, ``qts.QtGui``, and
+``qts.QtWidgets`` with each available wrapper.
+
+Every run is a fresh interpreter so nothing is shared between measurements.  Runs are
+spread across processes in parallel to keep the total duration manageable.  This is
+the implementation of the ``qts bench import`` command.
+
+.. code-block:: console
+
+    $ qts bench import --runs 50 --json
+"""
+
+import concurrent.futures
+import math
+import os
+import statistics
+import time
+import typing
+
+import attr
+
+import qts
+import qts._benchmarks._harness
+
+
+measure_script = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import qts.QtCore
+import qts.QtGui
+import qts.QtWidgets
+seconds = time.perf_counter() - start
+
+
+def peak_rss():
+    if sys.platform == "win32":
+        import ctypes
+        import ctypes.wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", ctypes.wintypes.DWORD),
+                ("PageFaultCount", ctypes.wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(
+            process, ctypes.byref(counters), counters.cb
+        ):
+            return None
+        return counters.PeakWorkingSetSize
+
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kibibytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+json.dump(
+    {"wrapper": qts.wrapper.name, "seconds": seconds, "peak_rss": peak_rss()},
+    sys.stdout,
+)
+"""
+
+
+@attr.frozen
+class Run:
+    """The measurements from a single fresh interpreter."""
+
+    import_seconds: float
+    """The time spent importing qts and the Qt modules."""
+    process_seconds: float
+    """The time from launching the interpreter until it exited."""
+    peak_rss: typing.Optional[int]
+    """The peak resident set size in bytes, if it could be determined."""
+
+
+@attr.frozen
+class Summary:
+    """The summarized measurements for a single wrapper."""
+
+    wrapper_name: str
+    runs: typing.Tuple[Run, ...]
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        """Get the summary as JSON compatible builtin types."""
+        import_seconds = [run.import_seconds for run in self.runs]
+        process_seconds = [run.process_seconds for run in self.runs]
+        peak_rss = [run.peak_rss for run in self.runs if run.peak_rss is not None]
+
+        return {
+            "wrapper": self.wrapper_name,
+            "runs": len(self.runs),
+            "import_seconds": {
+                "median": statistics.median(import_seconds),
+                "p95": percentile(values=import_seconds, percent=95),
+                "min": min(import_seconds),
+                "max": max(import_seconds),
+            },
+            "process_seconds": {
+                "median": statistics.median(process_seconds),
+                "p95": percentile(values=process_seconds, percent=95),
+            },
+            "peak_rss_bytes": {
+                "median": statistics.median(peak_rss) if peak_rss else None,
+                "max": max(peak_rss, default=None),
+            },
+        }
+
+
+def percentile(values: typing.Sequence[float], percent: float) -> float:
+    """Get the nearest rank percentile of the passed values.
+
+    :raises ValueError: When no values are passed.
+    """
+    if len(values) == 0:
+        raise ValueError("At least one value is required")
+
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * percent / 100))
+    return ordered[rank - 1]
+
+
+def run_once(wrapper: qts.Wrapper) -> Run:
+    """Import the Qt modules in a fresh interpreter using the passed wrapper.
+
+    :raises qts.InternalError: When the interpreter selected a different wrapper.
+    """
+    env = {**os.environ, "QTS_WRAPPER": wrapper.name}
+
+    start = time.perf_counter()
+    result = qts._benchmarks._harness.run_script(script=measure_script, env=env)
+    process_seconds = time.perf_counter() - start
+
+    if result["wrapper"] != wrapper.name:
+        raise qts.InternalError(
+            f"Expected {wrapper.name} to be selected but got {result['wrapper']}"
+        )
+
+    return Run(
+        import_seconds=result["seconds"],
+        process_seconds=process_seconds,
+        peak_rss=result["peak_rss"],
+    )
+
+
+def measure(
+    wrappers: typing.Sequence[qts.Wrapper],
+    runs: int,
+    jobs: typing.Optional[int] = None,
+) -> typing.List[Summary]:
+    """Run the passed number of fresh interpreters for each wrapper.
+
+    :param wrappers: The wrappers to measure.
+    :param runs: The number of interpreters to run for each wrapper.
+    :param jobs: The number of interpreters to run in parallel.  The CPU count if not
+        specified.
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        # Interleave the wrappers so they see similar system load.
+        futures = [
+            (wrapper, executor.submit(run_once, wrapper))
+            for _ in range(runs)
+            for wrapper in wrappers
+        ]
+
+    return [
+        Summary(
+            wrapper_name=wrapper.name,
+            runs=tuple(
+                future.result()
+                for future_wrapper, future in futures
+                if future_wrapper == wrapper
+            ),
+        )
+        for wrapper in wrappers
+    ]
+
+
+def main(runs: int = 20) -> None:
+    summaries = measure(wrappers=qts.available_wrappers(), runs=runs)
+
+    for summary in summaries:
+        print(summary.to_dict())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compare enum lookups through :func:`qts.util.enums` with the ad hoc ``getattr``
+fallbacks used to support both flat Qt5 and scoped Qt6 enums.  The integer conversions
+are compared with the equally common ``getattr(value, "value", value)`` idiom.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.enums
+"""
+
+import timeit
+
+import qts.util
+from qts import QtCore
+
+
+def main(number: int = 1_000_000) -> None:
+    Qt = qts.util.enums(QtCore.Qt)
+    member = Qt.AlignLeft
+    flags = Qt.AlignLeft | Qt.AlignTop
+    enum_type = type(member)
+
+    statements = {
+        "getattr fallback": lambda: (
+            getattr(QtCore.Qt, "AlignLeft", None) or QtCore.Qt.AlignmentFlag.AlignLeft
+        ),
+        "scoped attribute": lambda: QtCore.Qt.AlignmentFlag.AlignLeft,
+        "enums(Qt).AlignLeft": lambda: qts.util.enums(QtCore.Qt).AlignLeft,
+        "Qt.AlignLeft table": lambda: Qt.AlignLeft,
+        "int(getattr .value)": lambda: int(getattr(flags, "value", flags)),
+        "enum_to_int": lambda: qts.util.enum_to_int(flags),
+        "type(value)": lambda: enum_type(1),
+        "int_to_enum": lambda: qts.util.int_to_enum(enum_type, 1),
+    }
+
+    print(f"{qts.wrapper}, best of 5 x {number} calls")
+    for name, statement in statements.items():
+        seconds = min(timeit.repeat(statement, number=number, repeat=5))
+        print(f"{name:<24}{seconds / number * 1e9:>10.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
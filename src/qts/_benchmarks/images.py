@@ -0,0 +1,42 @@
+"""Compare the zero copy NumPy and :class:`QtGui.QImage` helpers in :mod:`qts.util`
+with copying conversions for 4K RGBA frames.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.images
+"""
+
+import timeit
+
+import numpy
+
+import qts.util
+from qts import QtGui
+
+
+def main(width: int = 3840, height: int = 2160, number: int = 100) -> None:
+    frame = numpy.random.default_rng(0).integers(
+        0, 255, size=(height, width, 4), dtype=numpy.uint8
+    )
+    image = qts.util.array_to_qimage(frame)
+    frame_bytes = frame.nbytes
+
+    statements = {
+        "array_to_qimage": lambda: qts.util.array_to_qimage(frame),
+        "array_to_qimage + copy": lambda: qts.util.array_to_qimage(frame).copy(),
+        "qimage_to_array": lambda: qts.util.qimage_to_array(image),
+        "qimage_to_array + copy": lambda: qts.util.qimage_to_array(image).copy(),
+    }
+
+    print(
+        f"{qts.wrapper}, {width}x{height} RGBA ({frame_bytes / 2**20:.1f} MiB),"
+        f" best of 5 x {number} calls"
+    )
+    for name, statement in statements.items():
+        seconds = min(timeit.repeat(statement, number=number, repeat=5)) / number
+        throughput = frame_bytes / seconds / 2**30
+        print(f"{name:<26}{seconds * 1e6:>12.1f} us{throughput:>12.1f} GiB/s")
+
+
+if __name__ == "__main__":
+    main()
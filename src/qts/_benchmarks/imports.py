@@ -0,0 +1,111 @@
+"""Compare the lazily resolved qts Qt modules with the star imports they replaced.
+
+Each measurement runs in a fresh interpreter with the wrapper's own modules already
+imported so that only the work done by qts is timed.  All modules are imported in
+each interpreter since that is the common application case and shared setup, such as
+importing :mod:`qts._lazy`, is only paid once.  The eager variant is written
+out as a module file so that both variants pay for going through the import system.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.imports
+"""
+
+import os
+import pathlib
+import statistics
+import tempfile
+import typing
+
+import qts
+import qts._benchmarks._harness
+
+
+module_names = ["QtCore", "QtGui", "QtWidgets"]
+
+eager_module_template = """
+import qts
+
+from {module_name}.{name} import *
+"""
+
+measure_template = """
+import importlib
+import json
+import sys
+import time
+
+import qts
+
+qts.autoset_wrapper()
+for name in {names!r}:
+    importlib.import_module(f"{module_name}.{{name}}")
+
+start = time.perf_counter()
+modules = [importlib.import_module(name) for name in {import_names!r}]
+end = time.perf_counter()
+
+names = [len(vars(module)) for module in modules]
+json.dump({{"seconds": end - start, "names": names}}, sys.stdout)
+"""
+
+
+def run(
+    import_names: typing.List[str],
+    wrapper: qts.Wrapper,
+    env: typing.Dict[str, str],
+) -> typing.Dict[str, typing.Any]:
+    script = measure_template.format(
+        module_name=wrapper.module_name,
+        names=module_names,
+        import_names=import_names,
+    )
+    return qts._benchmarks._harness.run_script(script=script, env=env)
+
+
+def measure(
+    import_names: typing.List[str],
+    wrapper: qts.Wrapper,
+    env: typing.Dict[str, str],
+    runs: int,
+) -> typing.Tuple[float, typing.List[int]]:
+    results = [
+        run(import_names=import_names, wrapper=wrapper, env=env) for _ in range(runs)
+    ]
+    seconds = statistics.median(result["seconds"] for result in results)
+    names: typing.List[int] = results[0]["names"]
+    return seconds, names
+
+
+def main(runs: int = 20) -> None:
+    wrapper = qts.an_available_wrapper()
+    print(f"{wrapper.name}, median of {runs} fresh interpreters")
+    print(f"{'mode':<8}{'time (us)':>12}", *(f"{name:>12}" for name in module_names))
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in module_names:
+            path = pathlib.Path(directory, f"qts_eager_{name}.py")
+            path.write_text(
+                eager_module_template.format(
+                    module_name=wrapper.module_name, name=name
+                ),
+                encoding="utf-8",
+            )
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [directory, *filter(None, [env.get("PYTHONPATH")])]
+        )
+
+        for mode, prefix in [("eager", "qts_eager_"), ("lazy", "qts.")]:
+            seconds, names = measure(
+                import_names=[f"{prefix}{name}" for name in module_names],
+                wrapper=wrapper,
+                env=env,
+                runs=runs,
+            )
+            print(f"{mode:<8}{seconds * 1e6:>12.1f}", *(f"{n:>12}" for n in names))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Compare opening a large log file with :class:`qts.models.MappedFileModel` and with
+reading all of its lines into a list.
+
+Each approach runs in a fresh interpreter so the peak resident set sizes are
+comparable.  The reported times are until the first rows can be shown, until the
+whole file is indexed, and for reading 1000 random rows afterwards.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.mapped_file
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import typing
+
+import qts._benchmarks._harness
+
+
+child_script = """
+import json
+import sys
+
+import qts._benchmarks.mapped_file
+
+json.dump(qts._benchmarks.mapped_file.{function}({path!r}), sys.stdout)
+"""
+
+
+def peak_rss() -> typing.Optional[int]:
+    """Get the peak resident set size of this process in bytes, where available."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kibibytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def write_log(path: str, size: int) -> int:
+    """Write a log file of roughly the passed size in bytes.
+
+    :returns: The number of lines written.
+    """
+    line_count = 0
+    written = 0
+    with open(path, "w", encoding="utf-8") as file:
+        while written < size:
+            lines = [
+                f"2024-01-01T00:00:{number % 60:02d} INFO worker-{number % 16}"
+                f" processed request {number} in {number % 997} ms\n"
+                for number in range(line_count, line_count + 10_000)
+            ]
+            chunk = "".join(lines)
+            file.write(chunk)
+            written += len(chunk)
+            line_count += len(lines)
+
+    return line_count
+
+
+def read_random_rows(model: typing.Any, count: int = 1000) -> float:
+    from qts import QtCore
+
+    rows = random.Random(0).sample(
+        range(model.rowCount()), min(count, model.rowCount())
+    )
+    start = time.perf_counter()
+    for row in rows:
+        model.data(model.index(row, 0), QtCore.Qt.ItemDataRole.DisplayRole)
+
+    return time.perf_counter() - start
+
+
+def measure_mapped(path: str) -> typing.Dict[str, typing.Any]:
+    import qts.models
+    import qts.util
+    from qts import QtCore
+
+    application = QtCore.QCoreApplication([])
+
+    start = time.perf_counter()
+    model = qts.models.MappedFileModel(path)
+    loop = QtCore.QEventLoop()
+    model.indexing_progressed.connect(loop.quit)
+    qts.util.exec(loop)
+    first_rows = time.perf_counter() - start
+
+    model.wait()
+    indexed = time.perf_counter() - start
+    while model.canFetchMore():
+        model.fetchMore()
+
+    result = {
+        "first_rows": first_rows,
+        "indexed": indexed,
+        "random_rows": read_random_rows(model=model),
+        "rows": model.rowCount(),
+        "peak_rss": peak_rss(),
+    }
+    model.close()
+    del application
+
+    return result
+
+
+def measure_list(path: str) -> typing.Dict[str, typing.Any]:
+    from qts import QtCore
+
+    application = QtCore.QCoreApplication([])
+
+    start = time.perf_counter()
+    with open(path, encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    model = QtCore.QStringListModel(lines)
+    seconds = time.perf_counter() - start
+
+    result = {
+        "first_rows": seconds,
+        "indexed": seconds,
+        "random_rows": read_random_rows(model=model),
+        "rows": model.rowCount(),
+        "peak_rss": peak_rss(),
+    }
+    del application
+
+    return result
+
+
+def main(size: int = 512 * 2**20) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "large.log")
+        line_count = write_log(path=path, size=size)
+
+        results = {
+            "MappedFileModel": qts._benchmarks._harness.run_script(
+                script=child_script.format(function="measure_mapped", path=path)
+            ),
+            "list of lines": qts._benchmarks._harness.run_script(
+                script=child_script.format(function="measure_list", path=path)
+            ),
+        }
+
+    print(f"{size / 2**20:.0f} MiB, {line_count:,} lines")
+    print(f"{'':<18}{'first rows':>12}{'indexed':>12}{'1000 rows':>12}{'peak RSS':>12}")
+    for name, result in results.items():
+        peak = result["peak_rss"]
+        print(
+            f"{name:<18}{result['first_rows']:>10.3f} s{result['indexed']:>10.3f} s"
+            f"{result['random_rows'] * 1e3:>9.1f} ms"
+            + (f"{peak / 2**20:>8.0f} MiB" if peak is not None else f"{'n/a':>12}")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Scroll an offscreen :class:`QtWidgets.QTableView` through a 10 million row table
+backed by :class:`qts.models.ArrayTableModel` and by a model formatting each cell
+with :class:`str` on request.
+
+Each step moves the vertical scroll bar a page down, jumps it to a random position,
+or leaves it in place, as for hover and selection updates, and renders the viewport.
+Drawing the text costs the same for both models and the view requests several roles
+per cell, so the difference is limited to formatting the displayed values.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.models
+"""
+
+import os
+import time
+import typing
+
+import numpy
+
+import qts.models
+import qts.util
+from qts import QtCore
+
+
+_display_role = qts.util.enum_to_int(QtCore.Qt.ItemDataRole.DisplayRole)
+
+
+class NaiveTableModel(QtCore.QAbstractTableModel):
+    """Formats the value for each requested cell individually."""
+
+    def __init__(self, columns: typing.Mapping[str, numpy.ndarray]) -> None:
+        super().__init__()
+        self.names = list(columns)
+        self.arrays = list(columns.values())
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.arrays[0])
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.arrays)
+
+    def data(self, index: QtCore.QModelIndex, role: int = _display_role) -> typing.Any:
+        if role == _display_role:
+            return str(self.arrays[index.column()][index.row()])
+
+        return None
+
+
+def make_columns(rows: int) -> typing.Dict[str, numpy.ndarray]:
+    generator = numpy.random.default_rng(0)
+
+    return {
+        "index": numpy.arange(rows, dtype=numpy.int64),
+        "value": generator.standard_normal(rows),
+        "count": generator.integers(0, 1_000_000, size=rows, dtype=numpy.int32),
+        "ratio": generator.random(rows, dtype=numpy.float32),
+    }
+
+
+modes = ["page", "jump", "repaint"]
+"""Scrolling a page down, jumping to a random position, and staying in place."""
+
+
+def scroll(
+    model: QtCore.QAbstractItemModel,
+    steps: int,
+    mode: str,
+    seed: int = 0,
+) -> float:
+    """Scroll in one of the :data:`modes`, rendering the view after each step.
+
+    :returns: The median seconds per step.
+    """
+    from qts import QtWidgets
+
+    view = QtWidgets.QTableView()
+    view.resize(1280, 1024)
+    header = view.verticalHeader()
+    assert header is not None
+    # Fixed heights keep the view from measuring rows it does not show.
+    header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+    header.setDefaultSectionSize(20)
+    view.setModel(model)
+    view.show()
+
+    scroll_bar = view.verticalScrollBar()
+    viewport = view.viewport()
+    assert scroll_bar is not None and viewport is not None
+
+    if mode == "page":
+        positions = numpy.arange(1, steps + 1) * scroll_bar.pageStep()
+    elif mode == "jump":
+        positions = numpy.random.default_rng(seed).integers(
+            0, scroll_bar.maximum(), size=steps
+        )
+    else:
+        positions = numpy.zeros(steps, dtype=numpy.int64)
+    viewport.grab()
+
+    durations = []
+    for position in positions.tolist():
+        start = time.perf_counter()
+        scroll_bar.setValue(position)
+        viewport.grab()
+        durations.append(time.perf_counter() - start)
+
+    view.close()
+    view.deleteLater()
+
+    return float(numpy.median(durations))
+
+
+def main(rows: int = 10_000_000, steps: int = 200) -> None:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from qts import QtWidgets
+
+    application = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    columns = make_columns(rows=rows)
+    models: typing.Dict[str, typing.Callable[[], QtCore.QAbstractItemModel]] = {
+        "ArrayTableModel": lambda: qts.models.ArrayTableModel(columns=columns),
+        "str() per cell": lambda: NaiveTableModel(columns=columns),
+    }
+
+    print(f"{qts.wrapper}, {rows:,} rows, {steps} steps, ms per step")
+    print(f"{'':<20}", *(f"{mode:>10}" for mode in modes))
+    for name, make_model in models.items():
+        seconds = [scroll(model=make_model(), steps=steps, mode=mode) for mode in modes]
+        print(f"{name:<20}", *(f"{value * 1e3:>10.2f}" for value in seconds))
+
+    del application
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Compare mypy wall time on a small sample project using qts with no wrapper
+conditions, with ``qts mypy args``, and with :mod:`qts.mypy_plugin`.
+
+Every run starts with an empty mypy cache.  Without any conditions mypy analyzes the
+import chains for every wrapper, including the stubs of each installed wrapper.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.mypy_plugin
+"""
+
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+
+import qts
+import qts._mypy
+
+
+sample_modules = {
+    "sample/__init__.py": "",
+    "sample/core.py": """
+from qts import QtCore
+
+
+class Counter(QtCore.QObject):
+    changed = QtCore.Signal(int)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def increment(self) -> None:
+        self.count += 1
+        self.changed.emit(self.count)
+""",
+    "sample/gui.py": """
+from qts import QtGui, QtWidgets
+
+import sample.core
+
+
+class Window(QtWidgets.QWidget):
+    def __init__(self, counter: sample.core.Counter) -> None:
+        super().__init__()
+        self.label = QtWidgets.QLabel(self)
+        self.label.setFont(QtGui.QFont())
+        counter.changed.connect(self.show_count)
+
+    def show_count(self, count: int) -> None:
+        self.label.setText(str(count))
+""",
+}
+
+config_templates = {
+    "none": "[mypy]\n",
+    "args": "[mypy]\n",
+    "plugin": "[mypy]\nplugins = qts.mypy_plugin\n\n[qts-mypy]\nwrapper = {name}\n",
+}
+
+
+def run_mypy(
+    directory: pathlib.Path,
+    mode: str,
+    wrapper: qts.Wrapper,
+) -> float:
+    config_path = directory.joinpath(f"{mode}.ini")
+    config_path.write_text(
+        config_templates[mode].format(name=wrapper.name), encoding="utf-8"
+    )
+
+    with tempfile.TemporaryDirectory() as cache_directory:
+        args = [
+            sys.executable,
+            "-m",
+            "mypy",
+            "--config-file",
+            os.fspath(config_path),
+            "--cache-dir",
+            cache_directory,
+            "--package",
+            "sample",
+        ]
+        if mode == "args":
+            args.extend(qts._mypy.mypy_arguments(wrapper=wrapper))
+
+        env = {**os.environ}
+        env.pop("QTS_WRAPPER", None)
+
+        start = time.perf_counter()
+        # Errors are expected without conditions when not all wrappers are installed.
+        subprocess.run(
+            args,
+            cwd=directory,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return time.perf_counter() - start
+
+
+def main(runs: int = 5) -> None:
+    wrapper = qts.an_available_wrapper()
+    print(f"{wrapper.name}, median of {runs} cold mypy runs")
+
+    with tempfile.TemporaryDirectory() as directory_name:
+        directory = pathlib.Path(directory_name)
+        for relative_path, content in sample_modules.items():
+            path = directory.joinpath(relative_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+
+        results: typing.Dict[str, float] = {}
+        for mode in config_templates:
+            results[mode] = statistics.median(
+                run_mypy(directory=directory, mode=mode, wrapper=wrapper)
+                for _ in range(runs)
+            )
+            print(f"{mode:<8}{results[mode]:>10.2f} s")
+
+
+if __name__ == "__main__":
+    main()
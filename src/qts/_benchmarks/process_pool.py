@@ -0,0 +1,105 @@
+"""Compare running CPU bound calls with :class:`qts.util.ThreadPoolExecutor` and with
+:class:`qts.util.ProcessPoolExecutor`, with done callbacks delivered to the GUI
+thread in both cases.
+
+Reported are the throughput until every done callback has run and the longest the
+GUI thread went without handling a timer tick meanwhile.  Threads are limited by the
+GIL so processes only pull ahead with several processors.  Worker processes are
+started before timing.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.process_pool
+"""
+
+import concurrent.futures
+import os
+import time
+import typing
+
+import qts.util
+from qts import QtCore
+
+
+def spin(iterations: int) -> int:
+    """Burn CPU in pure Python while holding the GIL."""
+    total = 0
+    for value in range(iterations):
+        total += value * value
+    return total
+
+
+def run(
+    executor: concurrent.futures.Executor, tasks: int, iterations: int
+) -> typing.Dict[str, float]:
+    loop = QtCore.QEventLoop()
+    done = 0
+
+    def count(future: "concurrent.futures.Future[int]") -> None:
+        nonlocal done
+        done += 1
+        if done == tasks:
+            loop.quit()
+
+    # Measures how responsive the GUI thread stays.
+    ticks: typing.List[float] = []
+    timer = QtCore.QTimer()
+    timer.setInterval(1)
+    timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    timer.start()
+
+    start = time.perf_counter()
+    for _ in range(tasks):
+        executor.submit(spin, iterations).add_done_callback(count)
+    qts.util.exec(loop)
+    seconds = time.perf_counter() - start
+    timer.stop()
+
+    gaps = [later - earlier for earlier, later in zip(ticks, ticks[1:])]
+
+    return {
+        "throughput": tasks / seconds,
+        "seconds": seconds,
+        "max_tick_gap": max(gaps, default=seconds),
+    }
+
+
+def main(
+    tasks: int = 200,
+    iterations: int = 200_000,
+    workers: typing.Optional[int] = None,
+) -> None:
+    application = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    print(
+        f"{qts.wrapper}, {tasks:,} tasks of {iterations:,} iterations,"
+        f" {workers} workers"
+    )
+    print(f"{'':<10}{'tasks/s':>10}{'total':>10}{'max gap':>10}")
+
+    executors: typing.Dict[str, typing.Callable[[], concurrent.futures.Executor]] = {
+        "threads": lambda: qts.util.ThreadPoolExecutor(max_workers=workers),
+        "processes": lambda: qts.util.ProcessPoolExecutor(max_workers=workers),
+    }
+    for name, create in executors.items():
+        executor = create()
+        # Start the workers.
+        list(executor.map(abs, range(workers)))
+
+        result = run(executor=executor, tasks=tasks, iterations=iterations)
+        executor.shutdown()
+
+        print(
+            f"{name:<10}{result['throughput']:>10,.1f}"
+            f"{result['seconds']:>8.2f} s"
+            f"{result['max_tick_gap'] * 1e3:>7.1f} ms"
+        )
+
+    del application
+
+
+if __name__ == "__main__":
+    main()
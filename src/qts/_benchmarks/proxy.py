@@ -0,0 +1,126 @@
+"""Compare sorting and filtering an :class:`qts.models.ArrayTableModel` with
+:class:`qts.models.ArraySortFilterProxyModel` and with a
+:class:`QtCore.QSortFilterProxyModel` subclass implementing ``lessThan()`` and
+``filterAcceptsRow()`` in Python.
+
+The Python callbacks run once per comparison and per row so the default table is
+smaller than the ones the NumPy proxy is meant for.  Pass ``rows`` to change it.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.proxy
+"""
+
+import time
+import typing
+
+import numpy
+
+import qts.models
+from qts import QtCore
+
+
+class CallbackProxyModel(QtCore.QSortFilterProxyModel):
+    """Sorts and filters with Python callbacks reading the source arrays."""
+
+    def __init__(self, model: "qts.models.ArrayTableModel") -> None:
+        super().__init__()
+        self.model = model
+        self.accept_all = True
+
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool:
+        array = self.model.column_array(left.column())
+        return bool(array[left.row()] < array[right.row()])
+
+    def filterAcceptsRow(
+        self, source_row: int, source_parent: QtCore.QModelIndex
+    ) -> bool:
+        return self.accept_all or bool(self.model.column_array(0)[source_row] > 0)
+
+
+def timed(function: typing.Callable[[], object]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def measure(
+    proxy: QtCore.QAbstractItemModel,
+    set_filter: typing.Callable[[bool], None],
+    model: "qts.models.ArrayTableModel",
+    append_rows: int,
+) -> typing.Dict[str, float]:
+    results = {
+        "sort": timed(lambda: proxy.sort(0)),
+        "sort descending": timed(
+            lambda: proxy.sort(0, QtCore.Qt.SortOrder.DescendingOrder)
+        ),
+        "filter": timed(lambda: set_filter(True)),
+    }
+
+    generator = numpy.random.default_rng(1)
+    results["append sorted"] = timed(
+        lambda: model.append_rows(
+            columns={
+                "value": generator.standard_normal(append_rows),
+                "count": generator.integers(0, 1000, size=append_rows),
+            }
+        )
+    )
+
+    return results
+
+
+def main(rows: int = 100_000, append_rows: int = 1_000) -> None:
+    application = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    def make_model() -> "qts.models.ArrayTableModel":
+        generator = numpy.random.default_rng(0)
+        return qts.models.ArrayTableModel(
+            columns={
+                "value": generator.standard_normal(rows),
+                "count": generator.integers(0, 1000, size=rows),
+            }
+        )
+
+    array_model = make_model()
+    array_proxy = qts.models.ArraySortFilterProxyModel()
+    array_proxy.setSourceModel(array_model)
+
+    def set_array_filter(enabled: bool) -> None:
+        array_proxy.set_filter((lambda columns: columns[0] > 0) if enabled else None)
+
+    callback_model = make_model()
+    callback_proxy = CallbackProxyModel(model=callback_model)
+    callback_proxy.setSourceModel(callback_model)
+
+    def set_callback_filter(enabled: bool) -> None:
+        callback_proxy.accept_all = not enabled
+        callback_proxy.invalidateFilter()
+
+    results = {
+        "NumPy proxy": measure(
+            proxy=array_proxy,
+            set_filter=set_array_filter,
+            model=array_model,
+            append_rows=append_rows,
+        ),
+        "Python callbacks": measure(
+            proxy=callback_proxy,
+            set_filter=set_callback_filter,
+            model=callback_model,
+            append_rows=append_rows,
+        ),
+    }
+
+    print(f"{qts.wrapper}, {rows:,} rows, appending {append_rows:,}, ms")
+    names = list(next(iter(results.values())))
+    print(f"{'':<20}", *(f"{name:>16}" for name in names))
+    for proxy_name, values in results.items():
+        print(f"{proxy_name:<20}", *(f"{values[name] * 1e3:>16.1f}" for name in names))
+
+    del application
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""Compare the runtime cost of the hot paths that qts normalizes across wrappers.
+
+Each wrapper is measured in its own fresh interpreter using the offscreen platform so
+no display is needed.  The results for each wrapper are written as JSON files with
+matching keys so they can be compared directly or tracked over time.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.runtime
+    $ qts bench runtime --output results/
+"""
+
+import contextlib
+import os
+import sys
+import timeit
+import typing
+
+import qts
+import qts._benchmarks._harness
+
+
+child_script = """
+import json
+import sys
+
+import qts._benchmarks.runtime
+
+json.dump(qts._benchmarks.runtime.run_all(scale={scale!r}), sys.stdout)
+"""
+
+Benchmark = typing.Callable[[int, contextlib.ExitStack], typing.Callable[[], None]]
+"""Takes the operation count and an exit stack for any cleanup.  Returns a function
+doing that many operations."""
+
+
+def best_seconds_per_operation(
+    benchmark: Benchmark,
+    number: int,
+    repeat: int = 5,
+) -> float:
+    """Get the best time per operation from several repeats of a benchmark."""
+    with contextlib.ExitStack() as stack:
+        run = benchmark(number, stack)
+        seconds = min(timeit.repeat(run, number=1, repeat=repeat))
+
+    return seconds / number
+
+
+def signal_emit(number: int, stack: contextlib.ExitStack) -> typing.Callable[[], None]:
+    """Emit a signal with a single connected Python function."""
+    from qts import QtCore
+
+    class Emitter(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    emitter = Emitter()
+    emitter.signal.connect(lambda value: None)
+
+    def run() -> None:
+        emit = emitter.signal.emit
+        for value in range(number):
+            emit(value)
+
+    return run
+
+
+def signal_connect(
+    number: int, stack: contextlib.ExitStack
+) -> typing.Callable[[], None]:
+    """Connect and disconnect a Python function."""
+    from qts import QtCore
+
+    class Emitter(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    emitter = Emitter()
+
+    def slot(value: int) -> None:
+        pass
+
+    def run() -> None:
+        signal = emitter.signal
+        send_posted_events = QtCore.QCoreApplication.sendPostedEvents
+        deferred_delete = QtCore.QEvent.Type.DeferredDelete
+        for _ in range(number):
+            signal.connect(slot)
+            signal.disconnect(slot)
+            # Include the deletion of any connection helper the wrapper created.
+            send_posted_events(None, deferred_delete)
+
+    return run
+
+
+def signal_dispatch(
+    number: int, stack: contextlib.ExitStack, slot_count: int = 10
+) -> typing.Callable[[], None]:
+    """Emit a signal through a :class:`qts.QtCore.SignalInstance` with several bound
+    method slots connected.  The time is per emission.
+    """
+    from qts import QtCore
+
+    class Emitter(QtCore.QObject):
+        signal = QtCore.Signal(int)
+
+    class Receiver:
+        def __init__(self) -> None:
+            self.total = 0
+
+        def slot(self, value: int) -> None:
+            self.total += value
+
+    emitter = Emitter()
+    receivers = [Receiver() for _ in range(slot_count)]
+    for receiver in receivers:
+        emitter.signal.connect(receiver.slot)
+
+    def run() -> None:
+        # Both must be referenced here so they outlive the signal instance and the
+        # bound method connections.
+        signal_instance: QtCore.SignalInstance = emitter.signal
+        emit = signal_instance.emit
+        for value in range(number):
+            emit(value)
+
+        assert all(receiver.total > 0 for receiver in receivers)
+
+    return run
+
+
+def object_lifecycle(
+    number: int, stack: contextlib.ExitStack
+) -> typing.Callable[[], None]:
+    """Construct and destroy a parentless :class:`qts.QtCore.QObject`."""
+    from qts import QtCore
+
+    def run() -> None:
+        for _ in range(number):
+            QtCore.QObject()
+
+    return run
+
+
+def exec_round_trip(
+    number: int, stack: contextlib.ExitStack
+) -> typing.Callable[[], None]:
+    """Enter an event loop with :func:`qts.util.exec` and leave it again from a zero
+    timeout timer.
+    """
+    import qts.util
+    from qts import QtCore
+
+    loop = QtCore.QEventLoop()
+    timer = QtCore.QTimer()
+    timer.setSingleShot(True)
+    timer.setInterval(0)
+    timer.timeout.connect(loop.quit)
+
+    def run() -> None:
+        for _ in range(number):
+            timer.start()
+            qts.util.exec(loop)
+
+    return run
+
+
+def queued_cross_thread(
+    number: int, stack: contextlib.ExitStack
+) -> typing.Callable[[], None]:
+    """Emit signals from a worker :class:`qts.QtCore.QThread` that are queued to a
+    Python slot in the main thread.  The time is per signal and includes running the
+    main thread event loop to deliver them.
+    """
+    import qts.util
+    from qts import QtCore
+
+    class Emitter(QtCore.QObject):
+        signal = QtCore.Signal(int)
+        start = QtCore.Signal()
+
+        def emit_all(self) -> None:
+            emit = self.signal.emit
+            for value in range(number):
+                emit(value)
+
+    class Receiver(QtCore.QObject):
+        def __init__(self, loop: QtCore.QEventLoop) -> None:
+            super().__init__()
+            self.loop = loop
+            self.received = 0
+
+        def slot(self, value: int) -> None:
+            self.received += 1
+            if self.received == number:
+                self.loop.quit()
+
+    thread = QtCore.QThread()
+    emitter = Emitter()
+    emitter.moveToThread(thread)
+    emitter.start.connect(emitter.emit_all)
+    thread.start()
+    stack.callback(thread.wait)
+    stack.callback(thread.quit)
+
+    loop = QtCore.QEventLoop()
+    receiver = Receiver(loop=loop)
+    emitter.signal.connect(receiver.slot)
+
+    def run() -> None:
+        receiver.received = 0
+        emitter.start.emit()
+        qts.util.exec(loop)
+
+    return run
+
+
+benchmarks: typing.Dict[str, typing.Tuple[Benchmark, int]] = {
+    "signal_emit": (signal_emit, 100_000),
+    "signal_connect": (signal_connect, 10_000),
+    "signal_dispatch": (signal_dispatch, 10_000),
+    "object_lifecycle": (object_lifecycle, 100_000),
+    "exec_round_trip": (exec_round_trip, 1_000),
+    "queued_cross_thread": (queued_cross_thread, 10_000),
+}
+"""The benchmarks by name along with the operation count for a scale of 1."""
+
+
+def run_all(scale: float = 1) -> typing.Dict[str, object]:
+    """Run all benchmarks with the wrapper selected in this interpreter.
+
+    :param scale: Multiplies the operation count of each benchmark.
+    """
+    from qts import QtCore
+
+    # Keep a reference so the application lives through the benchmarks.
+    application = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    results: typing.Dict[str, float] = {}
+    for name, (benchmark, number) in benchmarks.items():
+        results[name] = best_seconds_per_operation(
+            benchmark=benchmark,
+            number=max(1, int(number * scale)),
+        )
+        # Some wrappers delete connection helpers with deleteLater().  Pending
+        # deferred deletes are rescanned by every nested event loop so they must not
+        # leak into the following benchmarks.
+        QtCore.QCoreApplication.sendPostedEvents(
+            None, QtCore.QEvent.Type.DeferredDelete
+        )
+
+    wrapper = qts.wrapper
+    assert wrapper is not None
+
+    return {
+        "wrapper": wrapper.name,
+        "qt_version": QtCore.qVersion(),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "qpa_platform": os.environ.get("QT_QPA_PLATFORM"),
+        "seconds_per_operation": results,
+    }
+
+
+def run_wrapper(wrapper: qts.Wrapper, scale: float = 1) -> typing.Dict[str, object]:
+    """Run all benchmarks in a fresh offscreen interpreter using the passed wrapper."""
+    env = {**os.environ, "QTS_WRAPPER": wrapper.name, "QT_QPA_PLATFORM": "offscreen"}
+    return qts._benchmarks._harness.run_script(
+        script=child_script.format(scale=scale),
+        env=env,
+    )
+
+
+def write_results(results: typing.Dict[str, object], directory: str) -> str:
+    """Write the results for a wrapper as JSON to the passed directory.
+
+    :returns: The path of the written file.
+    """
+    import json
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"runtime-{results['wrapper']}.json")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=4)
+        file.write("\n")
+
+    return path
+
+
+def main(scale: float = 1, directory: typing.Optional[str] = None) -> None:
+    all_results = [
+        run_wrapper(wrapper=wrapper, scale=scale)
+        for wrapper in qts.available_wrappers()
+    ]
+
+    names = list(benchmarks)
+    print(f"{'ns per operation':<20}", *(f"{r['wrapper']:>12}" for r in all_results))
+    for name in names:
+        values = [
+            typing.cast(typing.Dict[str, float], r["seconds_per_operation"])[name]
+            for r in all_results
+        ]
+        print(f"{name:<20}", *(f"{value * 1e9:>12.1f}" for value in values))
+
+    if directory is not None:
+        for results in all_results:
+            print(f"Wrote {write_results(results=results, directory=directory)}")
+
+
+if __name__ == "__main__":
+    main()
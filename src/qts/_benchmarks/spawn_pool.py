@@ -0,0 +1,91 @@
+"""Compare starting a pool of ``spawn`` worker processes that each import
+``qts.QtCore`` with the parent's wrapper passed on by :func:`qts.inherit_wrapper`
+and without so each worker discovers a wrapper itself.
+
+Reported are the wall time until every worker has imported ``qts.QtCore`` and the
+median and 95th percentile time workers spent selecting the wrapper and importing
+the module.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.spawn_pool
+"""
+
+import concurrent.futures
+import contextlib
+import multiprocessing
+import multiprocessing.queues
+import os
+import time
+import typing
+
+import qts
+from qts._benchmarks.coldstart import percentile
+
+
+def import_qtcore(reports: "multiprocessing.queues.SimpleQueue[typing.Any]") -> None:
+    start = time.perf_counter()
+    if qts.wrapper is None:
+        qts.autoset_wrapper()
+    selected = time.perf_counter()
+    from qts import QtCore
+
+    QtCore.QObject
+    imported = time.perf_counter()
+
+    assert qts.wrapper is not None
+    reports.put((qts.wrapper.name, selected - start, imported - selected))
+
+
+def run(workers: int, inherit: bool) -> typing.Dict[str, typing.Any]:
+    context = multiprocessing.get_context("spawn")
+    reports: "multiprocessing.queues.SimpleQueue[typing.Any]" = context.SimpleQueue()
+
+    # The pool starts workers on demand so they are all started within the context.
+    with qts.inherit_wrapper() if inherit else contextlib.nullcontext():
+        start = time.perf_counter()
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=import_qtcore,
+            initargs=(reports,),
+        )
+        # Each pending call lets the pool start another worker.
+        for _ in range(workers):
+            executor.submit(os.getpid)
+        results = [reports.get() for _ in range(workers)]
+        seconds = time.perf_counter() - start
+        executor.shutdown()
+
+    selections = [selection for _, selection, _ in results]
+    imports = [imported for _, _, imported in results]
+
+    return {
+        "seconds": seconds,
+        "wrappers": sorted({name for name, _, _ in results}),
+        "select_median": percentile(selections, 50),
+        "select_p95": percentile(selections, 95),
+        "import_median": percentile(imports, 50),
+    }
+
+
+def main(workers: int = 64) -> None:
+    os.environ.pop("QTS_WRAPPER", None)
+    if qts.wrapper is None:
+        qts.autoset_wrapper()
+
+    print(f"{qts.wrapper}, {workers} spawn workers")
+    print(f"{'':<12}{'total':>10}{'select':>10}{'p95':>10}{'import':>10}  wrappers")
+    for name, inherit in [("discovery", False), ("inherited", True)]:
+        result = run(workers=workers, inherit=inherit)
+        print(
+            f"{name:<12}{result['seconds']:>8.2f} s"
+            f"{result['select_median'] * 1e3:>7.2f} ms"
+            f"{result['select_p95'] * 1e3:>7.2f} ms"
+            f"{result['import_median'] * 1e3:>7.1f} ms"
+            f"  {', '.join(result['wrappers'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure the overhead of :class:`qts.diagnostics.StallMonitor` by comparing the
+rate at which the GUI thread handles a chain of posted calls with the monitor
+stopped, started with its default interval, and started with a short interval.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.stall_monitor
+"""
+
+import time
+import typing
+
+import qts.diagnostics
+import qts.util
+from qts import QtCore
+
+
+def run(
+    calls: int, monitor: typing.Optional["qts.diagnostics.StallMonitor"]
+) -> typing.Dict[str, float]:
+    loop = QtCore.QEventLoop()
+    remaining = calls
+
+    def step() -> None:
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            loop.quit()
+        else:
+            QtCore.QTimer.singleShot(0, step)
+
+    if monitor is not None:
+        monitor.start()
+
+    start = time.perf_counter()
+    QtCore.QTimer.singleShot(0, step)
+    qts.util.exec(loop)
+    seconds = time.perf_counter() - start
+
+    result = {"rate": calls / seconds, "heartbeats": 0.0, "p99": 0.0}
+    if monitor is not None:
+        monitor.stop()
+        report = monitor.report()
+        result["heartbeats"] = report.heartbeats
+        if report.heartbeats > 0:
+            result["p99"] = report.percentile(99)
+
+    return result
+
+
+def main(calls: int = 200_000) -> None:
+    application = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    print(f"{qts.wrapper}, {calls:,} chained calls")
+    print(f"{'':<16}{'calls/s':>12}{'overhead':>10}{'beats':>8}{'p99':>10}")
+
+    monitors: typing.Dict[str, typing.Optional[qts.diagnostics.StallMonitor]] = {
+        "off": None,
+        "interval 50 ms": qts.diagnostics.StallMonitor(interval=0.05),
+        "interval 1 ms": qts.diagnostics.StallMonitor(interval=0.001),
+    }
+    baseline: typing.Optional[float] = None
+    for name, monitor in monitors.items():
+        result = run(calls=calls, monitor=monitor)
+        if baseline is None:
+            baseline = result["rate"]
+
+        print(
+            f"{name:<16}{result['rate']:>12,.0f}"
+            f"{(1 - result['rate'] / baseline) * 100:>9.1f}%"
+            f"{result['heartbeats']:>8,.0f}"
+            f"{result['p99'] * 1e3:>7.1f} ms"
+        )
+
+    del application
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Show that Qt modules which are not used cost nothing at startup.
+
+qts provides any ``qts.QtXyz`` module through an import hook.  Nothing is imported
+from the wrapper until a module is requested and each requested module only loads
+the matching wrapper module.
+
+.. code-block:: console
+
+    $ python -m qts._benchmarks.startup
+"""
+
+import statistics
+import typing
+
+import qts
+import qts._benchmarks._harness
+
+
+qts_script = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import qts
+qts_seconds = time.perf_counter() - start
+
+import qts.QtCore
+core_modules = sorted(name for name in sys.modules if name.startswith("{module_name}."))
+
+start = time.perf_counter()
+from qts import {name}
+seconds = time.perf_counter() - start
+
+json.dump(
+    {{"qts": qts_seconds, "module": seconds, "core_modules": core_modules}},
+    sys.stdout,
+)
+"""
+
+direct_script = """
+import json
+import sys
+import time
+
+import qts.QtCore
+
+start = time.perf_counter()
+from {module_name} import {name}
+seconds = time.perf_counter() - start
+
+json.dump({{"module": seconds}}, sys.stdout)
+"""
+
+
+def median_seconds(
+    script: str, key: str, runs: int
+) -> typing.Tuple[float, typing.Dict[str, typing.Any]]:
+    results = [qts._benchmarks._harness.run_script(script=script) for _ in range(runs)]
+    return statistics.median(result[key] for result in results), results[0]
+
+
+def main(name: str = "QtNetwork", runs: int = 20) -> None:
+    wrapper = qts.an_available_wrapper()
+    module_name = wrapper.module_name
+    print(f"{wrapper.name}, median of {runs} fresh interpreters")
+
+    script = qts_script.format(module_name=module_name, name=name)
+    qts_seconds, result = median_seconds(script=script, key="qts", runs=runs)
+    print(f"import qts: {qts_seconds * 1e6:.1f} us")
+
+    core_modules = ", ".join(result["core_modules"])
+    print(f"{module_name} modules loaded by import qts.QtCore: {core_modules}")
+
+    seconds, _ = median_seconds(script=script, key="module", runs=runs)
+    print(f"from qts import {name}: {seconds * 1e6:.1f} us")
+
+    script = direct_script.format(module_name=module_name, name=name)
+    seconds, _ = median_seconds(script=script, key="module", runs=runs)
+    print(f"from {module_name} import {name}: {seconds * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
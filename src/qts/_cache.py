@@ -0,0 +1,196 @@
+import os
+import sys
+import typing
+
+
+environment_variable = "QTS_DISCOVERY_CACHE"
+"""Set to ``1`` to enable the persistent wrapper discovery cache."""
+directory_environment_variable = "QTS_CACHE_DIR"
+"""Set to override the directory used for the persistent cache."""
+
+_header = "# qts wrapper discovery cache v1"
+_file_prefix = "wrappers-"
+_file_suffix = ".txt"
+
+
+def enabled() -> bool:
+    """Check if the persistent wrapper discovery cache has been enabled through the
+    ``QTS_DISCOVERY_CACHE`` environment variable.
+    """
+    value = os.environ.get(environment_variable, "")
+    return value.strip().casefold() in {"1", "true", "yes", "on"}
+
+
+def directory() -> str:
+    """Get the user cache directory used for qts.  ``QTS_CACHE_DIR`` overrides the
+    platform specific default.
+    """
+    override = os.environ.get(directory_environment_variable)
+    if override:
+        return override
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(
+            os.path.join("~", "AppData", "Local")
+        )
+        return os.path.join(base, "qts", "Cache")
+    elif sys.platform == "darwin":
+        return os.path.expanduser(os.path.join("~", "Library", "Caches", "qts"))
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(
+        os.path.join("~", ".cache")
+    )
+    return os.path.join(base, "qts")
+
+
+def path() -> str:
+    """Get the cache file path for the present :data:`sys.path`.  Each distinct
+    :data:`sys.path`, such as from separate environments or scripts, gets its own
+    file so they do not repeatedly invalidate each other.
+    """
+    import zlib
+
+    checksum = zlib.crc32(os.fsencode("\n".join(sys.path)))
+    return os.path.join(directory(), f"{_file_prefix}{checksum:08x}{_file_suffix}")
+
+
+def fingerprint(
+    entries: typing.Optional[typing.Iterable[str]] = None,
+) -> typing.List[str]:
+    """Get a cheap fingerprint of the import environment.  It is made of each
+    :data:`sys.path` entry along with its modification time.  Installing or removing
+    a package changes the modification time of the directory it is installed into.
+
+    :param entries: The path entries to fingerprint.  :data:`sys.path` if not
+        specified.
+    """
+    if entries is None:
+        entries = sys.path
+
+    lines = []
+
+    for entry in entries:
+        try:
+            mtime = os.stat(entry or os.curdir).st_mtime_ns
+        except OSError:
+            mtime = -1
+
+        lines.append(f"path {mtime} {entry}")
+
+    return lines
+
+
+def is_current(fingerprint_lines: typing.Sequence[str]) -> bool:
+    """Check if the modification times in a stored fingerprint are still current."""
+    entries = [line.split(" ", 2)[2] for line in fingerprint_lines]
+    return fingerprint(entries=entries) == list(fingerprint_lines)
+
+
+def read(
+    file_path: str,
+) -> typing.Tuple[typing.List[str], typing.Dict[str, bool]]:
+    """Read a cache file.
+
+    :returns: The fingerprint lines and the installed state by module name.
+
+    :raises OSError: When the file can not be read.
+    :raises ValueError: When the file is not a valid cache file.
+    """
+    with open(file_path, encoding="utf-8") as file:
+        lines = file.read().splitlines()
+
+    if len(lines) == 0 or lines[0] != _header:
+        raise ValueError(f"Not a qts wrapper discovery cache: {file_path}")
+
+    fingerprint_lines = []
+    installed = {}
+
+    for line in lines[1:]:
+        kind, _, rest = line.partition(" ")
+
+        if kind == "path" and " " in rest:
+            fingerprint_lines.append(line)
+        elif kind == "wrapper":
+            module_name, _, state = rest.partition(" ")
+            installed[module_name] = state == "1"
+        elif kind != "executable":
+            raise ValueError(f"Unexpected line in {file_path}: {line!r}")
+
+    return fingerprint_lines, installed
+
+
+def load() -> typing.Dict[str, bool]:
+    """Load the installed state by module name for the present :data:`sys.path`.
+    Nothing is returned if the cache is missing, invalid, or was made with a different
+    fingerprint.
+    """
+    try:
+        fingerprint_lines, installed = read(file_path=path())
+    except (OSError, ValueError):
+        return {}
+
+    if fingerprint_lines != fingerprint():
+        return {}
+
+    return installed
+
+
+def store(installed: typing.Mapping[str, bool]) -> None:
+    """Store the installed state by module name for the present :data:`sys.path`.
+    Failures are ignored since the cache is only an optimization.
+    """
+    lines = [
+        _header,
+        f"executable {sys.executable}",
+        *fingerprint(),
+        *(
+            f"wrapper {module_name} {1 if state else 0}"
+            for module_name, state in installed.items()
+        ),
+    ]
+
+    file_path = path()
+    temporary_path = f"{file_path}.{os.getpid()}.tmp"
+
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        os.replace(temporary_path, file_path)
+    except OSError:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+
+
+def paths() -> typing.List[str]:
+    """Get the paths of all existing cache files."""
+    try:
+        names = os.listdir(directory())
+    except OSError:
+        return []
+
+    return sorted(
+        os.path.join(directory(), name)
+        for name in names
+        if name.startswith(_file_prefix) and name.endswith(_file_suffix)
+    )
+
+
+def clear() -> typing.List[str]:
+    """Remove all cache files.
+
+    :returns: The paths of the removed files.
+    """
+    removed = []
+
+    for file_path in paths():
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            continue
+
+        removed.append(file_path)
+
+    return removed
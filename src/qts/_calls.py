@@ -0,0 +1,134 @@
+import collections
+import sys
+import threading
+import time
+import typing
+
+import qts._events
+from qts import QtCore
+
+
+_drain_event_type = qts._events.registered_event_type("qts.util.CallQueue drain")
+
+
+class CallQueue(QtCore.QObject):
+    """Runs callables posted from any thread in the thread owning the queue, usually
+    the GUI thread.
+
+    Posted calls are appended to a :class:`collections.deque` and a single event is
+    posted to wake the owning thread, no matter how many calls are posted before it
+    is handled.  The owning thread then runs the calls in order until the queue is
+    empty or the time slice is used up, in which case it posts another event so
+    input and paint events can be handled in between.  Calls posted with a key
+    replace any not yet run call with the same key, so only the latest update for
+    the key runs, at the position of the first.
+
+    Exceptions raised by a call are passed to :func:`sys.excepthook` and the
+    remaining calls still run.
+
+    :param time_slice: The seconds to spend running calls per event.
+    :param parent: The parent object.
+    """
+
+    def __init__(
+        self,
+        time_slice: float = 0.01,
+        parent: typing.Optional[QtCore.QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+
+        self.time_slice = time_slice
+
+        self.executed = 0
+        """The number of calls run."""
+        self.coalesced = 0
+        """The number of keyed calls replaced before they ran."""
+
+        self._calls: typing.Deque[
+            typing.Tuple[typing.Optional[typing.Callable[..., object]], typing.Any]
+        ] = collections.deque()
+        self._keyed: typing.Dict[
+            typing.Hashable,
+            typing.Tuple[typing.Callable[..., object], typing.Tuple[object, ...]],
+        ] = {}
+        self._keyed_lock = threading.Lock()
+        self._posted = False
+
+    def post(
+        self,
+        function: typing.Callable[..., object],
+        *args: object,
+        key: typing.Optional[typing.Hashable] = None,
+    ) -> None:
+        """Run ``function(*args)`` in the thread owning the queue.  Can be called
+        from any thread.
+
+        :param key: Replace any call posted with the same key that has not run yet.
+        """
+        if key is None:
+            self._calls.append((function, args))
+        else:
+            with self._keyed_lock:
+                if key in self._keyed:
+                    self.coalesced += 1
+                    self._keyed[key] = (function, args)
+                    return
+
+                self._keyed[key] = (function, args)
+                self._calls.append((None, key))
+
+        if not self._posted:
+            self._posted = True
+            QtCore.QCoreApplication.postEvent(self, QtCore.QEvent(_drain_event_type))
+
+    def pending(self) -> int:
+        """Get the number of calls that have not run yet."""
+        return len(self._calls)
+
+    def drain(self, time_limit: typing.Optional[float] = None) -> bool:
+        """Run posted calls in the calling thread until the queue is empty or the time
+        limit is reached.  This is done automatically in the owning thread.
+
+        :param time_limit: The seconds after which to stop, or :data:`None` to run
+            until the queue is empty.
+        :returns: If the queue was emptied.
+        """
+        # Cleared first so a call posted after the loop below empties the queue posts
+        # another event.
+        self._posted = False
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        calls = self._calls
+        popleft = calls.popleft
+        perf_counter = time.perf_counter
+
+        while calls:
+            function, args = popleft()
+
+            if function is None:
+                with self._keyed_lock:
+                    function, args = self._keyed.pop(args)
+
+            try:
+                function(*args)
+            except Exception as error:
+                sys.excepthook(type(error), error, error.__traceback__)
+            self.executed += 1
+
+            if deadline is not None and perf_counter() >= deadline:
+                break
+
+        if not calls:
+            return True
+
+        if not self._posted:
+            self._posted = True
+            QtCore.QCoreApplication.postEvent(self, QtCore.QEvent(_drain_event_type))
+
+        return False
+
+    def event(self, event: typing.Optional[QtCore.QEvent]) -> bool:
+        if event is not None and event.type() == _drain_event_type:
+            self.drain(time_limit=self.time_slice)
+            return True
+
+        return super().event(event)
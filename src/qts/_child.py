@@ -0,0 +1,30 @@
+import typing
+
+import qts
+
+
+def initialize(
+    wrapper_name: typing.Optional[str],
+    initializer: typing.Optional[typing.Callable[..., object]],
+    initargs: typing.Tuple[object, ...],
+) -> None:
+    """Select the parent's wrapper in a child process, skipping the discovery of
+    :func:`qts.autoset_wrapper`, then run the user's initializer.  This module only
+    imports qts itself so no Qt module is imported before the wrapper is set.
+
+    :raises qts.WrapperAlreadySelectedError: When a different wrapper was already
+        selected in the child, such as while importing the main module.
+    """
+    if wrapper_name is not None:
+        wrapper = qts.wrapper_by_name(wrapper_name)
+
+        if qts.wrapper is None:
+            qts.set_wrapper(wrapper=wrapper)
+        elif qts.wrapper != wrapper:
+            raise qts.WrapperAlreadySelectedError(
+                existing_wrapper=qts.wrapper,
+                requested_wrapper=wrapper,
+            )
+
+    if initializer is not None:
+        initializer(*initargs)
@@ -1,8 +1,10 @@
 import sys
+import typing
 
 import click
 
 import qts
+import qts._cache
 
 
 @click.group()
@@ -25,6 +27,22 @@ def mypy() -> None:
         choices=[wrapper.name for wrapper in qts.supported_wrappers],
     ),
 )
+@click.option(
+    "--all",
+    "all_wrappers",
+    is_flag=True,
+    default=False,
+    help=(
+        "Generate arguments for every supported wrapper at once.  Each is output as a"
+        " shell assignment such as QTS_MYPY_ARGUMENTS_PYQT5='...'."
+    ),
+)
+@click.option(
+    "--json/--no-json",
+    "as_json",
+    default=False,
+    help="Output a JSON list, or with --all an object keyed by wrapper name.",
+)
 @click.option(
     "--delimiter",
     # While bash command substitution works with either a space or a newline, fish
@@ -33,7 +51,12 @@ def mypy() -> None:
     help="Defaults to a space for TTYs and a newline otherwise.",
     type=str,
 )
-def args(wrapper_name: str, delimiter: str) -> None:
+def args(
+    wrapper_name: typing.Optional[str],
+    all_wrappers: bool,
+    as_json: bool,
+    delimiter: str,
+) -> None:
     """Generate arguments to be passed to mypy so it can understand which code should
     be active.  If applications or other libraries use the same conditions in their
     code then this will work for them as well.  The output can be directly injected
@@ -43,26 +66,390 @@ def args(wrapper_name: str, delimiter: str) -> None:
 
         $ mypy $(qts mypy args --wrapper pyside6) my_file.py
 
+    The arguments for all wrappers can be generated in a single invocation, such as
+    for a CI matrix.
+
+    .. code-block:: console
+
+        $ eval "$(qts mypy args --all)"
+        $ mypy ${QTS_MYPY_ARGUMENTS_PYSIDE6} my_file.py
+
     The module import selection code in qts itself can act as a reference.
 
     .. literalinclude:: ../../src/qts/QtCore.py
        :linenos:
        :start-after: # start-after qts.is_* example
        :end-before: # end-before qts.is_* example
+       :dedent: 4
     """
     # TODO: deal with the rst leaking out to the console via --help
+    import qts._mypy
+
+    if all_wrappers:
+        if wrapper_name is not None:
+            raise click.UsageError("--wrapper and --all are mutually exclusive")
+
+        arguments_by_name = {
+            wrapper.name: qts._mypy.mypy_arguments(wrapper=wrapper)
+            for wrapper in qts.supported_wrappers
+        }
+
+        if as_json:
+            import json
+
+            click.echo(json.dumps(arguments_by_name, indent=4))
+        else:
+            import shlex
+
+            for name, arguments in arguments_by_name.items():
+                value = shlex.quote(" ".join(arguments))
+                click.echo(f"QTS_MYPY_ARGUMENTS_{name.upper()}={value}")
+
+        return
+
     if wrapper_name is None:
         wrapper = qts.available_wrapper()
     else:
         wrapper = qts.wrapper_by_name(wrapper_name)
 
-    qts.set_wrapper(wrapper)
+    arguments = qts._mypy.mypy_arguments(wrapper=wrapper)
+
+    if as_json:
+        import json
+
+        click.echo(json.dumps(arguments))
+    else:
+        click.echo(delimiter.join(arguments))
+
+
+@main.group()
+def cache() -> None:
+    """Inspect and clear the persistent wrapper discovery cache.  The cache is
+    enabled by setting the ``QTS_DISCOVERY_CACHE`` environment variable to ``1``.
+    """
+
+
+@cache.command()
+def show() -> None:
+    """Show the cache files and the wrappers recorded in them."""
+    enabled = "enabled" if qts._cache.enabled() else "disabled"
+    click.echo(f"Cache is {enabled}: {qts._cache.environment_variable}")
+    click.echo(f"Cache directory: {qts._cache.directory()}")
+
+    for path in qts._cache.paths():
+        click.echo()
+        click.echo(path)
+
+        try:
+            fingerprint, installed = qts._cache.read(file_path=path)
+        except (OSError, ValueError) as e:
+            click.echo(f"    invalid: {e}")
+            continue
+
+        valid = qts._cache.is_current(fingerprint_lines=fingerprint)
+        click.echo(f"    {'valid' if valid else 'stale'}")
+        click.echo(f"    {len(fingerprint)} sys.path entries")
+        for module_name, is_installed in installed.items():
+            state = "installed" if is_installed else "not installed"
+            click.echo(f"    {module_name}: {state}")
+
+
+@cache.command()
+def clear() -> None:
+    """Remove all cache files."""
+    for path in qts._cache.clear():
+        click.echo(f"Removed {path}")
+
+
+@main.group()
+def diagnostics() -> None:
+    """Report on what qts is spending time on."""
+
+
+@diagnostics.command()
+@click.option(
+    "--wrapper",
+    "wrapper_name",
+    default=None,
+    type=click.Choice(
+        case_sensitive=False,
+        choices=[wrapper.name for wrapper in qts.supported_wrappers],
+    ),
+    help="Defaults to automatic selection.",
+)
+@click.option(
+    "--json/--no-json",
+    "as_json",
+    default=False,
+    help="Output the report as JSON.",
+)
+def imports(wrapper_name: typing.Optional[str], as_json: bool) -> None:
+    """Select a wrapper and import QtCore, QtGui, and QtWidgets while timing each
+    phase.  This separates the time spent by qts itself from the time spent loading
+    the wrapper.
+    """
+    import importlib
+
+    import qts.diagnostics
+
+    if wrapper_name is not None:
+        qts.set_wrapper(qts.wrapper_by_name(wrapper_name))
+    else:
+        qts.autoset_wrapper()
 
-    arguments = [
-        f"--always-{'true' if qts.is_pyqt_5_wrapper else 'false'}=is_pyqt_5_wrapper",
-        f"--always-{'true' if qts.is_pyqt_6_wrapper else 'false'}=is_pyqt_6_wrapper",
-        f"--always-{'true' if qts.is_pyside_5_wrapper else 'false'}=is_pyside_5_wrapper",
-        f"--always-{'true' if qts.is_pyside_6_wrapper else 'false'}=is_pyside_6_wrapper",
+    for name in ["QtCore", "QtGui", "QtWidgets"]:
+        importlib.import_module(f"qts.{name}")
+
+    report = qts.diagnostics.import_report()
+
+    if as_json:
+        click.echo(report.to_json())
+        return
+
+    click.echo(f"Wrapper: {report.wrapper_name}")
+    click.echo()
+    for timing in report.phases:
+        milliseconds = 1000 * timing.duration
+        click.echo(f"{milliseconds:10.3f} ms  {timing.phase:<16}  {timing.detail}")
+    click.echo()
+    for phase, duration in report.totals().items():
+        click.echo(f"{1000 * duration:10.3f} ms  {phase} total")
+
+
+@main.group()
+def bench() -> None:
+    """Benchmark qts and the wrappers."""
+
+
+@bench.command(name="import")
+@click.option(
+    "--wrapper",
+    "wrapper_names",
+    multiple=True,
+    type=click.Choice(
+        case_sensitive=False,
+        choices=[wrapper.name for wrapper in qts.supported_wrappers],
+    ),
+    help="May be repeated.  Defaults to all available wrappers.",
+)
+@click.option(
+    "--runs",
+    default=20,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Fresh interpreters to run for each wrapper.",
+)
+@click.option(
+    "--jobs",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Interpreters to run in parallel.  Defaults to the CPU count.",
+)
+@click.option(
+    "--json/--no-json",
+    "as_json",
+    default=False,
+    help="Output the results as JSON.",
+)
+def import_(
+    wrapper_names: typing.Tuple[str, ...],
+    runs: int,
+    jobs: typing.Optional[int],
+    as_json: bool,
+) -> None:
+    """Measure the cold start time of importing qts.QtCore, qts.QtGui, and
+    qts.QtWidgets in fresh interpreters for each wrapper.  The median and 95th
+    percentile import times are reported along with the peak resident set size.
+    """
+    import json
+
+    import qts._benchmarks.coldstart
+
+    if len(wrapper_names) == 0:
+        wrappers = qts.available_wrappers()
+    else:
+        wrappers = [qts.wrapper_by_name(name) for name in wrapper_names]
+
+    summaries = qts._benchmarks.coldstart.measure(
+        wrappers=wrappers, runs=runs, jobs=jobs
+    )
+    results = [summary.to_dict() for summary in summaries]
+
+    if as_json:
+        click.echo(json.dumps(results, indent=4))
+        return
+
+    click.echo(
+        f"{'wrapper':<10}{'runs':>6}{'median ms':>12}{'p95 ms':>12}{'peak RSS MiB':>15}"
+    )
+    for result in results:
+        import_seconds = typing.cast(typing.Dict[str, float], result["import_seconds"])
+        peak_rss = typing.cast(
+            typing.Dict[str, typing.Optional[int]], result["peak_rss_bytes"]
+        )["max"]
+        peak = "-" if peak_rss is None else f"{peak_rss / 2**20:.1f}"
+        click.echo(
+            f"{result['wrapper']:<10}{result['runs']:>6}"
+            f"{1000 * import_seconds['median']:>12.2f}"
+            f"{1000 * import_seconds['p95']:>12.2f}"
+            f"{peak:>15}"
+        )
+
+
+@bench.command()
+@click.option(
+    "--wrapper",
+    "wrapper_names",
+    multiple=True,
+    type=click.Choice(
+        case_sensitive=False,
+        choices=[wrapper.name for wrapper in qts.supported_wrappers],
+    ),
+    help="May be repeated.  Defaults to all available wrappers.",
+)
+@click.option(
+    "--scale",
+    default=1.0,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Multiplies the operation count of each benchmark.",
+)
+@click.option(
+    "--output",
+    "directory",
+    default=None,
+    type=click.Path(file_okay=False, writable=True),
+    help="Write a JSON file for each wrapper to this directory.",
+)
+@click.option(
+    "--json/--no-json",
+    "as_json",
+    default=False,
+    help="Output the results as JSON.",
+)
+def runtime(
+    wrapper_names: typing.Tuple[str, ...],
+    scale: float,
+    directory: typing.Optional[str],
+    as_json: bool,
+) -> None:
+    """Measure signal, object, and event loop operations for each wrapper.  Each
+    wrapper runs in a fresh interpreter with the offscreen platform.
+    """
+    import json
+
+    import qts._benchmarks.runtime
+
+    if len(wrapper_names) == 0:
+        wrappers = qts.available_wrappers()
+    else:
+        wrappers = [qts.wrapper_by_name(name) for name in wrapper_names]
+
+    all_results = [
+        qts._benchmarks.runtime.run_wrapper(wrapper=wrapper, scale=scale)
+        for wrapper in wrappers
     ]
 
-    click.echo(delimiter.join(arguments))
+    if directory is not None:
+        for results in all_results:
+            path = qts._benchmarks.runtime.write_results(
+                results=results, directory=directory
+            )
+            click.echo(f"Wrote {path}", err=True)
+
+    if as_json:
+        click.echo(json.dumps(all_results, indent=4))
+        return
+
+    click.echo(
+        f"{'ns per operation':<20}"
+        + "".join(f"{results['wrapper']:>12}" for results in all_results)
+    )
+    for name in qts._benchmarks.runtime.benchmarks:
+        values = [
+            typing.cast(typing.Dict[str, float], results["seconds_per_operation"])[name]
+            for results in all_results
+        ]
+        click.echo(f"{name:<20}" + "".join(f"{1e9 * value:>12.1f}" for value in values))
+
+
+@main.group()
+def stubs() -> None:
+    """Generate type stubs for qts that are specific to one wrapper."""
+
+
+@stubs.command()
+@click.option(
+    "--wrapper",
+    "wrapper_name",
+    required=True,
+    type=click.Choice(
+        case_sensitive=False,
+        choices=[wrapper.name for wrapper in qts.supported_wrappers],
+    ),
+)
+@click.option(
+    "--output",
+    "directory",
+    default="stubs",
+    show_default=True,
+    type=click.Path(file_okay=False, writable=True),
+    help="The directory to write the qts-stubs package to.",
+)
+@click.option(
+    "--module",
+    "extra_module_names",
+    multiple=True,
+    help=(
+        "An additional Qt module, such as QtNetwork, to generate a stub for.  May be"
+        " repeated."
+    ),
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Regenerate even if the stubs are up to date.",
+)
+def generate(
+    wrapper_name: str,
+    directory: str,
+    extra_module_names: typing.Tuple[str, ...],
+    force: bool,
+) -> None:
+    """Write consolidated stubs for qts.QtCore, qts.QtGui, and qts.QtWidgets that
+    explicitly re-export each name from the wrapper, including the Signal and
+    SignalInstance aliases.  They are written as a partial stub only package,
+    qts-stubs, so type checkers use them in place of the conditional star imports and
+    resolve the rest of qts from the installed package.  Put the output directory on
+    the Python path the type checker searches for installed packages, or write into
+    site-packages.  Stubs are only regenerated when the wrapper version, Python
+    version, or qts version changes.
+
+    .. code-block:: console
+
+        $ qts stubs generate --wrapper pyside6 --output stubs
+        $ PYTHONPATH=stubs mypy my_file.py
+    """
+    import qts._stubs
+
+    wrapper = qts.wrapper_by_name(wrapper_name)
+    module_names = [*qts._stubs.default_module_names]
+    module_names.extend(name for name in extra_module_names if name not in module_names)
+
+    written = qts._stubs.generate(
+        wrapper=wrapper,
+        directory=directory,
+        module_names=module_names,
+        force=force,
+    )
+
+    if written is None:
+        click.echo(f"Stubs are up to date: {directory}")
+        return
+
+    if len(written) == 0:
+        click.echo(f"Stubs were regenerated without changes: {directory}")
+
+    for path in written:
+        click.echo(f"Wrote {path}")
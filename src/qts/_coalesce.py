@@ -0,0 +1,256 @@
+import heapq
+import itertools
+import math
+import time
+import typing
+
+import typing_extensions
+
+from qts import QtCore
+
+
+Mode = typing_extensions.Literal["latest", "batch", "debounce"]
+"""How a :class:`Coalescer` combines emissions.
+
+* ``"latest"`` - Deliver only the most recent arguments, at most once per interval.
+* ``"batch"`` - Deliver a list of all arguments received, at most once per interval.
+* ``"debounce"`` - Deliver the most recent arguments once emissions have stopped for
+  an interval and, optionally, the first arguments of a burst immediately.
+"""
+
+modes: typing.Tuple[Mode, ...] = ("latest", "batch", "debounce")
+
+
+class _Scheduler(QtCore.QObject):
+    """Runs the due coalescers of one thread from a single shared timer.  Each
+    coalescer has at most one entry in the heap at a time.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._heap: typing.List[typing.Tuple[float, int, "Coalescer"]] = []
+        self._sequence = itertools.count()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._run)
+        self._next_deadline = math.inf
+
+    def schedule(self, coalescer: "Coalescer", deadline: float) -> None:
+        heapq.heappush(self._heap, (deadline, next(self._sequence), coalescer))
+
+        if deadline < self._next_deadline:
+            self._start_timer(deadline=deadline, now=time.monotonic())
+
+    def _start_timer(self, deadline: float, now: float) -> None:
+        self._next_deadline = deadline
+        self._timer.start(max(0, math.ceil((deadline - now) * 1000)))
+
+    def _run(self) -> None:
+        now = time.monotonic()
+        heap = self._heap
+        self._next_deadline = math.inf
+
+        while heap and heap[0][0] <= now:
+            _, _, coalescer = heapq.heappop(heap)
+            coalescer._fire(now=now)
+
+        if heap:
+            self._start_timer(deadline=heap[0][0], now=now)
+
+
+_schedulers: typing.Dict[QtCore.QThread, _Scheduler] = {}
+
+
+def _scheduler() -> _Scheduler:
+    # Keyed by the thread object rather than the identifier, which is reused once a
+    # thread ends.  Threads not started by Qt get an adopted QThread which also emits
+    # finished when they end.  A threading.local() would not do as it is reset
+    # between slot calls in threads started by Qt.
+    thread = QtCore.QThread.currentThread()
+    assert thread is not None
+    scheduler = _schedulers.get(thread)
+
+    if scheduler is None:
+        scheduler = _schedulers[thread] = _Scheduler()
+
+        # Connected and emitted in the same thread so it is called directly.
+        def forget() -> None:
+            _schedulers.pop(thread, None)
+
+        thread.finished.connect(forget)
+
+    return scheduler
+
+
+class Coalescer(QtCore.QObject):
+    """Sits between a :class:`QtCore.SignalInstance` and its slots to reduce the rate
+    at which the slots are called, such as for emitters updating far more often than
+    a display can show.
+
+    Slots added with :meth:`add_slot` are called with the arguments of the
+    signal, or with a list of them in the ``"batch"`` mode where each entry is the
+    single argument, or a tuple of the arguments when there are several.  All
+    coalescers in a thread share one timer.  The coalescer belongs to the thread
+    creating it and the slots are called there, so emissions from other threads
+    are queued to it as usual.  Keep a reference to the coalescer, or give it a
+    parent, for as long as it is needed.
+
+    :param signal: The signal to coalesce emissions of.
+    :param mode: How to combine emissions.  See :data:`qts.util.CoalesceMode`.
+    :param interval: The minimum seconds between deliveries, such as a frame
+        period, or for ``"debounce"`` the seconds without emissions that end a
+        burst.
+    :param leading: For ``"debounce"``, deliver the first emission of a burst
+        immediately.
+    :param trailing: For ``"debounce"``, deliver the last emission of a burst once it
+        ends.
+    :param parent: The parent object.
+
+    :raises ValueError: When the mode is unknown or the interval is negative.
+    """
+
+    def __init__(
+        self,
+        signal: QtCore.SignalInstance,
+        mode: Mode = "latest",
+        interval: float = 1 / 60,
+        leading: bool = False,
+        trailing: bool = True,
+        parent: typing.Optional[QtCore.QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+
+        if mode not in modes:
+            raise ValueError(f"Unknown mode {mode!r}, expected one of {modes}")
+        if interval < 0:
+            raise ValueError(f"The interval must not be negative, got {interval}")
+
+        self.mode: Mode = mode
+        self.interval = interval
+        self.leading = leading
+        self.trailing = trailing
+
+        self.received = 0
+        """The number of emissions received."""
+        self.deliveries = 0
+        """The number of times the slots have been called."""
+
+        self._slots: typing.List[typing.Callable[..., object]] = []
+        self._scheduler = _scheduler()
+        self._scheduled = False
+        self._has_pending = False
+        self._pending: typing.Any = None
+        self._batch: typing.List[typing.Any] = []
+        self._last_delivery = -math.inf
+        self._burst_end = -math.inf
+        self._in_burst = False
+
+        receivers = {
+            "latest": self._receive_latest,
+            "batch": self._receive_batch,
+            "debounce": self._receive_debounce,
+        }
+        self._receive = receivers[mode]
+        self._signal: typing.Optional[QtCore.SignalInstance] = signal
+        signal.connect(self._receive)
+
+    def add_slot(self, slot: typing.Callable[..., object]) -> None:
+        """Call the slot with the coalesced emissions."""
+        self._slots.append(slot)
+
+    def remove_slot(self, slot: typing.Callable[..., object]) -> None:
+        """Stop calling a slot.
+
+        :raises ValueError: When the slot is not connected.
+        """
+        self._slots.remove(slot)
+
+    def close(self) -> None:
+        """Disconnect from the signal and discard any pending emissions."""
+        if self._signal is not None:
+            self._signal.disconnect(self._receive)
+            self._signal = None
+
+        self._has_pending = False
+        self._pending = None
+        self._batch = []
+
+    def flush(self) -> None:
+        """Deliver any pending emissions now."""
+        if self.mode == "batch":
+            if self._batch:
+                batch, self._batch = self._batch, []
+                self._deliver((batch,), now=time.monotonic())
+        elif self._has_pending:
+            self._has_pending = False
+            pending, self._pending = self._pending, None
+            self._deliver(pending, now=time.monotonic())
+
+    def _receive_latest(self, *args: object) -> None:
+        self.received += 1
+        self._pending = args
+        self._has_pending = True
+
+        if not self._scheduled:
+            self._scheduled = True
+            self._scheduler.schedule(
+                self, max(time.monotonic(), self._last_delivery + self.interval)
+            )
+
+    def _receive_batch(self, *args: object) -> None:
+        self.received += 1
+        self._batch.append(args[0] if len(args) == 1 else args)
+
+        if not self._scheduled:
+            self._scheduled = True
+            self._scheduler.schedule(
+                self, max(time.monotonic(), self._last_delivery + self.interval)
+            )
+
+    def _receive_debounce(self, *args: object) -> None:
+        self.received += 1
+        now = time.monotonic()
+        self._burst_end = now + self.interval
+
+        if self.leading and not self._in_burst:
+            self._deliver(args, now=now)
+        else:
+            self._pending = args
+            self._has_pending = True
+        self._in_burst = True
+
+        if not self._scheduled:
+            self._scheduled = True
+            self._scheduler.schedule(self, self._burst_end)
+
+    def _fire(self, now: float) -> None:
+        if self.mode == "debounce":
+            if now < self._burst_end:
+                # Emissions continued since this was scheduled.
+                self._scheduler.schedule(self, self._burst_end)
+                return
+
+            self._in_burst = False
+
+        self._scheduled = False
+
+        if self.mode == "batch":
+            if self._batch:
+                batch, self._batch = self._batch, []
+                self._deliver((batch,), now=now)
+        elif self._has_pending and (self.mode == "latest" or self.trailing):
+            self._has_pending = False
+            pending, self._pending = self._pending, None
+            self._deliver(pending, now=now)
+        else:
+            self._has_pending = False
+            self._pending = None
+
+    def _deliver(self, args: typing.Tuple[object, ...], now: float) -> None:
+        self._last_delivery = now
+        self.deliveries += 1
+
+        for slot in self._slots:
+            slot(*args)
@@ -1,19 +1,23 @@
-import importlib.util
+import contextlib
 import os
 import sys
 import typing
 
-import attr
-
 import qts
+import qts._cache
+import qts._timing
 
 
-@attr.frozen
 class Wrapper:
     """A representation of a specific wrapper that can be used to access a specific
-    version of Qt.
+    version of Qt.  Instances are immutable, hashable, and compare equal when all
+    fields are equal.
     """
 
+    # Written out by hand rather than with attrs so that importing qts stays cheap.
+
+    __slots__ = ("family", "name", "major_version", "module_name")
+
     family: str
     """The wrapper family.  ``"PyQt"`` or ``"PySide"``."""
     name: str
@@ -23,6 +27,42 @@ class Wrapper:
     module_name: str
     """The name used to import the module.  Such as ``"PySide6"``."""
 
+    def __init__(
+        self, family: str, name: str, major_version: int, module_name: str
+    ) -> None:
+        object.__setattr__(self, "family", family)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "major_version", major_version)
+        object.__setattr__(self, "module_name", module_name)
+
+    def _fields(self) -> typing.Tuple[str, str, int, str]:
+        return (self.family, self.name, self.major_version, self.module_name)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"can't set attribute {name!r} of frozen Wrapper")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"can't delete attribute {name!r} of frozen Wrapper")
+
+    def __reduce__(self) -> typing.Tuple[type, typing.Tuple[str, str, int, str]]:
+        # The default protocol restores the slots with setattr() which is blocked.
+        return (self.__class__, self._fields())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Wrapper) or other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(family={self.family!r}, name={self.name!r},"
+            f" major_version={self.major_version!r}, module_name={self.module_name!r})"
+        )
+
 
 pyqt_5_wrapper = Wrapper(
     family="PyQt", name="PyQt5", major_version=5, module_name="PyQt5"
@@ -51,6 +91,28 @@ supported_wrappers = [
 
 _wrappers_by_name = {wrapper.name.casefold(): wrapper for wrapper in supported_wrappers}
 
+_known_wrapper_module_names = [
+    *(wrapper.module_name for wrapper in supported_wrappers),
+    "PyQt4",
+    "PySide",
+]
+"""The supported wrapper module names along with known unsupported ones.  These are
+looked up directly in :data:`sys.modules` when checking for already imported
+wrappers.
+"""
+
+_inherited_wrapper_variable = "QTS_INHERITED_WRAPPER"
+"""The environment variable set by :func:`inherit_wrapper` to the name of the wrapper
+selected in this process so that child processes, such as those started with the
+``spawn`` method of :mod:`multiprocessing`, select the same wrapper without probing
+for others.
+"""
+
+_installed_by_module_name: typing.Dict[str, bool] = {}
+"""Memoized results of :func:`importlib.util.find_spec` for wrapper module names."""
+_persistent_cache_loaded = False
+"""``True`` once the persistent cache has been consulted, if it is enabled."""
+
 
 def set_wrapper(wrapper: Wrapper) -> None:
     """Set the wrapper you want to back the Qt modules accessed through qts.
@@ -62,6 +124,13 @@ def set_wrapper(wrapper: Wrapper) -> None:
         already been imported.
     """
 
+    _set_wrapper(wrapper=wrapper)
+
+
+def _set_wrapper(
+    wrapper: Wrapper,
+    already_imported: typing.Optional[typing.List[Wrapper]] = None,
+) -> None:
     # This could accept the new wrapper if it matches the existing selection, but this
     # seems like it would mostly just encourage coding that hazards setting to a
     # different wrapper in some other case.  May as well complain early so that
@@ -76,7 +145,9 @@ def set_wrapper(wrapper: Wrapper) -> None:
     if wrapper not in supported_wrappers:
         raise qts.InvalidWrapperError(wrapper=wrapper)
 
-    already_imported = check_already_imported_wrappers()
+    if already_imported is None:
+        already_imported = check_already_imported_wrappers()
+
     if len(already_imported) > 0 and wrapper not in already_imported:
         raise qts.OtherWrapperAlreadyImportedError(
             requested=wrapper, already_imported=already_imported
@@ -90,17 +161,31 @@ def set_wrapper(wrapper: Wrapper) -> None:
     qts.is_pyside_6_wrapper = wrapper == pyside_6_wrapper
 
 
-def already_imported_wrapper_names() -> typing.List[str]:
-    return [
-        module
-        for module in sys.modules
-        if "." not in module
-        if any(module.startswith(name) for name in ["PyQt", "PySide"])
-    ]
+def already_imported_wrapper_names(exhaustive: bool = False) -> typing.List[str]:
+    """Get the names of wrapper modules that have already been imported.
+
+    :param exhaustive: By default only the supported wrappers and a few known
+        unsupported ones such as PyQt4 are looked up.  If :data:`True` then all of
+        :data:`sys.modules` is scanned for any top level ``PyQt*`` or ``PySide*``
+        module.  This can be slow when many modules have been imported.
+    """
+    if not exhaustive:
+        with qts._timing.timed(phase="sys.modules", detail="direct"):
+            modules = sys.modules
+            return [name for name in _known_wrapper_module_names if name in modules]
+
+    with qts._timing.timed(phase="sys.modules", detail="exhaustive"):
+        return [
+            module
+            for module in sys.modules
+            if "." not in module
+            if any(module.startswith(name) for name in ["PyQt", "PySide"])
+        ]
 
 
 def check_already_imported_wrappers(
     wrappers: typing.Optional[typing.Iterable[Wrapper]] = None,
+    exhaustive: bool = False,
 ) -> typing.List[Wrapper]:
     """Checks for wrappers that have already been imported and returns any that are
     supported.  If only unsupported wrappers have been imported then an exception is
@@ -108,8 +193,14 @@ def check_already_imported_wrappers(
 
     :param wrappers: An iterable of :class:`qts.Wrapper` to use as the supported list.
         If unspecified or :object:`None` then :attr:`qts.supported_wrappers` is used.
+    :param exhaustive: By default only the supported wrappers and a few known
+        unsupported ones such as PyQt4 are looked up directly.  If :data:`True` then
+        all of :data:`sys.modules` is scanned so that any other ``PyQt*`` or
+        ``PySide*`` module is reported as unsupported as well.  This can be slow when
+        many modules have been imported.
 
-    :returns: A list of the supported wrappers that have already been imported.
+    :returns: A list of the supported wrappers that have already been imported, in
+        the order of ``wrappers``.
 
     :raises qts.UnsupportedWrappersError: When only unsupported wrappers have been
         imported.
@@ -117,32 +208,39 @@ def check_already_imported_wrappers(
     if wrappers is None:
         wrappers = supported_wrappers
 
-    already_imported_names = already_imported_wrapper_names()
+    already_imported_names = already_imported_wrapper_names(exhaustive=exhaustive)
 
     if len(already_imported_names) == 0:
         return []
 
-    supported = {wrapper.module_name for wrapper in wrappers}
-    supported_already_imported = supported.intersection(already_imported_names)
+    supported_already_imported = [
+        wrapper for wrapper in wrappers if wrapper.module_name in already_imported_names
+    ]
 
     if len(supported_already_imported) == 0:
         raise qts.UnsupportedWrappersError(module_names=already_imported_names)
 
-    return [
-        wrapper_by_name(name=module_name) for module_name in supported_already_imported
-    ]
+    return supported_already_imported
 
 
 def autoset_wrapper() -> None:
     """Automatically choose and set the wrapper used to back the Qt modules accessed
     through qts.  If the environment variable ``QTS_WRAPPER`` is set to a name of a
     supported wrapper then that wrapper will be used.  The lookup is case insensitive.
-    If a supported wrapper has already been imported then it will be used.
+    If a supported wrapper has already been imported then it will be used.  Otherwise
+    the wrapper a parent process selected and passed on with :func:`inherit_wrapper`
+    will be used if it is installed.
+
+    Checking for installed wrappers can be skipped across processes by setting the
+    environment variable ``QTS_DISCOVERY_CACHE`` to ``1``.  The results are then
+    stored in the user cache directory and reused until :data:`sys.path` or the
+    modification times of its entries change.  See ``qts cache`` in the :ref:`cli`.
 
     :raises qts.InvalidWrapperError: When an unsupported wrapper name is specified in
         the ``QTS_WRAPPER`` environment variable.
     """
-    environment_wrapper_name = os.environ.get("QTS_WRAPPER")
+    with qts._timing.timed(phase="environment", detail="QTS_WRAPPER"):
+        environment_wrapper_name = os.environ.get("QTS_WRAPPER")
 
     if environment_wrapper_name is not None:
         environment_wrapper = _wrappers_by_name.get(environment_wrapper_name.casefold())
@@ -155,11 +253,127 @@ def autoset_wrapper() -> None:
 
     already_imported = check_already_imported_wrappers()
     if len(already_imported) > 0:
-        available = an_available_wrapper(wrappers=already_imported)
+        available = already_imported[0]
     else:
-        available = an_available_wrapper()
+        inherited = _inherited_wrapper()
+
+        if inherited is not None:
+            available = inherited
+        else:
+            # Nothing has been imported so there is no need to scan for it again.
+            available = _an_available_wrapper(
+                wrappers=supported_wrappers,
+                already_imported_names=[],
+            )
+
+    _set_wrapper(wrapper=available, already_imported=already_imported)
+
 
-    set_wrapper(wrapper=available)
+@contextlib.contextmanager
+def inherit_wrapper() -> typing.Iterator[None]:
+    """Pass the selected wrapper on to the child processes started within the context,
+    such as :mod:`multiprocessing` workers started with the ``spawn`` method, so that
+    :func:`autoset_wrapper` selects the same wrapper there without probing for
+    others.  The wrapper name is set in the ``QTS_INHERITED_WRAPPER`` environment
+    variable of this process while the context is active and the previous value is
+    restored on exit.  Nothing is set if no wrapper has been selected.
+
+    .. code-block:: python
+
+        with qts.inherit_wrapper():
+            pool = multiprocessing.get_context("spawn").Pool()
+
+    :class:`qts.util.ProcessPoolExecutor` passes the wrapper on to its workers by
+    itself.
+    """
+    if qts.wrapper is None:
+        yield
+        return
+
+    previous = os.environ.get(_inherited_wrapper_variable)
+    os.environ[_inherited_wrapper_variable] = qts.wrapper.name
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(_inherited_wrapper_variable, None)
+        else:
+            os.environ[_inherited_wrapper_variable] = previous
+
+
+def _inherited_wrapper() -> typing.Optional[Wrapper]:
+    with qts._timing.timed(phase="environment", detail=_inherited_wrapper_variable):
+        # Consumed so that it is not passed on further to unrelated processes this
+        # process starts.
+        name = os.environ.pop(_inherited_wrapper_variable, None)
+
+    if name is None:
+        return None
+
+    wrapper = _wrappers_by_name.get(name.casefold())
+
+    # The variable may have been inherited by an unrelated program running in another
+    # environment, so only a wrapper that is installed here is used.
+    if wrapper is None or not _is_installed(wrapper):
+        return None
+
+    return wrapper
+
+
+def invalidate_caches() -> None:
+    """Forget which wrappers were found to be installed.  The checks are otherwise
+    only made once per process.  Call this if wrappers are installed or removed
+    while running.  :func:`importlib.invalidate_caches` may be needed as well.
+
+    If the persistent cache is enabled it will not be consulted again in this
+    process.  Fresh checks will be stored to it.
+    """
+    global _persistent_cache_loaded
+
+    _installed_by_module_name.clear()
+    _persistent_cache_loaded = True
+
+
+def _is_installed(wrapper: Wrapper) -> bool:
+    global _persistent_cache_loaded
+
+    try:
+        return _installed_by_module_name[wrapper.module_name]
+    except KeyError:
+        pass
+
+    persistent = qts._cache.enabled()
+
+    if persistent and not _persistent_cache_loaded:
+        _persistent_cache_loaded = True
+        with qts._timing.timed(phase="persistent cache", detail="load"):
+            _installed_by_module_name.update(qts._cache.load())
+
+        try:
+            return _installed_by_module_name[wrapper.module_name]
+        except KeyError:
+            pass
+
+    # Deferred since it is only needed when actually probing.
+    import importlib.util
+
+    with qts._timing.timed(phase="find_spec", detail=wrapper.module_name):
+        installed = importlib.util.find_spec(wrapper.module_name) is not None
+    _installed_by_module_name[wrapper.module_name] = installed
+
+    if persistent:
+        with qts._timing.timed(phase="persistent cache", detail="store"):
+            qts._cache.store(installed=_installed_by_module_name)
+
+    return installed
+
+
+def _is_available(
+    wrapper: Wrapper,
+    already_imported_names: typing.Collection[str],
+) -> bool:
+    # checking the already imported modules is cheap so do that first
+    return wrapper.module_name in already_imported_names or _is_installed(wrapper)
 
 
 def available_wrappers(
@@ -168,7 +382,8 @@ def available_wrappers(
     """Get a sequence of the wrappers that are available for use.  If ``wrappers`` is
     passed, only wrappers that are both available and in the passed iterable will be
     returned.  Availability is checked both by installation metadata and any wrappers
-    that have already been imported.
+    that have already been imported.  Installation checks are remembered until
+    :func:`qts.invalidate_caches` is called.
 
     :returns: The wrappers that are installed and available for use.
     """
@@ -181,10 +396,7 @@ def available_wrappers(
     available = [
         wrapper
         for wrapper in wrappers
-        if (
-            importlib.util.find_spec(wrapper.module_name)
-            or wrapper.name in already_imported_names
-        )
+        if _is_available(wrapper=wrapper, already_imported_names=already_imported_names)
     ]
 
     return available
@@ -217,21 +429,32 @@ def available_wrapper(
 def an_available_wrapper(
     wrappers: typing.Optional[typing.Iterable[Wrapper]] = None,
 ) -> Wrapper:
-    """Get an available wrapper when there is one or more available.
+    """Get an available wrapper when there is one or more available.  The wrappers
+    are checked in order and checking stops at the first available one.
 
     :param wrappers: The wrappers to consider.  All if not specified.
 
-    :return: The wrapper object for the single available wrapper.
+    :return: The wrapper object for the first available wrapper.
 
     :raises qts.NoWrapperAvailableError: When no wrappers are available.
     """
     if wrappers is None:
         wrappers = supported_wrappers
 
-    all_available = available_wrappers(wrappers=wrappers)
+    return _an_available_wrapper(
+        wrappers=list(wrappers),
+        already_imported_names=already_imported_wrapper_names(),
+    )
 
+
+def _an_available_wrapper(
+    wrappers: typing.Sequence[Wrapper],
+    already_imported_names: typing.Collection[str],
+) -> Wrapper:
     for wrapper in wrappers:
-        if wrapper in all_available:
+        if _is_available(
+            wrapper=wrapper, already_imported_names=already_imported_names
+        ):
             return wrapper
 
     raise qts.NoWrapperAvailableError(wrappers=wrappers)
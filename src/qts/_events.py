@@ -0,0 +1,22 @@
+import typing
+
+from qts import QtCore
+
+
+_registered: typing.Dict[str, QtCore.QEvent.Type] = {}
+
+
+def registered_event_type(purpose: str) -> QtCore.QEvent.Type:
+    """Get the custom event type registered with Qt for a purpose, registering it on
+    first use so it cannot collide with types used by the application or other
+    libraries.
+
+    :param purpose: The name identifying the use of the event type.
+    :returns: The event type, the same for every call with the same purpose.
+    """
+    event_type = _registered.get(purpose)
+    if event_type is None:
+        event_type = QtCore.QEvent.Type(QtCore.QEvent.registerEventType())
+        _registered[purpose] = event_type
+
+    return event_type
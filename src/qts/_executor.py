@@ -0,0 +1,265 @@
+import concurrent.futures
+import sys
+import threading
+import typing
+
+import typing_extensions
+
+from qts import QtCore
+
+
+_P = typing_extensions.ParamSpec("_P")
+_T = typing.TypeVar("_T")
+
+if typing.TYPE_CHECKING:
+    _FutureBase = concurrent.futures.Future[typing.Any]
+else:
+    _FutureBase = concurrent.futures.Future
+
+
+class _Relay(QtCore.QObject):
+    """Delivers finished futures to the thread that created the executor."""
+
+    done = QtCore.Signal(object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.done.connect(self.deliver)
+
+    def deliver(self, future: "_Future") -> None:
+        future._run_callbacks()
+
+
+class _Future(_FutureBase):
+    """A future whose done callbacks run once the executor calls
+    :meth:`_run_callbacks`, in the thread that created the executor.
+
+    :param done: Called with the future in the thread completing it.  The executor
+        arranges for :meth:`_run_callbacks` to be called from there.
+    """
+
+    def __init__(self, done: typing.Callable[["_Future"], None]) -> None:
+        super().__init__()
+
+        self._runnable: typing.Optional[_Runnable] = None
+        self._callbacks_lock = threading.Lock()
+        self._callbacks: typing.List[typing.Callable[["_Future"], object]] = []
+        self._delivered = False
+
+        super().add_done_callback(done)  # type: ignore[arg-type]
+
+    def add_done_callback(
+        self, fn: typing.Callable[["concurrent.futures.Future[typing.Any]"], object]
+    ) -> None:
+        with self._callbacks_lock:
+            if not self._delivered:
+                self._callbacks.append(fn)
+                return
+
+        fn(self)
+
+    def _run_callbacks(self) -> None:
+        with self._callbacks_lock:
+            self._delivered = True
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as error:
+                sys.excepthook(type(error), error, error.__traceback__)
+
+
+class _Runnable(QtCore.QRunnable):
+    def __init__(
+        self,
+        executor: "ThreadPoolExecutor",
+        future: _Future,
+        fn: typing.Callable[..., object],
+        args: typing.Tuple[object, ...],
+        kwargs: typing.Dict[str, object],
+    ) -> None:
+        super().__init__()
+        # The executor keeps a reference until the pool is done with the runnable.
+        self.setAutoDelete(False)
+
+        self.executor = executor
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self) -> None:
+        self.executor._release_slot()
+
+        try:
+            if not self.future.set_running_or_notify_cancel():
+                return
+
+            try:
+                result = self.fn(*self.args, **self.kwargs)
+            except BaseException as error:
+                self.future.set_exception(error)
+            else:
+                self.future.set_result(result)
+        finally:
+            self.fn = self.args = self.kwargs = None  # type: ignore[assignment]
+            self.executor._forget(self.future)
+
+
+class ThreadPoolExecutor(concurrent.futures.Executor):
+    """A :class:`concurrent.futures.Executor` running calls in a
+    :class:`QtCore.QThreadPool`.
+
+    Done callbacks added to the returned futures run in the thread that created the
+    executor, usually the GUI thread, once a signal relaying the finished future
+    is delivered there.  Callbacks added after that run immediately in the calling
+    thread.  Results are available from the futures in any thread as soon as the
+    calls return.  Cancelling a future that has not started removes its call from
+    the pool.
+
+    :param max_workers: The maximum number of threads of the pool created for the
+        executor.  Defaults to :meth:`QtCore.QThread.idealThreadCount`.
+    :param max_queued: The maximum number of calls submitted but not yet started.
+        :meth:`submit` blocks while this many are waiting and :meth:`try_submit`
+        returns :data:`None`.  Defaults to no limit.
+    :param pool: Run calls in this pool, such as
+        :meth:`QtCore.QThreadPool.globalInstance`, instead of creating one.
+
+    :raises ValueError: When both a pool and a maximum number of workers are passed
+        or either maximum is less than one.
+    """
+
+    def __init__(
+        self,
+        max_workers: typing.Optional[int] = None,
+        max_queued: typing.Optional[int] = None,
+        pool: typing.Optional[QtCore.QThreadPool] = None,
+    ) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least one, got {max_workers}")
+        if max_queued is not None and max_queued < 1:
+            raise ValueError(f"max_queued must be at least one, got {max_queued}")
+
+        if pool is None:
+            pool = QtCore.QThreadPool()
+            if max_workers is not None:
+                pool.setMaxThreadCount(max_workers)
+        elif max_workers is not None:
+            raise ValueError("Pass either a pool or max_workers, not both")
+
+        self.pool = pool
+
+        self._relay = _Relay()
+        self._slots = None if max_queued is None else threading.Semaphore(max_queued)
+        self._lock = threading.Lock()
+        self._futures: typing.Dict[_Future, _Runnable] = {}
+        self._shutdown = False
+
+    def submit(
+        self,
+        __fn: typing.Callable[_P, _T],
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> "concurrent.futures.Future[_T]":
+        """Run ``fn(*args, **kwargs)`` in the pool, waiting while the queue is full.
+
+        :raises RuntimeError: When the executor has been shut down.
+        """
+        future = self._submit(fn=__fn, args=args, kwargs=kwargs, blocking=True)
+        assert future is not None
+        return future
+
+    def try_submit(
+        self,
+        __fn: typing.Callable[_P, _T],
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> "typing.Optional[concurrent.futures.Future[_T]]":
+        """Run ``fn(*args, **kwargs)`` in the pool unless the queue is full.
+
+        :returns: The future, or :data:`None` when the queue is full.
+        :raises RuntimeError: When the executor has been shut down.
+        """
+        return self._submit(fn=__fn, args=args, kwargs=kwargs, blocking=False)
+
+    def _submit(
+        self,
+        fn: typing.Callable[..., object],
+        args: typing.Tuple[object, ...],
+        kwargs: typing.Dict[str, object],
+        blocking: bool,
+    ) -> typing.Optional[_Future]:
+        if self._shutdown:
+            raise RuntimeError("Cannot submit calls after shutdown")
+
+        if self._slots is not None and not self._slots.acquire(blocking=blocking):
+            return None
+
+        future = _Future(done=self._future_done)
+        runnable = _Runnable(
+            executor=self, future=future, fn=fn, args=args, kwargs=kwargs
+        )
+        future._runnable = runnable
+
+        with self._lock:
+            if self._shutdown:
+                self._release_slot()
+                raise RuntimeError("Cannot submit calls after shutdown")
+
+            self._futures[future] = runnable
+
+        self.pool.start(runnable)
+
+        return future
+
+    def pending(self) -> int:
+        """Get the number of calls that have been submitted and not yet finished or
+        been cancelled.
+        """
+        return len(self._futures)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop accepting calls.
+
+        :param wait: Wait until the submitted calls have finished.  Their done
+            callbacks run later, when the thread that created the executor handles
+            events.
+        :param cancel_futures: Cancel the calls that have not started.
+        """
+        with self._lock:
+            self._shutdown = True
+            futures = list(self._futures)
+
+        if cancel_futures:
+            for future in futures:
+                future.cancel()
+
+        if wait:
+            concurrent.futures.wait(futures)
+
+    def _future_done(self, future: _Future) -> None:
+        # Runs in the thread completing the future.
+        if future.cancelled():
+            self._take(future)
+
+        self._relay.done.emit(future)
+
+    def _release_slot(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+    def _take(self, future: _Future) -> None:
+        runnable = future._runnable
+        # When this fails the pool has dequeued the runnable and it releases the
+        # slot itself.  It must be kept alive until then.
+        if runnable is not None and self.pool.tryTake(runnable):
+            self._release_slot()
+            # Lets concurrent.futures.wait() and as_completed() see it as done.
+            future.set_running_or_notify_cancel()
+            self._forget(future)
+
+    def _forget(self, future: _Future) -> None:
+        with self._lock:
+            self._futures.pop(future, None)
+            future._runnable = None
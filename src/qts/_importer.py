@@ -0,0 +1,62 @@
+import importlib.machinery
+import sys
+import types
+import typing
+
+import qts._lazy
+
+
+if typing.TYPE_CHECKING:
+    # Only imported for hinting since it pulls in importlib.resources and is slow.
+    import importlib.abc
+
+
+class QtModuleFinder:
+    """A :data:`sys.meta_path` finder and loader that provides ``qts.QtXyz`` for any
+    ``QtXyz`` module of the selected wrapper.  The modules with dedicated files in
+    qts, such as ``qts.QtCore``, are found by the regular path based finder first.
+    Nothing is imported from the wrapper until a module is requested.
+    """
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: typing.Optional[typing.Sequence[str]] = None,
+        target: typing.Optional[types.ModuleType] = None,
+    ) -> typing.Optional[importlib.machinery.ModuleSpec]:
+        package, _, name = fullname.rpartition(".")
+
+        if package != "qts" or not name.startswith("Qt"):
+            return None
+
+        # Deferred since it is only needed when a module is requested.
+        import importlib.util
+
+        if importlib.util.find_spec(qts._lazy.wrapped_name(name=name)) is None:
+            return None
+
+        return importlib.machinery.ModuleSpec(
+            name=fullname,
+            loader=typing.cast("importlib.abc.Loader", self),
+        )
+
+    def create_module(
+        self, spec: importlib.machinery.ModuleSpec
+    ) -> typing.Optional[types.ModuleType]:
+        # use the default module creation
+        return None
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        name = module.__name__.rpartition(".")[2]
+        qts._lazy.forward_attributes(
+            namespace=vars(module),
+            wrapped=qts._lazy.import_wrapped(name=name),
+        )
+
+
+def install() -> None:
+    """Add the :class:`QtModuleFinder` to the end of :data:`sys.meta_path` unless it is
+    already present.
+    """
+    if not any(isinstance(finder, QtModuleFinder) for finder in sys.meta_path):
+        sys.meta_path.append(QtModuleFinder())
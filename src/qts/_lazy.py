@@ -0,0 +1,95 @@
+import importlib
+import types
+import typing
+
+import qts
+import qts._timing
+
+
+def selected_wrapper() -> qts.Wrapper:
+    """Get the selected wrapper, automatically setting one if needed.
+
+    :raises qts.InvalidWrapperError: When the selected wrapper is not supported.
+    """
+    if qts.wrapper is None:
+        qts.autoset_wrapper()
+
+    wrapper = qts.wrapper
+
+    if wrapper is None or wrapper not in qts.supported_wrappers:
+        raise qts.InvalidWrapperError(wrapper=wrapper)
+
+    return wrapper
+
+
+def wrapped_name(name: str) -> str:
+    """Get the full name of a Qt module, such as ``"QtCore"``, in the selected
+    wrapper.  For example, ``"PySide6.QtCore"``.
+
+    :raises qts.InvalidWrapperError: When the selected wrapper is not supported.
+    """
+    return f"{selected_wrapper().module_name}.{name}"
+
+
+def import_wrapped(name: str) -> types.ModuleType:
+    """Import a Qt module, such as ``"QtCore"``, from the selected wrapper.
+
+    :raises qts.InvalidWrapperError: When the selected wrapper is not supported.
+    """
+    full_name = wrapped_name(name=name)
+
+    with qts._timing.timed(phase="import", detail=full_name):
+        return importlib.import_module(full_name)
+
+
+def forward_attributes(
+    namespace: typing.Dict[str, object],
+    wrapped: types.ModuleType,
+    hidden: typing.AbstractSet[str] = frozenset(),
+) -> None:
+    """Add :pep:`562` ``__getattr__`` and ``__dir__`` functions to a module namespace
+    so that public attributes of the wrapped module are resolved on first access.
+    Each resolved attribute is stored in the namespace so later lookups are plain
+    module dictionary hits that never reach ``__getattr__``.  ``__all__`` is also
+    computed on first access so ``from qts.QtCore import *`` keeps working.
+
+    :param namespace: The ``globals()`` of the forwarding module.
+    :param wrapped: The module to forward attribute access to.
+    :param hidden: Names from the wrapped module that should not be forwarded.
+    """
+    module_name = namespace["__name__"]
+
+    def public_names() -> typing.List[str]:
+        names = {name for name in dir(wrapped) if not name.startswith("_")}
+        names.difference_update(hidden)
+        names.update(
+            name
+            for name, value in namespace.items()
+            if not name.startswith("_")
+            if not isinstance(value, types.ModuleType)
+        )
+        return sorted(names)
+
+    def __getattr__(name: str) -> object:
+        value: object
+
+        if name == "__all__":
+            value = public_names()
+        elif name.startswith("_") or name in hidden:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        else:
+            try:
+                value = getattr(wrapped, name)
+            except AttributeError:
+                raise AttributeError(
+                    f"module {module_name!r} has no attribute {name!r}"
+                ) from None
+
+        namespace[name] = value
+        return value
+
+    def __dir__() -> typing.List[str]:
+        return sorted({*namespace, *public_names()})
+
+    namespace["__getattr__"] = __getattr__
+    namespace["__dir__"] = __dir__
@@ -0,0 +1,45 @@
+import os
+
+
+def _is_source_checkout() -> bool:
+    # src/qts/_metadata.py in a repository with .git beside src/.  .git is a file in
+    # worktrees and submodules.
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.exists(os.path.join(root, ".git"))
+
+
+def version() -> str:
+    """Get the qts version string.  Installed distribution metadata is preferred
+    since it is cheap to read.  Otherwise versioneer is used which reads a static file
+    written at build time or, in a source checkout, asks git.  Source checkouts always
+    ask git since the metadata of an editable install is not updated by later commits.
+    """
+    if _is_source_checkout():
+        return _versioneer_version()
+
+    try:
+        import importlib.metadata as importlib_metadata
+    except ImportError:  # pragma: no cover
+        # Python 3.7
+        pass
+    else:
+        try:
+            distribution = importlib_metadata.distribution("qts")
+        except importlib_metadata.PackageNotFoundError:
+            pass
+        else:
+            # Ignore metadata describing some other copy of qts, such as an older
+            # release installed in an environment used to build from source.
+            located = str(distribution.locate_file("qts/__init__.py"))
+            here = os.path.join(os.path.dirname(__file__), "__init__.py")
+            if not os.path.exists(located) or os.path.samefile(located, here):
+                return distribution.version
+
+    return _versioneer_version()
+
+
+def _versioneer_version() -> str:
+    from qts._version import get_versions
+
+    version: str = get_versions()["version"]  # type: ignore[no-untyped-call]
+    return version
@@ -0,0 +1,32 @@
+import typing
+
+import qts
+
+
+def conditions(wrapper: qts.Wrapper) -> typing.Dict[str, bool]:
+    """Get the value each ``qts.is_*`` condition would have if the passed wrapper were
+    selected.  Nothing is selected or imported.
+
+    :raises qts.InvalidWrapperError: When called with an invalid wrapper.
+    """
+    if wrapper not in qts.supported_wrappers:
+        raise qts.InvalidWrapperError(wrapper=wrapper)
+
+    return {
+        "is_pyqt_5_wrapper": wrapper == qts.pyqt_5_wrapper,
+        "is_pyqt_6_wrapper": wrapper == qts.pyqt_6_wrapper,
+        "is_pyside_5_wrapper": wrapper == qts.pyside_5_wrapper,
+        "is_pyside_6_wrapper": wrapper == qts.pyside_6_wrapper,
+    }
+
+
+def mypy_arguments(wrapper: qts.Wrapper) -> typing.List[str]:
+    """Get the ``--always-true`` and ``--always-false`` mypy arguments for the passed
+    wrapper.
+
+    :raises qts.InvalidWrapperError: When called with an invalid wrapper.
+    """
+    return [
+        f"--always-{'true' if value else 'false'}={name}"
+        for name, value in conditions(wrapper=wrapper).items()
+    ]
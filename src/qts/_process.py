@@ -0,0 +1,224 @@
+import collections
+import concurrent.futures
+import multiprocessing.context
+import socket
+import threading
+import typing
+
+import typing_extensions
+
+import qts
+import qts._child
+from qts import QtCore
+from qts._executor import _Future, _FutureBase
+
+
+_P = typing_extensions.ParamSpec("_P")
+_T = typing.TypeVar("_T")
+
+
+class _ChainedFuture(_Future):
+    """Follows a future of the process pool, which completes in the pool's management
+    thread.
+    """
+
+    def __init__(
+        self,
+        done: typing.Callable[[_Future], None],
+        inner: "concurrent.futures.Future[typing.Any]",
+    ) -> None:
+        super().__init__(done=done)
+
+        self._inner = inner
+        inner.add_done_callback(self._copy)
+
+    def _copy(self, inner: "concurrent.futures.Future[typing.Any]") -> None:
+        if inner.cancelled():
+            _FutureBase.cancel(self)
+            self.set_running_or_notify_cancel()
+            return
+
+        error = inner.exception()
+        if error is None:
+            self.set_result(inner.result())
+        else:
+            self.set_exception(error)
+
+    def cancel(self) -> bool:
+        # Cancelling the inner future cancels this one through _copy().
+        return self._inner.cancel()
+
+    def running(self) -> bool:
+        # The pool marks the inner future as running when it sends the call to a
+        # worker, without any callback to follow it by.
+        return self._inner.running()
+
+
+class ProcessPoolExecutor(concurrent.futures.Executor):
+    """A :class:`concurrent.futures.Executor` running calls in a
+    :class:`concurrent.futures.ProcessPoolExecutor` for CPU bound work that would be
+    limited by the GIL in threads.
+
+    The wrapper selected in this process, if any, is set in the worker processes
+    before the initializer runs so that importing Qt modules there skips
+    :func:`qts.autoset_wrapper`.  Done callbacks added to the returned futures run in
+    the thread that created the executor, usually the GUI thread.  Finished futures
+    are queued and a single byte is written to a socket pair watched by a
+    :class:`QtCore.QSocketNotifier` to wake that thread, no matter how many finish
+    before it handles them.  Callbacks added after that run immediately in the
+    calling thread.
+
+    :param max_workers: The number of worker processes.  Defaults to the number of
+        processors.
+    :param mp_context: The :mod:`multiprocessing` context to start workers with.
+    :param initializer: Called in each worker process after the wrapper is set.
+    :param initargs: The arguments passed to the initializer.
+    """
+
+    def __init__(
+        self,
+        max_workers: typing.Optional[int] = None,
+        mp_context: typing.Optional[multiprocessing.context.BaseContext] = None,
+        initializer: typing.Optional[typing.Callable[..., object]] = None,
+        initargs: typing.Tuple[object, ...] = (),
+    ) -> None:
+        wrapper_name = None if qts.wrapper is None else qts.wrapper.name
+
+        self.pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=qts._child.initialize,
+            initargs=(wrapper_name, initializer, initargs),
+        )
+
+        self._receiver, self._sender = socket.socketpair()
+        self._receiver.setblocking(False)
+        self._sender.setblocking(False)
+        self._notifier = QtCore.QSocketNotifier(
+            typing.cast(typing.Any, self._receiver.fileno()),
+            QtCore.QSocketNotifier.Type.Read,
+        )
+
+        def activated(*args: object) -> None:
+            self._deliver()
+
+        self._notifier.activated.connect(activated)
+
+        self._finished: typing.Deque[_Future] = collections.deque()
+        self._signalled = False
+        self._lock = threading.Lock()
+        self._futures: typing.Set[_Future] = set()
+        self._shutdown = False
+        self._thread_id = threading.get_ident()
+
+    def submit(
+        self,
+        __fn: typing.Callable[_P, _T],
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> "concurrent.futures.Future[_T]":
+        """Run ``fn(*args, **kwargs)`` in a worker process.  The function, arguments,
+        and result must be picklable.
+
+        :raises RuntimeError: When the executor has been shut down.
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit calls after shutdown")
+
+            inner = self.pool.submit(__fn, *args, **kwargs)
+            future = _ChainedFuture(done=self._future_done, inner=inner)
+            self._futures.add(future)
+
+        return future
+
+    def map(
+        self,
+        fn: typing.Callable[..., _T],
+        *iterables: typing.Iterable[typing.Any],
+        timeout: typing.Optional[float] = None,
+        chunksize: int = 1,
+    ) -> typing.Iterator[_T]:
+        """Like :meth:`concurrent.futures.ProcessPoolExecutor.map`, sending the calls
+        to the workers in chunks.  No done callbacks are involved.
+        """
+        return self.pool.map(fn, *iterables, timeout=timeout, chunksize=chunksize)
+
+    def pending(self) -> int:
+        """Get the number of calls that have been submitted and whose done callbacks
+        have not run yet.
+        """
+        return len(self._futures)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop accepting calls and stop the worker processes once the submitted calls
+        have finished.  The socket pair is closed once the done callbacks have run.
+
+        :param wait: Wait until the submitted calls have finished.  When called in
+            the thread that created the executor their done callbacks then run
+            before returning.  Otherwise they run later, when that thread handles
+            events.
+        :param cancel_futures: Cancel the calls that have not started.
+        """
+        with self._lock:
+            self._shutdown = True
+            futures = list(self._futures)
+
+        if cancel_futures:
+            for future in futures:
+                future.cancel()
+
+        self.pool.shutdown(wait=wait)
+
+        if wait and threading.get_ident() == self._thread_id:
+            # Every future has been queued as finished by now.  Delivering them here
+            # closes the socket pair rather than leaving it open until the event
+            # loop runs again, which it may never do.
+            self._deliver()
+            return
+
+        with self._lock:
+            idle = not self._futures
+        if idle:
+            self._close()
+
+    def _close(self) -> None:
+        if self._receiver.fileno() == -1:
+            return
+
+        self._notifier.setEnabled(False)
+        self._receiver.close()
+        self._sender.close()
+
+    def _future_done(self, future: _Future) -> None:
+        # Runs in the thread completing the future, usually the pool's management
+        # thread.
+        self._finished.append(future)
+
+        if not self._signalled:
+            self._signalled = True
+            try:
+                self._sender.send(b"\0")
+            except OSError:
+                # Full, which only happens when a byte is already waiting, or closed.
+                pass
+
+    def _deliver(self) -> None:
+        # The socket is drained before the flag is cleared so that a byte written for
+        # a future finishing meanwhile is not swallowed with the flag left set.  Such
+        # a future is in the queue, which is drained after the flag is cleared.
+        try:
+            self._receiver.recv(4096)
+        except OSError:
+            pass
+        self._signalled = False
+
+        finished = self._finished
+        while finished:
+            future = finished.popleft()
+            with self._lock:
+                self._futures.discard(future)
+            future._run_callbacks()
+
+        if self._shutdown and not self._futures:
+            self._close()
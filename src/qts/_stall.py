@@ -0,0 +1,272 @@
+import bisect
+import sys
+import threading
+import time
+import traceback
+import typing
+
+import qts
+import qts._events
+import qts.diagnostics
+from qts import QtCore
+
+
+_heartbeat_event_type = qts._events.registered_event_type(
+    "qts.diagnostics.StallMonitor heartbeat"
+)
+
+
+class _Heartbeat(QtCore.QEvent):
+    def __init__(self, generation: int) -> None:
+        super().__init__(_heartbeat_event_type)
+        # The run of the monitor that posted the heartbeat, so that one still queued
+        # when the monitor is restarted is not measured against a new heartbeat.
+        self.generation = generation
+
+
+default_bounds = (
+    0.001,
+    0.002,
+    0.005,
+    0.01,
+    0.02,
+    0.05,
+    0.1,
+    0.2,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    float("inf"),
+)
+
+
+class StallMonitor(QtCore.QObject):
+    """Measures how responsive the event loop of the thread creating the monitor is,
+    usually the GUI thread.
+
+    While started, a watchdog thread posts a heartbeat event to the monitor and waits
+    for the event loop to handle it before posting the next one an interval later.
+    The time each heartbeat waited is counted in a histogram.  When a heartbeat
+    waits longer than the threshold the watchdog captures the Python stack of the
+    event loop thread with :func:`sys._current_frames`, and once the heartbeat is
+    handled the stall is recorded and :attr:`stall_detected` is emitted.  Only one
+    heartbeat is outstanding at a time so the overhead is one event per interval.
+
+    :param interval: The seconds between a heartbeat being handled and the next being
+        posted.
+    :param threshold: The heartbeat latency in seconds at which a stall is recorded.
+    :param max_stalls: The maximum number of stalls to keep.  Later stalls are
+        counted but not kept.
+    :param parent: The parent object.
+
+    :raises ValueError: When the interval or threshold are not positive or the
+        maximum number of stalls is negative.
+    """
+
+    stall_detected = QtCore.Signal(object)
+    """Emitted with the :class:`qts.diagnostics.Stall` when a stall ends."""
+
+    def __init__(
+        self,
+        interval: float = 0.05,
+        threshold: float = 0.2,
+        max_stalls: int = 100,
+        parent: typing.Optional[QtCore.QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+
+        if interval <= 0:
+            raise ValueError(f"The interval must be positive, got {interval}")
+        if threshold <= 0:
+            raise ValueError(f"The threshold must be positive, got {threshold}")
+        if max_stalls < 0:
+            raise ValueError(f"max_stalls must not be negative, got {max_stalls}")
+
+        self.interval = interval
+        self.threshold = threshold
+        self.max_stalls = max_stalls
+
+        self._bounds = default_bounds
+        self._counts = [0] * len(self._bounds)
+        self._max_latency = 0.0
+        self._stalls: typing.List[qts.diagnostics.Stall] = []
+        self._dropped_stalls = 0
+
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._posted_at: typing.Optional[float] = None
+        self._stack: typing.Optional[typing.Tuple[str, ...]] = None
+        self._thread_id = threading.get_ident()
+        self._started_at = 0.0
+        self._stopped_at: typing.Optional[float] = None
+        self._stop = threading.Event()
+        self._watchdog: typing.Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start monitoring, discarding anything recorded before.  Must be called in
+        the thread the monitor belongs to.
+
+        :raises RuntimeError: When already started.
+        """
+        if self.is_running():
+            raise RuntimeError("The monitor is already running")
+
+        self.reset()
+        with self._lock:
+            self._generation += 1
+        self._thread_id = threading.get_ident()
+        self._started_at = time.perf_counter()
+        self._stopped_at = None
+        self._stop.clear()
+        self._watchdog = threading.Thread(
+            target=self._watch, name="qts stall watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        """Stop monitoring.  What was recorded is kept for :meth:`report`."""
+        if self._watchdog is None:
+            return
+
+        self._stop.set()
+        self._watchdog.join()
+        self._watchdog = None
+        self._stopped_at = time.perf_counter()
+
+        with self._lock:
+            # A heartbeat still waiting to be handled is ignored.
+            self._posted_at = None
+            self._stack = None
+
+    def is_running(self) -> bool:
+        """Whether the watchdog is running."""
+        return self._watchdog is not None
+
+    def reset(self) -> None:
+        """Discard the latencies and stalls recorded so far."""
+        self._counts = [0] * len(self._bounds)
+        self._max_latency = 0.0
+        self._stalls = []
+        self._dropped_stalls = 0
+        self._started_at = time.perf_counter()
+
+    def report(self) -> qts.diagnostics.ResponsivenessReport:
+        """Get a report of what has been recorded.  A heartbeat that has waited longer
+        than the threshold without being handled is included as an ongoing stall.
+        """
+        now = time.perf_counter() if self._stopped_at is None else self._stopped_at
+        stalls = list(self._stalls)
+
+        with self._lock:
+            posted_at = self._posted_at
+            stack = self._stack
+
+        if (
+            self.is_running()
+            and posted_at is not None
+            and now - posted_at >= self.threshold
+        ):
+            stalls.append(
+                qts.diagnostics.Stall(
+                    start=posted_at - self._started_at,
+                    duration=now - posted_at,
+                    stack=stack or (),
+                    ongoing=True,
+                )
+            )
+
+        return qts.diagnostics.ResponsivenessReport(
+            wrapper_name=None if qts.wrapper is None else qts.wrapper.name,
+            duration=now - self._started_at,
+            interval=self.interval,
+            threshold=self.threshold,
+            bounds=self._bounds,
+            counts=tuple(self._counts),
+            max_latency=self._max_latency,
+            stalls=tuple(stalls),
+            dropped_stalls=self._dropped_stalls,
+        )
+
+    def _watch(self) -> None:
+        timeout = self.interval
+
+        while not self._stop.wait(timeout):
+            now = time.perf_counter()
+
+            with self._lock:
+                posted_at = self._posted_at
+                captured = self._stack is not None
+                generation = self._generation
+
+                if posted_at is None:
+                    self._posted_at = now
+
+            if posted_at is None:
+                QtCore.QCoreApplication.postEvent(
+                    self, _Heartbeat(generation=generation)
+                )
+                timeout = min(self.interval, self.threshold)
+                continue
+
+            remaining = posted_at + self.threshold - now
+            if captured:
+                timeout = self.interval
+            elif remaining > 0:
+                # Wake right when the threshold is crossed.
+                timeout = remaining
+            else:
+                self._capture(posted_at=posted_at)
+                timeout = self.interval
+
+    def _capture(self, posted_at: float) -> None:
+        frame = sys._current_frames().get(self._thread_id)
+        stack = () if frame is None else tuple(traceback.format_stack(frame))
+        del frame
+
+        with self._lock:
+            # The heartbeat may have been handled meanwhile.
+            if self._posted_at == posted_at:
+                self._stack = stack
+
+    def _beat(self, generation: int) -> None:
+        now = time.perf_counter()
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            posted_at = self._posted_at
+            stack = self._stack
+            self._posted_at = None
+            self._stack = None
+
+        if posted_at is None:
+            return
+
+        latency = now - posted_at
+        self._counts[bisect.bisect_left(self._bounds, latency)] += 1
+        if latency > self._max_latency:
+            self._max_latency = latency
+
+        if latency < self.threshold:
+            return
+
+        stall = qts.diagnostics.Stall(
+            start=posted_at - self._started_at,
+            duration=latency,
+            stack=stack or (),
+        )
+        if len(self._stalls) < self.max_stalls:
+            self._stalls.append(stall)
+        else:
+            self._dropped_stalls += 1
+
+        self.stall_detected.emit(stall)
+
+    def event(self, event: typing.Optional[QtCore.QEvent]) -> bool:
+        if isinstance(event, _Heartbeat):
+            self._beat(generation=event.generation)
+            return True
+
+        return super().event(event)
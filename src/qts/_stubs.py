@@ -0,0 +1,226 @@
+import ast
+import importlib
+import json
+import os
+import sys
+import types
+import typing
+
+import qts
+
+
+default_module_names = ["QtCore", "QtGui", "QtWidgets"]
+"""The Qt modules that have dedicated files in qts."""
+
+marker_name = ".qts-stubs.json"
+"""The file recording what the stubs in a directory were generated from."""
+
+package_name = "qts-stubs"
+"""The name of the generated stub only package, see :pep:`561`."""
+
+_signal_aliases = {
+    "PyQt": {"pyqtSignal": "Signal", "pyqtBoundSignal": "SignalInstance"},
+    "PySide": {},
+}
+"""Names in the wrapper that are provided under a different name by qts.QtCore."""
+
+
+def binding_version(wrapper: qts.Wrapper) -> str:
+    """Get the version of the passed wrapper along with the version of Qt it uses.
+    For example, ``"5.15.9 Qt 5.15.2"``.
+    """
+    core = importlib.import_module(f"{wrapper.module_name}.QtCore")
+
+    if wrapper.family == "PyQt":
+        version = core.PYQT_VERSION_STR
+    else:
+        version = importlib.import_module(wrapper.module_name).__version__
+
+    return f"{version} Qt {core.qVersion()}"
+
+
+def _stub_names(body: typing.Iterable[ast.stmt]) -> typing.Set[str]:
+    names: typing.Set[str] = set()
+
+    for node in body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.Assign):
+            names.update(
+                target.id for target in node.targets if isinstance(target, ast.Name)
+            )
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names.add(node.target.id)
+        elif isinstance(node, ast.ImportFrom):
+            # Only explicit re-exports are public in a stub.
+            names.update(
+                alias.name for alias in node.names if alias.asname == alias.name
+            )
+        elif isinstance(node, ast.If):
+            names.update(_stub_names(node.body))
+            names.update(_stub_names(node.orelse))
+        elif isinstance(node, ast.Try):
+            names.update(_stub_names(node.body))
+            for handler in node.handlers:
+                names.update(_stub_names(handler.body))
+
+    return names
+
+
+def public_names(module: types.ModuleType) -> typing.List[str]:
+    """Get the public names of a wrapper module.  When the wrapper ships a stub for
+    the module then the names defined by the stub are used so that the generated stub
+    does not reference anything the type checker can not find.  Otherwise the names
+    found at runtime are used.
+    """
+    module_file = getattr(module, "__file__", None)
+    stub_path = None
+    if module_file is not None:
+        stub_path = os.path.join(
+            os.path.dirname(module_file), f"{module.__name__.rpartition('.')[2]}.pyi"
+        )
+
+    if stub_path is not None and os.path.isfile(stub_path):
+        with open(stub_path, encoding="utf-8") as file:
+            names = _stub_names(ast.parse(file.read(), filename=stub_path).body)
+    else:
+        names = set(dir(module))
+
+    return sorted(name for name in names if not name.startswith("_"))
+
+
+def qt_module_stub(wrapper: qts.Wrapper, name: str, version: str) -> str:
+    """Build the consolidated stub for a Qt module, such as ``"QtCore"``, that
+    explicitly re-exports each name from the wrapper.
+
+    :raises ModuleNotFoundError: When the wrapper does not provide the module.
+    """
+    full_name = f"{wrapper.module_name}.{name}"
+    module = importlib.import_module(full_name)
+    aliases = _signal_aliases[wrapper.family] if name == "QtCore" else {}
+
+    lines = [
+        f"# Generated by qts stubs generate from {wrapper.name} {version}.",
+        "# Do not edit, regenerate instead.",
+        "",
+    ]
+    for public_name in public_names(module=module):
+        if public_name in aliases:
+            # Only same name imports are re-exported from a stub so the renamed
+            # aliases are assigned below.
+            lines.append(f"from {full_name} import {public_name} as _{public_name}")
+        else:
+            lines.append(f"from {full_name} import {public_name} as {public_name}")
+
+    lines.extend(f"{alias} = _{public_name}" for public_name, alias in aliases.items())
+
+    return "\n".join(lines) + "\n"
+
+
+def build(
+    wrapper: qts.Wrapper,
+    module_names: typing.Sequence[str] = default_module_names,
+) -> typing.Dict[str, str]:
+    """Build the stub files for qts using the passed wrapper.  The output is a partial
+    stub only package, ``qts-stubs``, with consolidated stubs for the Qt modules.
+    Type checkers resolve the rest of qts from the installed package.
+
+    :returns: The file contents by path relative to the output directory.
+    """
+    version = binding_version(wrapper=wrapper)
+    files = {f"{package_name}/py.typed": "partial\n"}
+
+    for name in module_names:
+        files[f"{package_name}/{name}.pyi"] = qt_module_stub(
+            wrapper=wrapper, name=name, version=version
+        )
+
+    return files
+
+
+def marker(
+    wrapper: qts.Wrapper,
+    module_names: typing.Sequence[str],
+) -> typing.Dict[str, object]:
+    """Get the values identifying a generation of stubs.  Stubs only need to be
+    regenerated when any of these change.
+    """
+    return {
+        "wrapper": wrapper.name,
+        "binding": binding_version(wrapper=wrapper),
+        "python": ".".join(str(part) for part in sys.version_info[:2]),
+        "qts": qts.__version__,
+        "modules": sorted(module_names),
+    }
+
+
+def read_marker(directory: str) -> typing.Optional[typing.Dict[str, object]]:
+    """Read the marker of previously generated stubs, if there is a valid one."""
+    try:
+        with open(os.path.join(directory, marker_name), encoding="utf-8") as file:
+            loaded = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(loaded, dict):
+        return None
+
+    return loaded
+
+
+def generate(
+    wrapper: qts.Wrapper,
+    directory: str,
+    module_names: typing.Sequence[str] = default_module_names,
+    force: bool = False,
+) -> typing.Optional[typing.List[str]]:
+    """Write the stubs for the passed wrapper to a directory.  Nothing is done if the
+    stubs were already generated from the same wrapper version, Python version, and
+    qts version.  Otherwise only files with changed content are written.
+
+    :param force: Regenerate even if the marker says the stubs are up to date.
+    :returns: The paths of the written files, or :data:`None` if the stubs were
+        already up to date.
+    """
+    new_marker = marker(wrapper=wrapper, module_names=module_names)
+
+    if not force and read_marker(directory=directory) == new_marker:
+        return None
+
+    files = {
+        os.path.join(directory, *relative_path.split("/")): content
+        for relative_path, content in build(
+            wrapper=wrapper, module_names=module_names
+        ).items()
+    }
+    written = []
+
+    for path, content in files.items():
+
+        try:
+            with open(path, encoding="utf-8") as file:
+                unchanged = file.read() == content
+        except OSError:
+            unchanged = False
+
+        if unchanged:
+            continue
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        written.append(path)
+
+    # Remove stubs left over from a previous generation, such as for a Qt module that
+    # is no longer requested.
+    package_directory = os.path.join(directory, package_name)
+    for name in os.listdir(package_directory):
+        path = os.path.join(package_directory, name)
+        if name.endswith(".pyi") and path not in files:
+            os.remove(path)
+
+    with open(os.path.join(directory, marker_name), "w", encoding="utf-8") as file:
+        json.dump(new_marker, file, indent=4)
+        file.write("\n")
+
+    return written
@@ -1,3 +1,6 @@
+import time
+import typing
+
 import attr
 
 
@@ -11,3 +14,31 @@ qt_modules = [
     QtModule(name="QtGui"),
     QtModule(name="QtWidgets"),
 ]
+
+
+def process_events_until(
+    condition: typing.Callable[[], bool], timeout: float = 5
+) -> None:
+    """Process events until the condition is met and fail if it is not met within
+    the timeout.
+    """
+    # Imported here since the wrapper is set by the conftest after this is imported.
+    from qts import QtCore
+
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        QtCore.QCoreApplication.processEvents()
+
+    assert condition()
+
+
+def process_events_for(seconds: float) -> None:
+    """Process events for a while, sleeping briefly in between so that timers come
+    due.
+    """
+    from qts import QtCore
+
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        QtCore.QCoreApplication.processEvents()
+        time.sleep(0.001)
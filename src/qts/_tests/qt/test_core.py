@@ -14,3 +14,8 @@ def test_bound_signal() -> None:
     #       attribute.
     destroyed = getattr(qt_object, "destroyed")
     assert isinstance(destroyed, QtCore.SignalInstance)
+
+
+def test_pyqt_signal_names_are_not_exposed() -> None:
+    assert not hasattr(QtCore, "pyqtSignal")
+    assert not hasattr(QtCore, "pyqtBoundSignal")
@@ -0,0 +1,195 @@
+import asyncio
+import selectors
+import socket
+import threading
+import time
+import typing
+
+import pytest
+
+import qts.util
+from qts import QtCore
+
+
+def test_run_returns_result() -> None:
+    async def main() -> int:
+        await asyncio.sleep(0)
+        return 42
+
+    assert qts.util.run(main()) == 42
+
+
+def test_run_raises() -> None:
+    async def main() -> None:
+        raise ZeroDivisionError()
+
+    with pytest.raises(ZeroDivisionError):
+        qts.util.run(main())
+
+
+def test_run_cancels_remaining_tasks() -> None:
+    cancelled = []
+
+    async def forever() -> None:
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def main() -> None:
+        asyncio.ensure_future(forever())
+        await asyncio.sleep(0)
+
+    qts.util.run(main())
+
+    assert cancelled == [True]
+
+
+def test_sleep_duration() -> None:
+    async def main() -> float:
+        start = time.monotonic()
+        await asyncio.sleep(0.05)
+        return time.monotonic() - start
+
+    assert 0.04 <= qts.util.run(main()) < 1
+
+
+def test_qt_timer_runs_while_waiting() -> None:
+    fired: typing.List[bool] = []
+
+    async def main() -> None:
+        QtCore.QTimer.singleShot(10, lambda: fired.append(True))
+        await asyncio.sleep(0.1)
+
+    qts.util.run(main())
+
+    assert fired == [True]
+
+
+def test_task_created_from_qt_slot_runs_promptly() -> None:
+    done = []
+
+    async def work() -> None:
+        done.append(time.monotonic())
+
+    def slot() -> None:
+        asyncio.ensure_future(work())
+
+    async def main() -> float:
+        QtCore.QTimer.singleShot(0, slot)
+        start = time.monotonic()
+        # Long enough that waiting for this timeout would fail the assertion.
+        while not done and time.monotonic() - start < 5:
+            await asyncio.sleep(1)
+        return done[0] - start
+
+    assert qts.util.run(main()) < 0.5
+
+
+def test_call_soon_threadsafe_wakes() -> None:
+    async def main() -> float:
+        loop = asyncio.get_event_loop()
+        future: "asyncio.Future[float]" = loop.create_future()
+
+        def resolve() -> None:
+            future.set_result(time.monotonic())
+
+        thread = threading.Timer(0.05, lambda: loop.call_soon_threadsafe(resolve))
+        start = time.monotonic()
+        thread.start()
+        resolved = await asyncio.wait_for(future, timeout=5)
+        thread.join()
+        return resolved - start
+
+    assert qts.util.run(main()) < 0.5
+
+
+def test_socket_echo() -> None:
+    payload = bytes(range(256)) * 4096
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+        writer.close()
+
+    async def main() -> bytes:
+        server = await asyncio.start_server(handle, host="127.0.0.1", port=0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection(host="127.0.0.1", port=port)
+
+        async def send() -> None:
+            writer.write(payload)
+            await writer.drain()
+            writer.write_eof()
+
+        sender = asyncio.ensure_future(send())
+        received = await reader.read(-1)
+        await sender
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return received
+
+    assert qts.util.run(main()) == payload
+
+
+def test_selector_reports_readiness() -> None:
+    selector = qts.util.QtSelector()
+    left, right = socket.socketpair()
+    try:
+        key = selector.register(left, selectors.EVENT_READ, data="left")
+
+        assert selector.get_map()[left] is key
+        assert selector.select(timeout=0) == []
+
+        right.send(b"x")
+
+        assert selector.select(timeout=1) == [(key, selectors.EVENT_READ)]
+
+        selector.unregister(left)
+
+        assert len(selector.get_map()) == 0
+    finally:
+        selector.close()
+        left.close()
+        right.close()
+
+
+def test_selector_timeout() -> None:
+    selector = qts.util.QtSelector()
+    try:
+        start = time.monotonic()
+        assert selector.select(timeout=0.05) == []
+        assert time.monotonic() - start >= 0.04
+    finally:
+        selector.close()
+
+
+def test_selector_rejects_duplicate_registration() -> None:
+    selector = qts.util.QtSelector()
+    left, right = socket.socketpair()
+    try:
+        selector.register(left, selectors.EVENT_READ)
+
+        with pytest.raises(KeyError):
+            selector.register(left, selectors.EVENT_WRITE)
+    finally:
+        selector.close()
+        left.close()
+        right.close()
+
+
+def test_policy_creates_qt_event_loop() -> None:
+    policy = qts.util.QtEventLoopPolicy()
+    loop = policy.new_event_loop()
+    try:
+        assert isinstance(loop, qts.util.QtEventLoop)
+    finally:
+        loop.close()
@@ -0,0 +1,50 @@
+import json
+import os
+import pathlib
+import typing
+
+import pytest
+
+import qts
+import qts._benchmarks.coldstart
+import qts._benchmarks.runtime
+
+
+@pytest.mark.parametrize(
+    argnames=["values", "percent", "expected"],
+    argvalues=[
+        [[3], 95, 3],
+        [[4, 1, 3, 2], 50, 2],
+        [[4, 1, 3, 2], 95, 4],
+        [list(range(1, 101)), 95, 95],
+        [list(range(1, 101)), 0, 1],
+    ],
+)
+def test_percentile(
+    values: typing.List[float], percent: float, expected: float
+) -> None:
+    assert qts._benchmarks.coldstart.percentile(values, percent) == expected
+
+
+def test_percentile_requires_values() -> None:
+    with pytest.raises(ValueError):
+        qts._benchmarks.coldstart.percentile([], 95)
+
+
+def test_runtime_results_per_wrapper(tmp_path: pathlib.Path) -> None:
+    wrapper = qts.available_wrapper()
+
+    results = qts._benchmarks.runtime.run_wrapper(wrapper=wrapper, scale=0.001)
+    path = qts._benchmarks.runtime.write_results(
+        results=results, directory=os.fspath(tmp_path)
+    )
+
+    assert results["wrapper"] == wrapper.name
+    assert results["qpa_platform"] == "offscreen"
+    seconds_per_operation = typing.cast(
+        typing.Dict[str, float], results["seconds_per_operation"]
+    )
+    assert seconds_per_operation.keys() == qts._benchmarks.runtime.benchmarks.keys()
+    assert all(seconds > 0 for seconds in seconds_per_operation.values())
+    assert pathlib.Path(path).name == f"runtime-{wrapper.name}.json"
+    assert json.loads(pathlib.Path(path).read_text(encoding="utf-8")) == results
@@ -0,0 +1,117 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import qts._cache
+
+
+@pytest.fixture(name="cache_directory")
+def cache_directory_fixture(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> pathlib.Path:
+    monkeypatch.setenv(qts._cache.directory_environment_variable, os.fspath(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    argnames=["value", "expected"],
+    argvalues=[["1", True], ["true", True], ["0", False], ["", False]],
+)
+def test_enabled(value: str, expected: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(qts._cache.environment_variable, value)
+    assert qts._cache.enabled() == expected
+
+
+def test_store_and_load_round_trip(cache_directory: pathlib.Path) -> None:
+    installed = {"PySide6": False, "PyQt5": True}
+    qts._cache.store(installed=installed)
+
+    assert qts._cache.paths() == [qts._cache.path()]
+    assert qts._cache.load() == installed
+
+
+def test_load_ignores_changed_fingerprint(
+    cache_directory: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    qts._cache.store(installed={"PyQt5": True})
+    path = qts._cache.path()
+
+    monkeypatch.setattr(qts._cache, "fingerprint", lambda: ["path 0 changed"])
+
+    assert qts._cache.path() == path
+    assert qts._cache.load() == {}
+
+
+def test_modification_time_makes_fingerprint_stale(tmp_path: pathlib.Path) -> None:
+    fingerprint = qts._cache.fingerprint(entries=[os.fspath(tmp_path)])
+    assert qts._cache.is_current(fingerprint_lines=fingerprint)
+
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert not qts._cache.is_current(fingerprint_lines=fingerprint)
+
+
+def test_load_ignores_invalid_file(cache_directory: pathlib.Path) -> None:
+    pathlib.Path(qts._cache.path()).write_text("not a cache\n", encoding="utf-8")
+
+    assert qts._cache.load() == {}
+
+
+def test_clear_removes_files(cache_directory: pathlib.Path) -> None:
+    qts._cache.store(installed={"PyQt5": True})
+    path = qts._cache.path()
+
+    assert qts._cache.clear() == [path]
+    assert qts._cache.paths() == []
+
+
+def test_autoset_wrapper_uses_persistent_cache(tmp_path: pathlib.Path) -> None:
+    cache_directory = tmp_path / "cache"
+    working_directory = tmp_path / "working"
+    working_directory.mkdir()
+
+    env = {
+        **os.environ,
+        qts._cache.environment_variable: "1",
+        qts._cache.directory_environment_variable: os.fspath(cache_directory),
+    }
+    env.pop("QTS_WRAPPER", None)
+
+    script = """
+import importlib.util
+
+import qts
+
+probed = []
+original_find_spec = importlib.util.find_spec
+
+
+def counting_find_spec(name, *args, **kwargs):
+    probed.append(name)
+    return original_find_spec(name, *args, **kwargs)
+
+
+importlib.util.find_spec = counting_find_spec
+qts.autoset_wrapper()
+print(len(probed))
+"""
+
+    def probes() -> int:
+        completed_process = subprocess.run(
+            args=[sys.executable, "-c", script],
+            check=True,
+            cwd=working_directory,
+            encoding="utf-8",
+            env=env,
+            stdout=subprocess.PIPE,
+        )
+        return int(completed_process.stdout)
+
+    assert probes() > 0
+    assert len(list(cache_directory.iterdir())) == 1
+    assert probes() == 0
@@ -0,0 +1,93 @@
+import threading
+import time
+import typing
+
+import pytest
+
+import qts._tests
+import qts.util
+
+
+def test_runs_in_order() -> None:
+    queue = qts.util.CallQueue()
+    results: typing.List[int] = []
+
+    for value in range(10):
+        queue.post(results.append, value)
+    qts._tests.process_events_until(lambda: queue.pending() == 0)
+
+    assert results == list(range(10))
+    assert queue.executed == 10
+
+
+def test_keyed_calls_coalesce() -> None:
+    queue = qts.util.CallQueue()
+    results: typing.List[typing.Tuple[str, int]] = []
+
+    def record(name: str, value: int) -> None:
+        results.append((name, value))
+
+    queue.post(record, "a", 1, key="a")
+    queue.post(record, "b", 1)
+    queue.post(record, "a", 2, key="a")
+    queue.post(record, "a", 3, key="a")
+    queue.drain()
+
+    assert results == [("a", 3), ("b", 1)]
+    assert queue.coalesced == 2
+
+    queue.post(record, "a", 4, key="a")
+    queue.drain()
+
+    assert results[-1] == ("a", 4)
+
+
+def test_time_slice() -> None:
+    queue = qts.util.CallQueue()
+
+    for _ in range(10):
+        queue.post(time.sleep, 0.01)
+
+    assert not queue.drain(time_limit=0.015)
+    assert 0 < queue.pending() < 10
+
+    qts._tests.process_events_until(lambda: queue.pending() == 0)
+
+
+def test_exceptions_are_reported(monkeypatch: pytest.MonkeyPatch) -> None:
+    queue = qts.util.CallQueue()
+    reported: typing.List[BaseException] = []
+    results: typing.List[int] = []
+    monkeypatch.setattr(
+        "sys.excepthook", lambda type, value, traceback: reported.append(value)
+    )
+
+    queue.post(int, "not a number")
+    queue.post(results.append, 1)
+    queue.drain()
+
+    assert [type(error) for error in reported] == [ValueError]
+    assert results == [1]
+
+
+def test_posts_from_threads() -> None:
+    queue = qts.util.CallQueue()
+    main_thread = threading.get_ident()
+    results: typing.List[typing.Tuple[int, int]] = []
+
+    def record(value: int) -> None:
+        results.append((threading.get_ident(), value))
+
+    def post_all() -> None:
+        for value in range(1000):
+            queue.post(record, value)
+
+    threads = [threading.Thread(target=post_all) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    qts._tests.process_events_until(lambda: len(results) == 4000)
+
+    assert {thread for thread, value in results} == {main_thread}
+    assert sorted(value for thread, value in results) == sorted([*range(1000)] * 4)
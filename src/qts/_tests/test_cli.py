@@ -1,3 +1,4 @@
+import json
 import os
 import pathlib
 import subprocess
@@ -133,3 +134,150 @@ def test_(
     results = completed_process.stdout.strip().split(delimiter_result)
 
     assert results == expected_result
+
+
+def test_all_json_matches_each_wrapper(launch_command: typing.List[str]) -> None:
+    completed_process = subprocess.run(
+        args=[*launch_command, "mypy", "args", "--all", "--json"],
+        check=True,
+        encoding="utf-8",
+        stdout=subprocess.PIPE,
+    )
+
+    arguments_by_name = json.loads(completed_process.stdout)
+
+    assert list(arguments_by_name) == [
+        wrapper.name for wrapper in qts.supported_wrappers
+    ]
+    for wrapper in qts.supported_wrappers:
+        completed_process = subprocess.run(
+            args=[*launch_command, "mypy", "args", "--wrapper", wrapper.name, "--json"],
+            check=True,
+            encoding="utf-8",
+            stdout=subprocess.PIPE,
+        )
+        assert arguments_by_name[wrapper.name] == json.loads(completed_process.stdout)
+
+
+def test_all_shell_assignments(launch_command: typing.List[str]) -> None:
+    completed_process = subprocess.run(
+        args=[*launch_command, "mypy", "args", "--all"],
+        check=True,
+        encoding="utf-8",
+        stdout=subprocess.PIPE,
+    )
+
+    lines = completed_process.stdout.splitlines()
+
+    assert lines[3] == (
+        "QTS_MYPY_ARGUMENTS_PYQT5='--always-true=is_pyqt_5_wrapper"
+        " --always-false=is_pyqt_6_wrapper --always-false=is_pyside_5_wrapper"
+        " --always-false=is_pyside_6_wrapper'"
+    )
+    assert [line.partition("=")[0] for line in lines] == [
+        f"QTS_MYPY_ARGUMENTS_{wrapper.name.upper()}"
+        for wrapper in qts.supported_wrappers
+    ]
+
+
+def test_all_and_wrapper_are_exclusive(launch_command: typing.List[str]) -> None:
+    completed_process = subprocess.run(
+        args=[*launch_command, "mypy", "args", "--all", "--wrapper", "pyqt5"],
+        encoding="utf-8",
+        stderr=subprocess.PIPE,
+    )
+
+    assert completed_process.returncode != 0
+    assert "mutually exclusive" in completed_process.stderr
+
+
+def test_cache_show_and_clear(
+    launch_command: typing.List[str],
+    tmp_path: pathlib.Path,
+) -> None:
+    env = {
+        **os.environ,
+        "QTS_CACHE_DIR": os.fspath(tmp_path),
+        "QTS_DISCOVERY_CACHE": "1",
+    }
+    subprocess.run(
+        args=[sys.executable, "-c", "import qts; qts.available_wrappers()"],
+        check=True,
+        env=env,
+    )
+    [path] = tmp_path.iterdir()
+
+    completed_process = subprocess.run(
+        args=[*launch_command, "cache", "show"],
+        check=True,
+        encoding="utf-8",
+        env=env,
+        stdout=subprocess.PIPE,
+    )
+    assert os.fspath(path) in completed_process.stdout
+    assert f"{qts.available_wrapper().module_name}: installed" in (
+        completed_process.stdout
+    )
+
+    completed_process = subprocess.run(
+        args=[*launch_command, "cache", "clear"],
+        check=True,
+        encoding="utf-8",
+        env=env,
+        stdout=subprocess.PIPE,
+    )
+    assert f"Removed {os.fspath(path)}" in completed_process.stdout
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_diagnostics_imports_json(launch_command: typing.List[str]) -> None:
+    wrapper = qts.available_wrapper()
+    completed_process = subprocess.run(
+        args=[
+            *launch_command,
+            "diagnostics",
+            "imports",
+            "--json",
+            "--wrapper",
+            wrapper.name,
+        ],
+        check=True,
+        encoding="utf-8",
+        stdout=subprocess.PIPE,
+    )
+
+    report = json.loads(completed_process.stdout)
+
+    assert report["wrapper"] == wrapper.name
+    assert [
+        phase["detail"] for phase in report["phases"] if phase["phase"] == "import"
+    ] == [f"{wrapper.module_name}.{name}" for name in ["QtCore", "QtGui", "QtWidgets"]]
+
+
+def test_bench_import_json(launch_command: typing.List[str]) -> None:
+    wrapper = qts.available_wrapper()
+    completed_process = subprocess.run(
+        args=[
+            *launch_command,
+            "bench",
+            "import",
+            "--json",
+            "--runs",
+            "3",
+            "--jobs",
+            "2",
+            "--wrapper",
+            wrapper.name,
+        ],
+        check=True,
+        encoding="utf-8",
+        stdout=subprocess.PIPE,
+    )
+
+    [result] = json.loads(completed_process.stdout)
+
+    assert result["wrapper"] == wrapper.name
+    assert result["runs"] == 3
+    import_seconds = result["import_seconds"]
+    assert 0 < import_seconds["min"] <= import_seconds["median"]
+    assert import_seconds["median"] <= import_seconds["p95"] <= import_seconds["max"]
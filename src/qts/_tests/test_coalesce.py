@@ -0,0 +1,168 @@
+import time
+import typing
+
+import pytest
+
+import qts._tests
+import qts.util
+from qts import QtCore
+
+
+class Emitter(QtCore.QObject):
+    signal = QtCore.Signal(int)
+    pair = QtCore.Signal(int, str)
+
+
+def test_latest() -> None:
+    emitter = Emitter()
+    coalescer = qts.util.Coalescer(emitter.signal, mode="latest", interval=0.05)
+    received: typing.List[int] = []
+    coalescer.add_slot(received.append)
+
+    for value in range(100):
+        emitter.signal.emit(value)
+    qts._tests.process_events_for(0.02)
+
+    assert received == [99]
+    assert coalescer.received == 100
+    assert coalescer.deliveries == 1
+
+
+def test_latest_limits_rate() -> None:
+    emitter = Emitter()
+    coalescer = qts.util.Coalescer(emitter.signal, mode="latest", interval=0.1)
+    received: typing.List[int] = []
+    coalescer.add_slot(received.append)
+
+    emitter.signal.emit(1)
+    qts._tests.process_events_for(0.02)
+    emitter.signal.emit(2)
+    qts._tests.process_events_for(0.02)
+
+    assert received == [1]
+
+    qts._tests.process_events_for(0.15)
+
+    assert received == [1, 2]
+
+
+def test_batch_multiple_arguments() -> None:
+    emitter = Emitter()
+    coalescer = qts.util.Coalescer(emitter.pair, mode="batch", interval=0.01)
+    received: typing.List[typing.List[typing.Tuple[int, str]]] = []
+    coalescer.add_slot(received.append)
+
+    emitter.pair.emit(1, "a")
+    emitter.pair.emit(2, "b")
+    qts._tests.process_events_for(0.05)
+
+    assert received == [[(1, "a"), (2, "b")]]
+
+
+@pytest.mark.parametrize(
+    argnames=["leading", "trailing", "expected"],
+    argvalues=[
+        [False, True, [9]],
+        [True, False, [0]],
+        [True, True, [0, 9]],
+    ],
+)
+def test_debounce(leading: bool, trailing: bool, expected: typing.List[int]) -> None:
+    emitter = Emitter()
+    coalescer = qts.util.Coalescer(
+        emitter.signal,
+        mode="debounce",
+        interval=0.2,
+        leading=leading,
+        trailing=trailing,
+    )
+    received: typing.List[int] = []
+    coalescer.add_slot(received.append)
+
+    for value in range(10):
+        emitter.signal.emit(value)
+        qts._tests.process_events_for(0.01)
+
+    assert received == (expected[:1] if leading else [])
+
+    qts._tests.process_events_for(0.3)
+
+    assert received == expected
+
+
+def test_flush_and_close() -> None:
+    emitter = Emitter()
+    coalescer = qts.util.Coalescer(emitter.signal, mode="latest", interval=10)
+    received: typing.List[int] = []
+    coalescer.add_slot(received.append)
+
+    emitter.signal.emit(1)
+    coalescer.flush()
+    emitter.signal.emit(2)
+    coalescer.close()
+    emitter.signal.emit(3)
+    qts._tests.process_events_for(0.02)
+
+    assert received == [1]
+
+
+def test_invalid_mode() -> None:
+    emitter = Emitter()
+
+    with pytest.raises(ValueError, match="Unknown mode"):
+        qts.util.Coalescer(emitter.signal, mode="fastest")  # type: ignore[arg-type]
+
+
+def test_cross_thread_emissions() -> None:
+    emitter = Emitter()
+    coalescer = qts.util.Coalescer(emitter.signal, mode="batch", interval=0.01)
+    received: typing.List[int] = []
+    coalescer.add_slot(received.extend)
+
+    def emit_all() -> None:
+        for value in range(500):
+            emitter.signal.emit(value)
+
+    thread = QtCore.QThread()
+    emitter.moveToThread(thread)
+    thread.started.connect(emit_all)
+    thread.start()
+    try:
+        deadline = time.monotonic() + 5
+        while len(received) < 500 and time.monotonic() < deadline:
+            qts._tests.process_events_for(0.01)
+    finally:
+        thread.quit()
+        thread.wait()
+
+    assert received == list(range(500))
+    assert coalescer.deliveries < 500
+
+
+def test_consecutive_threads() -> None:
+    import qts._coalesce
+
+    before = set(qts._coalesce._schedulers)
+    received: typing.List[int] = []
+
+    class Worker(QtCore.QThread):
+        def __init__(self, value: int) -> None:
+            super().__init__()
+            self.value = value
+
+        def run(self) -> None:
+            emitter = Emitter()
+            coalescer = qts.util.Coalescer(emitter.signal, mode="latest", interval=0)
+            coalescer.add_slot(received.append)
+            emitter.signal.emit(self.value)
+            qts._tests.process_events_for(0.05)
+
+    # The identifiers of finished threads are reused by later threads.
+    for value in range(5):
+        worker = Worker(value)
+        worker.start()
+        worker.wait()
+
+    assert received == list(range(5))
+    # The schedulers of the finished threads were dropped.
+    assert set(qts._coalesce._schedulers) <= before
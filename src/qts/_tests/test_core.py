@@ -1,4 +1,6 @@
+import copy
 import os
+import pickle
 import typing
 
 import pytest
@@ -330,3 +332,254 @@ def test_autoset_wrapper_uses_already_imported(
     pytester.makepyfile(content)
     run_result = pytester.runpytest_subprocess()
     run_result.assert_outcomes(passed=1)
+
+
+def test_autoset_wrapper_stops_probing_at_first_available(
+    pytester: pytest.Pytester,
+) -> None:
+    content = f"""
+    import importlib.util
+
+    import qts
+
+
+    original_find_spec = importlib.util.find_spec
+    probed = []
+
+
+    def counting_find_spec(name, *args, **kwargs):
+        probed.append(name)
+        return original_find_spec(name, *args, **kwargs)
+
+
+    def test():
+        installed = [
+            wrapper.module_name
+            for wrapper in qts.supported_wrappers
+            if original_find_spec(wrapper.module_name) is not None
+        ]
+        first = installed[0]
+        expected = [wrapper.module_name for wrapper in qts.supported_wrappers]
+        expected = expected[:expected.index(first) + 1]
+
+        importlib.util.find_spec = counting_find_spec
+        qts.autoset_wrapper()
+
+        assert qts.wrapper.module_name == first
+        assert probed == expected
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+def test_autoset_wrapper_does_not_probe_with_environment_variable(
+    pytester: pytest.Pytester,
+    wrapper: qts.Wrapper,
+) -> None:
+    content = f"""
+    import importlib.util
+    import os
+
+    import qts
+
+
+    def test():
+        probed = []
+        importlib.util.find_spec = lambda name, *args, **kwargs: probed.append(name)
+        os.environ["QTS_WRAPPER"] = {wrapper.name!r}
+        qts.autoset_wrapper()
+        assert probed == []
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+def test_inherit_wrapper_sets_environment_only_in_context(
+    pytester: pytest.Pytester,
+    wrapper: qts.Wrapper,
+) -> None:
+    content = f"""
+    import os
+
+    import qts
+
+
+    def test():
+        os.environ.pop("QTS_INHERITED_WRAPPER", None)
+        qts.set_wrapper(qts.wrapper_by_name(name={wrapper.name!r}))
+        assert "QTS_INHERITED_WRAPPER" not in os.environ
+
+        with qts.inherit_wrapper():
+            assert os.environ["QTS_INHERITED_WRAPPER"] == {wrapper.name!r}
+
+        assert "QTS_INHERITED_WRAPPER" not in os.environ
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+def test_autoset_wrapper_uses_inherited_wrapper_in_spawned_children(
+    pytester: pytest.Pytester,
+    wrapper: qts.Wrapper,
+) -> None:
+    content = f"""
+    import concurrent.futures
+    import importlib.util
+    import multiprocessing
+    import os
+
+    import qts
+
+
+    def child():
+        probed = []
+        original_find_spec = importlib.util.find_spec
+
+        def counting_find_spec(name, *args, **kwargs):
+            probed.append(name)
+            return original_find_spec(name, *args, **kwargs)
+
+        importlib.util.find_spec = counting_find_spec
+        qts.autoset_wrapper()
+        return qts.wrapper.name, probed, "QTS_INHERITED_WRAPPER" in os.environ
+
+
+    def test():
+        os.environ.pop("QTS_WRAPPER", None)
+        qts.set_wrapper(qts.wrapper_by_name(name={wrapper.name!r}))
+
+        with qts.inherit_wrapper(), concurrent.futures.ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            name, probed, passed_on = executor.submit(child).result(timeout=60)
+
+        assert name == {wrapper.name!r}
+        assert probed == [{wrapper.module_name!r}]
+        # Consumed so it is not passed on to unrelated grandchildren.
+        assert not passed_on
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+def test_autoset_wrapper_ignores_uninstalled_inherited_wrapper(
+    pytester: pytest.Pytester,
+) -> None:
+    content = f"""
+    import importlib.util
+    import os
+
+    import pytest
+
+    import qts
+
+
+    def test():
+        missing = [
+            wrapper
+            for wrapper in qts.supported_wrappers
+            if importlib.util.find_spec(wrapper.module_name) is None
+        ]
+        if len(missing) == 0:
+            pytest.skip("All supported wrappers are installed")
+
+        os.environ.pop("QTS_WRAPPER", None)
+        os.environ["QTS_INHERITED_WRAPPER"] = missing[0].name
+        qts.invalidate_caches()
+        qts.autoset_wrapper()
+
+        assert qts.wrapper not in missing
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+def test_probes_are_memoized_until_invalidated(
+    pytester: pytest.Pytester,
+) -> None:
+    content = f"""
+    import importlib.util
+
+    import qts
+
+
+    original_find_spec = importlib.util.find_spec
+    probed = []
+
+
+    def counting_find_spec(name, *args, **kwargs):
+        probed.append(name)
+        return original_find_spec(name, *args, **kwargs)
+
+
+    def test():
+        importlib.util.find_spec = counting_find_spec
+
+        qts.available_wrappers()
+        assert len(probed) == len(qts.supported_wrappers)
+
+        qts.available_wrappers()
+        qts.an_available_wrapper()
+        assert len(probed) == len(qts.supported_wrappers)
+
+        qts.invalidate_caches()
+        qts.available_wrappers()
+        assert len(probed) == 2 * len(qts.supported_wrappers)
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+@pytest.mark.parametrize(argnames=["module_name"], argvalues=[["PyQt3"], ["PySide9"]])
+def test_check_already_imported_wrappers_exhaustive_finds_unknown(
+    module_name: str,
+    pytester: pytest.Pytester,
+) -> None:
+    content = f"""
+    import sys
+
+    import pytest
+
+    import qts
+
+    sys.modules[{module_name!r}] = None
+
+    def test():
+        assert qts.check_already_imported_wrappers() == []
+        with pytest.raises(qts.UnsupportedWrappersError, match={module_name!r}):
+            qts.check_already_imported_wrappers(exhaustive=True)
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+def test_wrapper_is_immutable(any_wrapper: qts.Wrapper) -> None:
+    with pytest.raises(AttributeError, match="frozen"):
+        setattr(any_wrapper, "name", "other")
+
+
+@pytest.mark.parametrize(
+    argnames=["duplicate"],
+    argvalues=[
+        [copy.copy],
+        [copy.deepcopy],
+        [lambda wrapper: pickle.loads(pickle.dumps(wrapper))],
+    ],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_wrapper_can_be_duplicated(
+    any_wrapper: qts.Wrapper,
+    duplicate: typing.Callable[[qts.Wrapper], qts.Wrapper],
+) -> None:
+    duplicated = duplicate(any_wrapper)
+
+    assert duplicated == any_wrapper
+    assert hash(duplicated) == hash(any_wrapper)
+    assert repr(duplicated) == repr(any_wrapper)
@@ -0,0 +1,112 @@
+import json
+import typing
+
+import pytest
+
+import qts
+import qts._timing
+import qts.diagnostics
+
+
+def test_autoset_phases_are_recorded(pytester: pytest.Pytester) -> None:
+    content = """
+    import importlib
+    import os
+
+    import qts
+    import qts.diagnostics
+
+
+    def test():
+        os.environ.pop("QTS_WRAPPER", None)
+        qts.autoset_wrapper()
+        importlib.import_module("qts.QtCore")
+
+        report = qts.diagnostics.import_report()
+        phases = [timing.phase for timing in report.phases]
+        assert phases[:2] == ["environment", "sys.modules"]
+        assert "find_spec" in phases
+        [timing] = [timing for timing in report.phases if timing.phase == "import"]
+        assert timing.detail == f"{qts.wrapper.module_name}.QtCore"
+        assert timing.duration > 0
+        assert report.wrapper_name == qts.wrapper.name
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+def test_set_wrapper_skips_probes(pytester: pytest.Pytester) -> None:
+    content = """
+    import importlib
+
+    import qts
+    import qts.diagnostics
+
+
+    def test():
+        qts.set_wrapper(qts.available_wrapper())
+        qts.diagnostics.reset()
+        importlib.import_module("qts.QtGui")
+
+        report = qts.diagnostics.import_report()
+        details = [timing.detail for timing in report.phases]
+        assert "find_spec" not in [timing.phase for timing in report.phases]
+        assert f"{qts.wrapper.module_name}.QtGui" in details
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+def test_reset_discards_phases() -> None:
+    qts.available_wrappers()
+    qts.diagnostics.reset()
+
+    assert qts.diagnostics.import_report().phases == ()
+
+
+def test_only_recent_phases_are_kept() -> None:
+    qts.diagnostics.reset()
+    try:
+        for index in range(qts._timing.max_records + 1):
+            with qts._timing.timed(phase="test", detail=str(index)):
+                pass
+
+        phases = qts.diagnostics.import_report().phases
+        assert len(phases) == qts._timing.max_records
+        assert phases[0].detail == "1"
+        assert phases[-1].detail == str(qts._timing.max_records)
+    finally:
+        qts.diagnostics.reset()
+
+
+def test_report_to_json() -> None:
+    report = qts.diagnostics.ImportReport(
+        wrapper_name="PyQt5",
+        phases=(
+            qts.diagnostics.PhaseTiming(
+                phase="find_spec", detail="PyQt5", start=0.5, duration=0.25
+            ),
+            qts.diagnostics.PhaseTiming(
+                phase="find_spec", detail="PySide6", start=0.75, duration=0.5
+            ),
+            qts.diagnostics.PhaseTiming(
+                phase="import", detail="PyQt5.QtCore", start=1.25, duration=2
+            ),
+        ),
+    )
+
+    loaded: typing.Dict[str, object] = json.loads(report.to_json())
+
+    assert loaded == {
+        "wrapper": "PyQt5",
+        "phases": [
+            {"phase": "find_spec", "detail": "PyQt5", "start": 0.5, "duration": 0.25},
+            {"phase": "find_spec", "detail": "PySide6", "start": 0.75, "duration": 0.5},
+            {"phase": "import", "detail": "PyQt5.QtCore", "start": 1.25, "duration": 2},
+        ],
+        "totals": {"find_spec": 0.75, "import": 2},
+    }
+    assert report.total() == 2.75
+    assert report.total(phase="find_spec") == 0.75
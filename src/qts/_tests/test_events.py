@@ -0,0 +1,28 @@
+import qts._asyncio
+import qts._calls
+import qts._events
+import qts._stall
+from qts import QtCore
+
+
+def test_registered_once_per_purpose() -> None:
+    first = qts._events.registered_event_type("qts._tests first")
+    second = qts._events.registered_event_type("qts._tests second")
+
+    assert qts._events.registered_event_type("qts._tests first") == first
+    assert first != second
+
+
+def test_internal_types_are_registered() -> None:
+    event_types = {
+        qts._asyncio._wake_event_type,
+        qts._calls._drain_event_type,
+        qts._stall._heartbeat_event_type,
+    }
+
+    assert len(event_types) == 3
+    assert QtCore.QEvent.Type.User not in event_types
+    assert all(
+        QtCore.QEvent.Type.User < event_type <= QtCore.QEvent.Type.MaxUser
+        for event_type in event_types
+    )
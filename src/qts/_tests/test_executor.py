@@ -0,0 +1,155 @@
+import concurrent.futures
+import threading
+import time
+import typing
+
+import pytest
+
+import qts._tests
+import qts.util
+from qts import QtCore
+
+
+def test_result() -> None:
+    executor = qts.util.ThreadPoolExecutor(max_workers=2)
+
+    future = executor.submit(pow, 2, 10)
+
+    assert future.result(timeout=5) == 1024
+    executor.shutdown()
+
+
+def test_exception() -> None:
+    executor = qts.util.ThreadPoolExecutor(max_workers=1)
+
+    future = executor.submit(divmod, 1, 0)
+
+    with pytest.raises(ZeroDivisionError):
+        future.result(timeout=5)
+    executor.shutdown()
+
+
+def test_map() -> None:
+    with qts.util.ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(abs, [-1, -2, 3])) == [1, 2, 3]
+
+
+def test_done_callbacks_run_in_creating_thread() -> None:
+    executor = qts.util.ThreadPoolExecutor(max_workers=2)
+    threads: typing.List[threading.Thread] = []
+
+    future = executor.submit(time.sleep, 0.01)
+    future.add_done_callback(lambda future: threads.append(threading.current_thread()))
+    future.result(timeout=5)
+
+    assert threads == []
+
+    qts._tests.process_events_until(lambda: len(threads) == 1)
+
+    assert threads == [threading.current_thread()]
+
+    # Callbacks added after delivery run immediately.
+    future.add_done_callback(lambda future: threads.append(threading.current_thread()))
+
+    assert len(threads) == 2
+    executor.shutdown()
+
+
+def test_bounded_queue() -> None:
+    executor = qts.util.ThreadPoolExecutor(max_workers=1, max_queued=2)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block() -> None:
+        started.set()
+        release.wait(timeout=5)
+
+    running = executor.submit(block)
+    assert started.wait(timeout=5)
+    queued = [executor.try_submit(time.sleep, 0) for _ in range(2)]
+
+    assert all(future is not None for future in queued)
+    assert executor.try_submit(time.sleep, 0) is None
+
+    release.set()
+    concurrent.futures.wait([running, *filter(None, queued)], timeout=5)
+
+    assert executor.try_submit(time.sleep, 0) is not None
+    executor.shutdown()
+
+
+def test_submit_waits_for_queue() -> None:
+    executor = qts.util.ThreadPoolExecutor(max_workers=1, max_queued=1)
+    release = threading.Event()
+    executor.submit(release.wait, 5)
+    executor.submit(release.wait, 5)
+
+    threading.Timer(0.05, release.set).start()
+    start = time.monotonic()
+    future = executor.submit(time.sleep, 0)
+
+    assert time.monotonic() - start >= 0.04
+    future.result(timeout=5)
+    executor.shutdown()
+
+
+def test_cancel_not_started() -> None:
+    executor = qts.util.ThreadPoolExecutor(max_workers=1, max_queued=1)
+    release = threading.Event()
+    called: typing.List[bool] = []
+    cancelled: typing.List[bool] = []
+
+    running = executor.submit(release.wait, 5)
+    queued = executor.submit(called.append, True)
+    queued.add_done_callback(lambda future: cancelled.append(future.cancelled()))
+
+    assert queued.cancel()
+    # The slot of the cancelled call is free again.
+    assert executor.try_submit(time.sleep, 0) is not None
+
+    release.set()
+    executor.shutdown()
+    qts._tests.process_events_until(
+        lambda: cancelled == [True] and executor.pending() == 0
+    )
+
+    assert running.result() is True
+    assert called == []
+    assert cancelled == [True]
+
+
+def test_shutdown_cancels_futures() -> None:
+    executor = qts.util.ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    running = executor.submit(release.wait, 5)
+    queued = [executor.submit(time.sleep, 0) for _ in range(3)]
+
+    release.set()
+    executor.shutdown(cancel_futures=True)
+
+    assert running.done()
+    assert all(future.done() for future in queued)
+    with pytest.raises(RuntimeError):
+        executor.submit(time.sleep, 0)
+
+
+def test_shared_pool() -> None:
+    pool = QtCore.QThreadPool.globalInstance()
+    assert pool is not None
+    executor = qts.util.ThreadPoolExecutor(pool=pool)
+
+    assert executor.submit(len, "abc").result(timeout=5) == 3
+    executor.shutdown()
+
+
+@pytest.mark.parametrize(
+    argnames=["kwargs"],
+    argvalues=[
+        [{"max_workers": 0}],
+        [{"max_queued": 0}],
+        [{"max_workers": 1, "pool": QtCore.QThreadPool.globalInstance()}],
+    ],
+)
+def test_invalid_arguments(kwargs: typing.Dict[str, typing.Any]) -> None:
+    with pytest.raises(ValueError):
+        qts.util.ThreadPoolExecutor(**kwargs)
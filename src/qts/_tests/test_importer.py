@@ -0,0 +1,74 @@
+import sys
+
+import pytest
+
+import qts
+import qts._importer
+
+
+def test_finder_is_installed() -> None:
+    finders = [
+        finder
+        for finder in sys.meta_path
+        if isinstance(finder, qts._importer.QtModuleFinder)
+    ]
+    assert len(finders) == 1
+
+
+def test_install_is_idempotent() -> None:
+    before = list(sys.meta_path)
+    qts._importer.install()
+    assert sys.meta_path == before
+
+
+def test_other_qt_module_is_provided(pytester: pytest.Pytester) -> None:
+    content = f"""
+    import importlib
+    import sys
+
+    import qts
+
+
+    def test():
+        from qts import QtCore
+        wrapped_name = f"{{qts.wrapper.module_name}}.QtNetwork"
+        assert wrapped_name not in sys.modules
+
+        from qts import QtNetwork
+
+        wrapped = importlib.import_module(wrapped_name)
+        assert QtNetwork.QAbstractSocket is wrapped.QAbstractSocket
+        assert QtNetwork is qts.QtNetwork
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+def test_importing_qts_does_not_import_other_qt_modules(
+    pytester: pytest.Pytester,
+) -> None:
+    content = f"""
+    import sys
+
+    import qts
+
+
+    def test():
+        from qts import QtCore
+        loaded = {{
+            name.partition(".")[2]
+            for name in sys.modules
+            if name.startswith(f"{{qts.wrapper.module_name}}.Qt")
+        }}
+        assert loaded == {{"QtCore"}}
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+@pytest.mark.parametrize(argnames=["name"], argvalues=[["QtNotAModule"], ["other"]])
+def test_missing_module_raises(name: str) -> None:
+    with pytest.raises(ModuleNotFoundError):
+        __import__(f"qts.{name}")
@@ -0,0 +1,51 @@
+import importlib
+import typing
+
+import pytest
+
+import qts
+import qts._lazy
+import qts._tests
+
+
+def test_attributes_are_resolved_on_first_access(
+    pytester: pytest.Pytester,
+    qt_module: qts._tests.QtModule,
+) -> None:
+    content = f"""
+    from qts import {qt_module.name} as module
+
+
+    def test():
+        name = next(name for name in dir(module) if name.startswith("Q"))
+        assert name not in vars(module)
+        value = getattr(module, name)
+        assert vars(module)[name] is value
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+def test_star_import_provides_wrapper_names(qt_module: qts._tests.QtModule) -> None:
+    namespace: typing.Dict[str, object] = {}
+    exec(f"from qts.{qt_module.name} import *", namespace)
+    wrapped = qts._lazy.import_wrapped(name=qt_module.name)
+
+    wrapped_names = {name for name in dir(wrapped) if not name.startswith("_")}
+    hidden_names = {"pyqtSignal", "pyqtBoundSignal"}
+    assert wrapped_names - hidden_names <= namespace.keys()
+
+
+def test_missing_attribute_raises(qt_module: qts._tests.QtModule) -> None:
+    module = importlib.import_module(f"qts.{qt_module.name}")
+
+    with pytest.raises(AttributeError, match="no_such_attribute"):
+        getattr(module, "no_such_attribute")
+
+
+def test_private_attribute_is_not_forwarded(qt_module: qts._tests.QtModule) -> None:
+    module = importlib.import_module(f"qts.{qt_module.name}")
+
+    with pytest.raises(AttributeError):
+        getattr(module, "__file_of_the_wrapped_module__")
@@ -0,0 +1,488 @@
+import mmap
+import pathlib
+import typing
+
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+import qts.models
+from qts import QtCore
+
+
+def make_model(rows: int = 1000, **kwargs: typing.Any) -> "qts.models.ArrayTableModel":
+    return qts.models.ArrayTableModel(
+        columns={
+            "index": numpy.arange(rows),
+            "value": numpy.arange(rows) / 4,
+            "name": numpy.array([f"row {row}" for row in range(rows)]),
+        },
+        **kwargs,
+    )
+
+
+def test_shape() -> None:
+    model = make_model(rows=1000)
+
+    assert model.rowCount() == 1000
+    assert model.columnCount() == 3
+    assert model.rowCount(model.index(0, 0)) == 0
+
+
+def test_display_strings() -> None:
+    model = make_model(formats={"value": "%.2f"})
+
+    assert model.data(model.index(999, 0)) == "999"
+    assert model.data(model.index(5, 1)) == "1.25"
+    assert model.data(model.index(7, 2)) == "row 7"
+
+
+def test_edit_role_returns_python_values() -> None:
+    model = make_model()
+
+    value = model.data(model.index(6, 1), QtCore.Qt.ItemDataRole.EditRole)
+
+    assert value == 1.5
+    assert type(value) is float
+
+
+def test_unhandled_role() -> None:
+    model = make_model()
+
+    assert model.data(model.index(0, 0), QtCore.Qt.ItemDataRole.FontRole) is None
+
+
+@pytest.mark.parametrize(
+    argnames=["role"],
+    argvalues=[
+        [QtCore.Qt.ItemDataRole.DisplayRole],
+        [QtCore.Qt.ItemDataRole.EditRole],
+        [QtCore.Qt.ItemDataRole.TextAlignmentRole],
+    ],
+)
+def test_invalid_and_stale_indexes(role: QtCore.Qt.ItemDataRole) -> None:
+    model = make_model(rows=1000)
+    stale = model.index(999, 2)
+    model.set_columns(columns={"a": numpy.zeros(3)})
+
+    assert model.data(QtCore.QModelIndex(), role) is None
+    assert model.data(stale, role) is None
+
+
+def test_headers() -> None:
+    model = make_model()
+
+    assert model.headerData(1, QtCore.Qt.Orientation.Horizontal) == "value"
+    assert model.headerData(3, QtCore.Qt.Orientation.Vertical) == "3"
+
+
+def test_least_recently_used_blocks_are_evicted() -> None:
+    model = make_model(rows=1000, block_rows=10, max_blocks=4)
+
+    model.prefetch(0, 999)
+
+    assert len(model._blocks) == 4
+    assert model.data(model.index(0, 0)) == "0"
+    assert (0, 0) in model._blocks
+    assert len(model._blocks) == 4
+
+
+def test_block_rows_rounded_up_to_power_of_two() -> None:
+    model = make_model(rows=100, block_rows=10)
+
+    model.data(model.index(0, 0))
+
+    assert [len(strings) for strings in model._blocks.values()] == [16]
+
+
+def test_invalidate_display_cache() -> None:
+    model = make_model()
+    model.data(model.index(0, 0))
+
+    model.column_array(0)[0] = 42
+    model.invalidate_display_cache()
+
+    assert model.data(model.index(0, 0)) == "42"
+
+
+def test_set_columns_resets() -> None:
+    model = make_model()
+    resets: typing.List[None] = []
+    model.modelReset.connect(lambda: resets.append(None))
+
+    model.set_columns(columns={"a": numpy.zeros(3)})
+
+    assert resets == [None]
+    assert model.rowCount() == 3
+    assert model.column_names() == ["a"]
+
+
+def test_mismatched_lengths() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        qts.models.ArrayTableModel(columns={"a": numpy.zeros(3), "b": numpy.zeros(4)})
+
+
+def test_not_one_dimensional() -> None:
+    with pytest.raises(ValueError, match="one dimensional"):
+        qts.models.ArrayTableModel(columns={"a": numpy.zeros((3, 2))})
+
+
+def proxy_values(proxy: QtCore.QAbstractItemModel, column: int) -> typing.List[str]:
+    return [proxy.data(proxy.index(row, column)) for row in range(proxy.rowCount())]
+
+
+def make_proxy(
+    values: typing.Sequence[int],
+) -> typing.Tuple["qts.models.ArrayTableModel", "qts.models.ArraySortFilterProxyModel"]:
+    model = qts.models.ArrayTableModel(
+        columns={
+            "value": numpy.array(values),
+            "order": numpy.arange(len(values)),
+        }
+    )
+    proxy = qts.models.ArraySortFilterProxyModel()
+    proxy.setSourceModel(model)
+
+    return model, proxy
+
+
+def test_append_rows() -> None:
+    model = make_model(rows=3)
+    inserted: typing.List[typing.Tuple[int, int]] = []
+    model.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+    model.data(model.index(2, 0))
+
+    model.append_rows(
+        columns={
+            "index": numpy.arange(3, 5),
+            "value": numpy.array([1.0, 2.0]),
+            "name": numpy.array(["a much longer name", "b"]),
+        }
+    )
+
+    assert inserted == [(3, 4)]
+    assert model.rowCount() == 5
+    assert model.data(model.index(4, 0)) == "4"
+    assert model.data(model.index(3, 2)) == "a much longer name"
+    assert model.column_array(0).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_append_rows_promotes_default_formats() -> None:
+    model = qts.models.ArrayTableModel(
+        columns={"default": numpy.array([1, 2]), "explicit": numpy.array([1, 2])},
+        formats={"explicit": "%03d"},
+    )
+    changed: typing.List[typing.Tuple[int, int, int, int]] = []
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, roles=None: changed.append(
+            (
+                top_left.row(),
+                top_left.column(),
+                bottom_right.row(),
+                bottom_right.column(),
+            )
+        )
+    )
+    model.data(model.index(0, 0))
+
+    model.append_rows(
+        columns={"default": numpy.array([1.5]), "explicit": numpy.array([2.5])}
+    )
+
+    assert model.column_array(0).dtype.kind == "f"
+    assert model.data(model.index(2, 0)) == "1.5"
+    assert model.data(model.index(0, 0)) == "1"
+    assert model.data(model.index(2, 1)) == "002"
+    assert changed == [(0, 0, 1, 0), (0, 1, 1, 1)]
+
+
+def test_append_rows_mismatched_columns() -> None:
+    model = make_model(rows=3)
+
+    with pytest.raises(ValueError, match="exactly the columns"):
+        model.append_rows(columns={"index": numpy.arange(2)})
+
+
+def test_stable_argsort() -> None:
+    keys = numpy.array([3, 5, 3, 1, 5])
+
+    assert qts.models.stable_argsort(keys).tolist() == [3, 0, 2, 1, 4]
+    assert qts.models.stable_argsort(keys, descending=True).tolist() == [
+        1,
+        4,
+        0,
+        2,
+        3,
+    ]
+
+
+def test_proxy_passes_through() -> None:
+    model, proxy = make_proxy([3, 1, 2])
+
+    assert proxy.rowCount() == 3
+    assert proxy.columnCount() == 2
+    assert proxy_values(proxy, 0) == ["3", "1", "2"]
+
+
+@pytest.mark.parametrize(
+    argnames=["order", "expected"],
+    argvalues=[
+        [QtCore.Qt.SortOrder.AscendingOrder, ["0", "2", "4", "1", "3"]],
+        [QtCore.Qt.SortOrder.DescendingOrder, ["1", "3", "0", "2", "4"]],
+    ],
+)
+def test_proxy_sort_is_stable(
+    order: QtCore.Qt.SortOrder, expected: typing.List[str]
+) -> None:
+    model, proxy = make_proxy([1, 2, 1, 2, 1])
+
+    proxy.sort(0, order)
+
+    assert proxy_values(proxy, 1) == expected
+
+
+def test_proxy_sort_matches_qsortfilterproxymodel() -> None:
+    values = numpy.random.default_rng(0).integers(0, 20, size=200)
+    model, proxy = make_proxy(values.tolist())
+    reference = QtCore.QSortFilterProxyModel()
+    reference.setSourceModel(model)
+    reference.setSortRole(QtCore.Qt.ItemDataRole.EditRole)
+
+    for order in [
+        QtCore.Qt.SortOrder.AscendingOrder,
+        QtCore.Qt.SortOrder.DescendingOrder,
+    ]:
+        proxy.sort(0, order)
+        reference.sort(0, order)
+
+        assert proxy_values(proxy, 0) == proxy_values(reference, 0)
+
+
+def test_proxy_restores_source_order() -> None:
+    model, proxy = make_proxy([3, 1, 2])
+    proxy.sort(0)
+
+    proxy.sort(-1)
+
+    assert proxy_values(proxy, 0) == ["3", "1", "2"]
+
+
+def test_proxy_filter() -> None:
+    model, proxy = make_proxy([3, 1, 2, 5])
+
+    proxy.set_filter(lambda columns: columns[0] >= 2)
+
+    assert proxy_values(proxy, 0) == ["3", "2", "5"]
+    assert not proxy.mapFromSource(model.index(1, 0)).isValid()
+    assert proxy.mapToSource(proxy.index(1, 0)).row() == 2
+
+
+def test_proxy_filter_wrong_shape() -> None:
+    model, proxy = make_proxy([3, 1, 2])
+
+    with pytest.raises(ValueError, match="mask of shape"):
+        proxy.set_filter(lambda columns: numpy.ones(2, dtype=bool))
+
+
+def test_proxy_sort_updates_persistent_indexes() -> None:
+    model, proxy = make_proxy([3, 1, 2])
+    persistent = QtCore.QPersistentModelIndex(proxy.index(0, 1))
+
+    proxy.sort(0)
+
+    assert persistent.row() == 2
+    assert proxy.data(proxy.index(persistent.row(), 0)) == "3"
+
+
+def test_proxy_rejects_non_columnar_source() -> None:
+    proxy = qts.models.ArraySortFilterProxyModel()
+
+    with pytest.raises(TypeError, match="column_array"):
+        proxy.setSourceModel(QtCore.QStringListModel())
+
+
+@pytest.mark.parametrize(
+    argnames="order",
+    argvalues=[
+        QtCore.Qt.SortOrder.AscendingOrder,
+        QtCore.Qt.SortOrder.DescendingOrder,
+    ],
+)
+def test_proxy_merges_appended_rows(order: QtCore.Qt.SortOrder) -> None:
+    model, proxy = make_proxy([4, 1, 7, 1])
+    proxy.set_filter(lambda columns: columns[0] != 0)
+    proxy.sort(0, order)
+    resets: typing.List[None] = []
+    inserted: typing.List[typing.Tuple[int, int]] = []
+    proxy.modelReset.connect(lambda: resets.append(None))
+    proxy.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+
+    model.append_rows(
+        columns={"value": numpy.array([1, 0, 9, 4]), "order": numpy.arange(4, 8)}
+    )
+
+    expected_model, expected = make_proxy([4, 1, 7, 1, 1, 0, 9, 4])
+    expected.set_filter(lambda columns: columns[0] != 0)
+    expected.sort(0, order)
+
+    assert resets == []
+    assert len(inserted) == 3
+    assert proxy_values(proxy, 1) == proxy_values(expected, 1)
+    for row in range(proxy.rowCount()):
+        assert proxy.mapFromSource(proxy.mapToSource(proxy.index(row, 1))).row() == row
+
+
+def test_proxy_appends_unsorted_rows_at_end() -> None:
+    model, proxy = make_proxy([4, 1])
+    inserted: typing.List[typing.Tuple[int, int]] = []
+    proxy.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+
+    model.append_rows(columns={"value": numpy.array([0, 3]), "order": numpy.arange(2)})
+
+    assert inserted == [(2, 3)]
+    assert proxy_values(proxy, 0) == ["4", "1", "0", "3"]
+
+
+def test_proxy_resets_on_source_reset() -> None:
+    model, proxy = make_proxy([4, 1])
+    proxy.sort(0)
+
+    model.set_columns(columns={"value": numpy.array([5, 2, 3])})
+
+    assert proxy.columnCount() == 1
+    assert proxy_values(proxy, 0) == ["2", "3", "5"]
+
+
+def make_file_model(
+    path: pathlib.Path, content: bytes, **kwargs: typing.Any
+) -> "qts.models.MappedFileModel":
+    path.write_bytes(content)
+    model = qts.models.MappedFileModel(path, **kwargs)
+    assert model.wait(timeout=10)
+
+    return model
+
+
+def file_model_rows(
+    model: "qts.models.MappedFileModel",
+) -> typing.List[typing.List[str]]:
+    while model.canFetchMore():
+        model.fetchMore()
+
+    return [
+        [model.data(model.index(row, column)) for column in range(model.columnCount())]
+        for row in range(model.rowCount())
+    ]
+
+
+@pytest.mark.parametrize(
+    argnames="content",
+    argvalues=[b"", b"a\nb\n", b"a\r\nb", b"\n\n", "é\n".encode()],
+    ids=["empty", "trailing", "crlf no trailing", "blank", "utf-8"],
+)
+def test_mapped_file_lines(tmp_path: pathlib.Path, content: bytes) -> None:
+    model = make_file_model(path=tmp_path.joinpath("lines.txt"), content=content)
+
+    expected = content.decode().splitlines()
+
+    assert file_model_rows(model) == [[line] for line in expected]
+    assert model.is_indexed()
+    model.close()
+
+
+@pytest.mark.parametrize(argnames="stride", argvalues=[1, 2, 64])
+def test_mapped_file_blocks(tmp_path: pathlib.Path, stride: int) -> None:
+    lines = [f"line {number}" for number in range(1000)]
+    model = make_file_model(
+        path=tmp_path.joinpath("lines.txt"),
+        content="\n".join(lines).encode(),
+        stride=stride,
+        max_blocks=3,
+        fetch_rows=300,
+    )
+
+    assert file_model_rows(model) == [[line] for line in lines]
+    assert len(model._blocks) <= 3
+    model.close()
+
+
+def test_mapped_file_small_chunks(tmp_path: pathlib.Path) -> None:
+    lines = [str(number) * (number % 7) for number in range(5000)]
+    path = tmp_path.joinpath("lines.txt")
+    path.write_bytes("\n".join(lines).encode())
+
+    class SmallChunks(qts.models.MappedFileModel):
+        chunk_bytes = mmap.PAGESIZE
+
+    model = SmallChunks(path, stride=8)
+    assert model.wait(timeout=10)
+
+    assert file_model_rows(model) == [[line] for line in lines]
+    assert model.scanned_lines() == 5000
+    model.close()
+
+
+def test_mapped_file_csv(tmp_path: pathlib.Path) -> None:
+    model = make_file_model(
+        path=tmp_path.joinpath("table.csv"),
+        content=b'name,value\nfirst,1\n"a, b",2\nshort\n',
+        delimiter=",",
+        header=True,
+    )
+
+    assert model.columnCount() == 2
+    assert model.headerData(1, QtCore.Qt.Orientation.Horizontal) == "value"
+    assert file_model_rows(model) == [["first", "1"], ["a, b", "2"], ["short", ""]]
+    model.close()
+
+
+def test_mapped_file_header_without_delimiter(tmp_path: pathlib.Path) -> None:
+    model = make_file_model(
+        path=tmp_path.joinpath("log.txt"),
+        content=b"time message\n1 started\n2 stopped\n",
+        header=True,
+    )
+
+    assert model.columnCount() == 1
+    assert model.headerData(0, QtCore.Qt.Orientation.Horizontal) == "time message"
+    assert file_model_rows(model) == [["1 started"], ["2 stopped"]]
+    model.close()
+
+
+def test_mapped_file_invalid_and_stale_indexes(tmp_path: pathlib.Path) -> None:
+    model = make_file_model(
+        path=tmp_path.joinpath("lines.txt"), content=b"line\n" * 10, fetch_rows=5
+    )
+    QtCore.QCoreApplication.sendPostedEvents()
+    index = model.index(4, 0)
+
+    assert model.data(QtCore.QModelIndex()) is None
+    assert model.data(index) == "line"
+
+    model.close()
+
+    assert model.data(index) is None
+
+
+def test_mapped_file_fetches_first_rows(tmp_path: pathlib.Path) -> None:
+    model = make_file_model(
+        path=tmp_path.joinpath("lines.txt"),
+        content=b"line\n" * 100,
+        fetch_rows=30,
+    )
+    finished: typing.List[None] = []
+    model.indexing_finished.connect(lambda: finished.append(None))
+
+    QtCore.QCoreApplication.sendPostedEvents()
+
+    assert finished == [None]
+    assert model.rowCount() == 30
+    assert model.canFetchMore()
+    model.close()
+    assert model.rowCount() == 0
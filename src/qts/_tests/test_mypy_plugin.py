@@ -0,0 +1,183 @@
+import os
+import pathlib
+import subprocess
+import sys
+import types
+import typing
+
+import pytest
+
+import qts
+
+
+pytest.importorskip("mypy")
+
+
+condition_names = {
+    wrapper.name: name
+    for wrapper, name in [
+        (qts.pyqt_5_wrapper, "is_pyqt_5_wrapper"),
+        (qts.pyqt_6_wrapper, "is_pyqt_6_wrapper"),
+        (qts.pyside_5_wrapper, "is_pyside_5_wrapper"),
+        (qts.pyside_6_wrapper, "is_pyside_6_wrapper"),
+    ]
+}
+
+sample = "import qts\n" + "".join(
+    f"if qts.{name}:\n    reveal_type({wrapper_name!r})\n"
+    for wrapper_name, name in condition_names.items()
+)
+
+
+def reachable_wrapper_names(
+    directory: pathlib.Path,
+    config_name: str,
+    config: str,
+    environment_wrapper: typing.Optional[str] = None,
+) -> typing.List[str]:
+    directory.joinpath("sample.py").write_text(sample, encoding="utf-8")
+    directory.joinpath(config_name).write_text(config, encoding="utf-8")
+
+    env = {**os.environ}
+    env.pop("QTS_WRAPPER", None)
+    if environment_wrapper is not None:
+        env["QTS_WRAPPER"] = environment_wrapper
+
+    completed_process = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "mypy",
+            "--config-file",
+            config_name,
+            "--no-incremental",
+            # Contradicts the plugin which should replace it.
+            "--always-true=is_pyqt_6_wrapper",
+            "sample.py",
+        ],
+        cwd=directory,
+        encoding="utf-8",
+        env=env,
+        stdout=subprocess.PIPE,
+    )
+
+    return [
+        wrapper_name
+        for wrapper_name in condition_names
+        if f"Revealed type is \"Literal['{wrapper_name}']?\""
+        in completed_process.stdout
+    ]
+
+
+@pytest.mark.parametrize(
+    argnames="wrapper",
+    argvalues=qts.supported_wrappers,
+    ids=[wrapper.name for wrapper in qts.supported_wrappers],
+)
+def test_ini_configuration_selects_wrapper(
+    tmp_path: pathlib.Path,
+    wrapper: qts.Wrapper,
+) -> None:
+    config = f"""
+[mypy]
+plugins = qts.mypy_plugin
+
+[qts-mypy]
+wrapper = {wrapper.name.lower()}
+"""
+
+    names = reachable_wrapper_names(
+        directory=tmp_path, config_name="mypy.ini", config=config
+    )
+
+    assert names == [wrapper.name]
+
+
+def test_pyproject_configuration_selects_wrapper(tmp_path: pathlib.Path) -> None:
+    config = """
+[tool.mypy]
+plugins = ["qts.mypy_plugin"]
+
+[tool.qts-mypy]
+wrapper = "PySide2"
+"""
+
+    names = reachable_wrapper_names(
+        directory=tmp_path, config_name="pyproject.toml", config=config
+    )
+
+    assert names == ["PySide2"]
+
+
+@pytest.mark.parametrize(
+    argnames=["parser"], argvalues=[["tomllib"], ["tomli"], ["toml"]]
+)
+def test_pyproject_parsers(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, parser: str
+) -> None:
+    import qts.mypy_plugin
+
+    tomllib = pytest.importorskip("tomllib")
+    path = tmp_path.joinpath("pyproject.toml")
+    path.write_text('[tool.qts-mypy]\nwrapper = "PySide2"\n', encoding="utf-8")
+
+    # tomli reads binary files like tomllib while toml reads text files.
+    parsers = {
+        "tomllib": types.SimpleNamespace(load=tomllib.load),
+        "tomli": types.SimpleNamespace(load=tomllib.load),
+        "toml": types.SimpleNamespace(load=lambda file: tomllib.loads(file.read())),
+    }
+    for name, module in parsers.items():
+        monkeypatch.setitem(sys.modules, name, module if name == parser else None)
+
+    wrapper_name = qts.mypy_plugin._read_configured_wrapper_name(
+        config_file=os.fspath(path)
+    )
+
+    assert wrapper_name == "PySide2"
+
+
+def test_pyproject_without_parser(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import qts.mypy_plugin
+
+    path = tmp_path.joinpath("pyproject.toml")
+    path.write_text('[tool.qts-mypy]\nwrapper = "PySide2"\n', encoding="utf-8")
+    for name in ["tomllib", "tomli", "toml"]:
+        monkeypatch.setitem(sys.modules, name, None)
+
+    with pytest.raises(ModuleNotFoundError, match="requires tomli"):
+        qts.mypy_plugin._read_configured_wrapper_name(config_file=os.fspath(path))
+
+
+def test_environment_overrides_configuration(tmp_path: pathlib.Path) -> None:
+    config = """
+[mypy]
+plugins = qts.mypy_plugin
+
+[qts-mypy]
+wrapper = PySide2
+"""
+
+    names = reachable_wrapper_names(
+        directory=tmp_path,
+        config_name="mypy.ini",
+        config=config,
+        environment_wrapper="PyQt6",
+    )
+
+    assert names == ["PyQt6"]
+
+
+def test_available_wrapper_without_configuration(tmp_path: pathlib.Path) -> None:
+    config = """
+[mypy]
+plugins = qts.mypy_plugin
+"""
+
+    names = reachable_wrapper_names(
+        directory=tmp_path, config_name="mypy.ini", config=config
+    )
+
+    assert names == [qts.an_available_wrapper().name]
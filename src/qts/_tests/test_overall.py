@@ -1,3 +1,7 @@
+import importlib
+import subprocess
+import sys
+
 import pytest
 
 import qts
@@ -7,6 +11,15 @@ def test_version_is_a_string() -> None:
     assert isinstance(qts.__version__, str)
 
 
+def test_source_checkout_version_asks_git(monkeypatch: pytest.MonkeyPatch) -> None:
+    import qts._metadata
+
+    monkeypatch.setattr(qts._metadata, "_is_source_checkout", lambda: True)
+    monkeypatch.setattr(qts._metadata, "_versioneer_version", lambda: "1.2+3.gabcdef")
+
+    assert qts._metadata.version() == "1.2+3.gabcdef"
+
+
 def test_importing_does_not_import_qt(
     pytester: pytest.Pytester,
     any_wrapper: qts.Wrapper,
@@ -23,3 +36,80 @@ def test_importing_does_not_import_qt(
     pytester.makepyfile(content)
     run_result = pytester.runpytest_subprocess()
     run_result.assert_outcomes(passed=1)
+
+
+import_time_budget_microseconds = 10_000
+"""The budget for ``import qts`` itself.  :mod:`typing` is imported beforehand since
+nearly every application already imports it.
+"""
+
+
+def import_time_microseconds() -> int:
+    completed_process = subprocess.run(
+        args=[sys.executable, "-X", "importtime", "-c", "import typing; import qts"],
+        check=True,
+        encoding="utf-8",
+        stderr=subprocess.PIPE,
+    )
+
+    for line in completed_process.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+
+        if name.strip() == "qts":
+            return int(cumulative)
+
+    raise qts.InternalError("qts import time not found")  # pragma: no cover
+
+
+def test_import_time_within_budget() -> None:
+    # the first run may need to write bytecode caches
+    times = [import_time_microseconds() for _ in range(4)]
+
+    assert min(times[1:]) < import_time_budget_microseconds
+
+
+def test_importing_is_lightweight() -> None:
+    script = "import sys, qts; print(' '.join(sorted(sys.modules)))"
+    completed_process = subprocess.run(
+        args=[sys.executable, "-c", script],
+        check=True,
+        encoding="utf-8",
+        stdout=subprocess.PIPE,
+    )
+    modules = set(completed_process.stdout.split())
+
+    assert modules.isdisjoint({"attr", "subprocess", "qts._errors", "qts._version"})
+
+
+def test_lazy_attributes_are_in_dir() -> None:
+    assert {"__version__", "QtsError", "InvalidWrapperError"} <= set(dir(qts))
+
+
+@pytest.mark.parametrize(
+    argnames=["module_name", "name", "defining_module_name", "defined_name"],
+    argvalues=[
+        ["qts.util", "QtEventLoop", "qts._asyncio", "QtEventLoop"],
+        ["qts.util", "QtEventLoopPolicy", "qts._asyncio", "QtEventLoopPolicy"],
+        ["qts.util", "QtSelector", "qts._asyncio", "QtSelector"],
+        ["qts.util", "run", "qts._asyncio", "run"],
+        ["qts.util", "CallQueue", "qts._calls", "CallQueue"],
+        ["qts.util", "Coalescer", "qts._coalesce", "Coalescer"],
+        ["qts.util", "CoalesceMode", "qts._coalesce", "Mode"],
+        ["qts.util", "ThreadPoolExecutor", "qts._executor", "ThreadPoolExecutor"],
+        ["qts.util", "ProcessPoolExecutor", "qts._process", "ProcessPoolExecutor"],
+        ["qts.diagnostics", "StallMonitor", "qts._stall", "StallMonitor"],
+    ],
+)
+def test_lazy_reexports(
+    module_name: str, name: str, defining_module_name: str, defined_name: str
+) -> None:
+    module = importlib.import_module(module_name)
+    defining_module = importlib.import_module(defining_module_name)
+
+    assert name in dir(module)
+    assert getattr(module, name) is getattr(defining_module, defined_name)
+
+
+def test_missing_attribute_raises() -> None:
+    with pytest.raises(AttributeError, match="no_such_attribute"):
+        getattr(qts, "no_such_attribute")
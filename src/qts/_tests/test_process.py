@@ -0,0 +1,163 @@
+import multiprocessing
+import os
+import threading
+import time
+import typing
+
+import pytest
+
+import qts
+import qts._tests
+import qts.util
+
+
+def child_state() -> typing.Tuple[int, typing.Optional[str]]:
+    return os.getpid(), None if qts.wrapper is None else qts.wrapper.name
+
+
+def record_initialized(path: str) -> None:
+    with open(path, "w") as file:
+        file.write("initialized")
+
+
+def test_result_and_exception() -> None:
+    executor = qts.util.ProcessPoolExecutor(max_workers=1)
+
+    assert executor.submit(pow, 2, 10).result(timeout=30) == 1024
+    with pytest.raises(ZeroDivisionError):
+        executor.submit(divmod, 1, 0).result(timeout=30)
+
+    executor.shutdown()
+
+
+def test_map() -> None:
+    with qts.util.ProcessPoolExecutor(max_workers=1) as executor:
+        assert list(executor.map(abs, [-1, -2, 3], chunksize=2)) == [1, 2, 3]
+
+
+def test_done_callbacks_run_in_creating_thread() -> None:
+    executor = qts.util.ProcessPoolExecutor(max_workers=1)
+    results: typing.List[typing.Tuple[int, threading.Thread]] = []
+
+    futures = [executor.submit(abs, -value) for value in range(5)]
+    for future in futures:
+        future.add_done_callback(
+            lambda future: results.append((future.result(), threading.current_thread()))
+        )
+
+    qts._tests.process_events_until(lambda: len(results) == 5, timeout=30)
+
+    assert sorted(value for value, _ in results) == list(range(5))
+    assert {thread for _, thread in results} == {threading.current_thread()}
+    assert executor.pending() == 0
+    executor.shutdown()
+
+
+def test_cancel() -> None:
+    executor = qts.util.ProcessPoolExecutor(max_workers=1)
+    cancelled: typing.List[bool] = []
+
+    # More than the pool queues ahead of the workers.
+    futures = [executor.submit(time.sleep, 0.05) for _ in range(10)]
+    futures[-1].add_done_callback(lambda future: cancelled.append(future.cancelled()))
+
+    assert futures[-1].cancel()
+
+    executor.shutdown()
+    qts._tests.process_events_until(lambda: cancelled == [True], timeout=30)
+
+
+def test_future_finishing_while_woken_is_delivered() -> None:
+    executor = qts.util.ProcessPoolExecutor(max_workers=1)
+    receiver = executor._receiver
+    results: typing.List[int] = []
+
+    class FinishingReceiver:
+        """Finishes another call while the executor is reading the wake up byte."""
+
+        finished = False
+
+        def recv(self, size: int) -> bytes:
+            if not self.finished:
+                self.finished = True
+                future = executor.submit(abs, -2)
+                future.add_done_callback(lambda future: results.append(future.result()))
+                deadline = time.monotonic() + 30
+                while future not in executor._finished and time.monotonic() < deadline:
+                    time.sleep(0.001)
+
+            return receiver.recv(size)
+
+        def __getattr__(self, name: str) -> typing.Any:
+            return getattr(receiver, name)
+
+    executor._receiver = FinishingReceiver()  # type: ignore[assignment]
+
+    executor.submit(abs, -1).add_done_callback(
+        lambda future: results.append(future.result())
+    )
+    qts._tests.process_events_until(lambda: len(results) == 2, timeout=30)
+
+    # Later calls still wake the thread.
+    executor.submit(abs, -3).add_done_callback(
+        lambda future: results.append(future.result())
+    )
+    qts._tests.process_events_until(lambda: len(results) == 3, timeout=30)
+
+    assert sorted(results) == [1, 2, 3]
+    executor.shutdown()
+
+
+def test_running() -> None:
+    executor = qts.util.ProcessPoolExecutor(max_workers=1)
+
+    future = executor.submit(time.sleep, 0.5)
+    deadline = time.monotonic() + 30
+    while not future.running() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert future.running()
+    assert not future.cancel()
+
+    future.result(timeout=30)
+
+    assert not future.running()
+    executor.shutdown()
+
+
+def test_shutdown_runs_callbacks_and_closes() -> None:
+    results: typing.List[int] = []
+
+    with qts.util.ProcessPoolExecutor(max_workers=1) as executor:
+        for value in range(3):
+            executor.submit(abs, -value).add_done_callback(
+                lambda future: results.append(future.result())
+            )
+
+    assert sorted(results) == [0, 1, 2]
+    assert executor.pending() == 0
+    assert executor._receiver.fileno() == -1
+    assert executor._sender.fileno() == -1
+
+
+@pytest.mark.parametrize(argnames=["method"], argvalues=[["spawn"], ["fork"]])
+def test_wrapper_set_in_children(method: str, tmp_path: typing.Any) -> None:
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"The {method} start method is not available")
+
+    path = os.fspath(tmp_path / "initialized")
+    executor = qts.util.ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context(method),
+        initializer=record_initialized,
+        initargs=(path,),
+    )
+
+    pid, wrapper_name = executor.submit(child_state).result(timeout=60)
+    executor.shutdown()
+
+    assert qts.wrapper is not None
+    assert pid != os.getpid()
+    assert wrapper_name == qts.wrapper.name
+    with open(path) as file:
+        assert file.read() == "initialized"
@@ -0,0 +1,191 @@
+import json
+import math
+import time
+import typing
+
+import pytest
+
+import qts._stall
+import qts._tests
+import qts.diagnostics
+
+
+def block_event_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def test_importing_diagnostics_does_not_select_a_wrapper(
+    pytester: pytest.Pytester,
+) -> None:
+    content = """
+    import sys
+
+    import qts
+    import qts.diagnostics
+
+
+    def test():
+        assert qts.wrapper is None
+        assert "qts._stall" not in sys.modules
+        assert "StallMonitor" in dir(qts.diagnostics)
+    """
+    pytester.makepyfile(content)
+    run_result = pytester.runpytest_subprocess()
+    run_result.assert_outcomes(passed=1)
+
+
+def test_heartbeats_are_counted() -> None:
+    monitor = qts.diagnostics.StallMonitor(interval=0.01, threshold=0.2)
+    monitor.start()
+    qts._tests.process_events_for(0.2)
+    monitor.stop()
+
+    report = monitor.report()
+
+    assert monitor.is_running() is False
+    assert report.heartbeats >= 5
+    assert report.stalls == ()
+    assert report.percentile(50) <= 0.05
+    assert report.max_latency < 0.2
+
+
+def test_stall_is_recorded_with_stack() -> None:
+    monitor = qts.diagnostics.StallMonitor(interval=0.01, threshold=0.1)
+    stalls: typing.List[qts.diagnostics.Stall] = []
+    monitor.stall_detected.connect(stalls.append)
+    monitor.start()
+
+    qts._tests.process_events_for(0.05)
+    block_event_loop(0.3)
+    qts._tests.process_events_for(0.05)
+    monitor.stop()
+
+    report = monitor.report()
+
+    [stall] = report.stalls
+    assert stall == stalls[0]
+    assert stall.duration >= 0.2
+    assert not stall.ongoing
+    assert any("block_event_loop" in line for line in stall.stack)
+    assert report.max_latency == stall.duration
+
+
+def test_ongoing_stall_is_reported() -> None:
+    monitor = qts.diagnostics.StallMonitor(interval=0.01, threshold=0.05)
+    monitor.start()
+    qts._tests.process_events_for(0.03)
+    block_event_loop(0.2)
+
+    report = monitor.report()
+    monitor.stop()
+
+    assert [stall.ongoing for stall in report.stalls] == [True]
+    assert report.stalls[0].duration >= 0.05
+
+
+def test_max_stalls() -> None:
+    monitor = qts.diagnostics.StallMonitor(interval=0.01, threshold=0.03, max_stalls=1)
+    monitor.start()
+    for _ in range(2):
+        qts._tests.process_events_for(0.03)
+        block_event_loop(0.1)
+    qts._tests.process_events_for(0.03)
+    monitor.stop()
+
+    report = monitor.report()
+
+    assert len(report.stalls) == 1
+    assert report.dropped_stalls == 1
+
+
+def test_start_twice_raises() -> None:
+    monitor = qts.diagnostics.StallMonitor()
+    monitor.start()
+    try:
+        with pytest.raises(RuntimeError):
+            monitor.start()
+    finally:
+        monitor.stop()
+
+
+def test_heartbeat_from_before_restart_is_ignored() -> None:
+    from qts import QtCore
+
+    monitor = qts.diagnostics.StallMonitor(interval=0.01, threshold=10)
+    monitor.start()
+    stale = qts._stall._Heartbeat(generation=monitor._generation)
+    monitor.stop()
+    monitor.start()
+    try:
+        deadline = time.monotonic() + 5
+        while monitor._posted_at is None and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        QtCore.QCoreApplication.sendEvent(monitor, stale)
+        assert monitor.report().heartbeats == 0
+
+        qts._tests.process_events_until(lambda: monitor.report().heartbeats > 0)
+    finally:
+        monitor.stop()
+
+
+@pytest.mark.parametrize(
+    argnames=["kwargs"],
+    argvalues=[[{"interval": 0}], [{"threshold": -1}], [{"max_stalls": -1}]],
+)
+def test_invalid_arguments(kwargs: typing.Dict[str, typing.Any]) -> None:
+    with pytest.raises(ValueError):
+        qts.diagnostics.StallMonitor(**kwargs)
+
+
+def test_responsiveness_report() -> None:
+    report = qts.diagnostics.ResponsivenessReport(
+        wrapper_name="PyQt5",
+        duration=2,
+        interval=0.05,
+        threshold=0.2,
+        bounds=(0.001, 0.01, math.inf),
+        counts=(8, 1, 1),
+        max_latency=0.5,
+        stalls=(qts.diagnostics.Stall(start=1, duration=0.5, stack=("  File x\n",)),),
+        dropped_stalls=0,
+    )
+
+    assert report.heartbeats == 10
+    assert report.percentile(50) == 0.001
+    assert report.percentile(90) == 0.01
+    assert report.percentile(100) == math.inf
+    assert json.loads(report.to_json()) == {
+        "wrapper": "PyQt5",
+        "duration": 2,
+        "interval": 0.05,
+        "threshold": 0.2,
+        "heartbeats": 10,
+        "max_latency": 0.5,
+        "histogram": [
+            {"le": 0.001, "count": 8},
+            {"le": 0.01, "count": 1},
+            {"le": None, "count": 1},
+        ],
+        "stalls": [
+            {"start": 1, "duration": 0.5, "stack": ["  File x\n"], "ongoing": False}
+        ],
+        "dropped_stalls": 0,
+    }
+
+
+def test_percentile_requires_heartbeats() -> None:
+    report = qts.diagnostics.ResponsivenessReport(
+        wrapper_name=None,
+        duration=0,
+        interval=0.05,
+        threshold=0.2,
+        bounds=(math.inf,),
+        counts=(0,),
+        max_latency=0,
+        stalls=(),
+        dropped_stalls=0,
+    )
+
+    with pytest.raises(ValueError):
+        report.percentile(50)
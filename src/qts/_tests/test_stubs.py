@@ -0,0 +1,119 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import qts
+import qts._stubs
+import qts.util
+
+
+def test_qt_core_stub_has_signal_aliases(wrapper: qts.Wrapper) -> None:
+    version = qts._stubs.binding_version(wrapper=wrapper)
+    content = qts._stubs.qt_module_stub(wrapper=wrapper, name="QtCore", version=version)
+    lines = content.splitlines()
+
+    assert version in lines[0]
+    assert f"from {wrapper.module_name}.QtCore import QObject as QObject" in lines
+    if wrapper.family == "PyQt":
+        assert "Signal = _pyqtSignal" in lines
+        assert "SignalInstance = _pyqtBoundSignal" in lines
+    else:
+        assert f"from {wrapper.module_name}.QtCore import Signal as Signal" in lines
+
+
+def test_generate_is_incremental(wrapper: qts.Wrapper, tmp_path: pathlib.Path) -> None:
+    directory = os.fspath(tmp_path)
+
+    written = qts._stubs.generate(
+        wrapper=wrapper, directory=directory, module_names=["QtCore", "QtNetwork"]
+    )
+    assert written is not None
+    package = tmp_path.joinpath("qts-stubs")
+    assert sorted(map(pathlib.Path, written)) == sorted(
+        [
+            package.joinpath("QtCore.pyi"),
+            package.joinpath("QtNetwork.pyi"),
+            package.joinpath("py.typed"),
+        ]
+    )
+    assert package.joinpath("py.typed").read_text() == "partial\n"
+
+    assert (
+        qts._stubs.generate(
+            wrapper=wrapper, directory=directory, module_names=["QtCore", "QtNetwork"]
+        )
+        is None
+    )
+    assert (
+        qts._stubs.generate(
+            wrapper=wrapper,
+            directory=directory,
+            module_names=["QtCore", "QtNetwork"],
+            force=True,
+        )
+        == []
+    )
+
+    written = qts._stubs.generate(
+        wrapper=wrapper, directory=directory, module_names=["QtCore"]
+    )
+    assert written == []
+    assert not package.joinpath("QtNetwork.pyi").exists()
+
+
+def test_mypy_uses_generated_stubs(
+    wrapper: qts.Wrapper,
+    tmp_path: pathlib.Path,
+) -> None:
+    pytest.importorskip("mypy")
+
+    stubs_path = tmp_path.joinpath("stubs")
+    qts._stubs.generate(wrapper=wrapper, directory=os.fspath(stubs_path))
+    tmp_path.joinpath("sample.py").write_text(
+        """
+import qts.util
+from qts import QtCore, QtWidgets
+
+
+class Counter(QtCore.QObject):
+    changed = QtCore.Signal(int)
+
+
+def connect(signal: QtCore.SignalInstance) -> None:
+    signal.connect(print)
+
+
+connect(Counter().changed)
+reveal_type(QtWidgets.QWidget())
+qts.util.exec(QtCore.QEventLoop())
+""",
+        encoding="utf-8",
+    )
+    tmp_path.joinpath("mypy.ini").write_text("[mypy]\nstrict = true\n")
+
+    completed_process = subprocess.run(
+        [sys.executable, "-m", "mypy", "--no-incremental", "--verbose", "sample.py"],
+        cwd=tmp_path,
+        encoding="utf-8",
+        env={**os.environ, "PYTHONPATH": os.fspath(stubs_path)},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    assert f"{wrapper.module_name}.QtWidgets.QWidget" in completed_process.stdout
+    assert "error" not in completed_process.stdout
+
+    # The Qt modules come from the stubs and the rest of qts from the installed
+    # package.
+    parsed = {
+        line.rpartition("(")[2].rstrip(")"): line.split()[2]
+        for line in completed_process.stderr.splitlines()
+        if line.startswith("LOG:  Parsing ")
+    }
+    assert pathlib.Path(parsed["qts.QtCore"]) == stubs_path.joinpath(
+        "qts-stubs", "QtCore.pyi"
+    )
+    assert pathlib.Path(parsed["qts.util"]) == pathlib.Path(qts.util.__file__)
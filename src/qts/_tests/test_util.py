@@ -1,6 +1,10 @@
+import enum
+import gc
+import sys
 import typing
 
 import attr
+import pytest
 
 import qts.util
 
@@ -24,3 +28,294 @@ def test_exec() -> None:
     qts.util.exec(execable=execable)
 
     assert execable.call_count == 1
+
+
+def test_enums_short_names() -> None:
+    from qts import QtCore
+
+    Qt = qts.util.enums(QtCore.Qt)
+
+    assert Qt.AlignLeft == QtCore.Qt.AlignmentFlag.AlignLeft
+    assert Qt.NoModifier == QtCore.Qt.KeyboardModifier.NoModifier
+    assert "AlignLeft" in dir(Qt)
+    assert qts.util.enums(QtCore.Qt) is Qt
+
+
+def test_enums_qualified_names() -> None:
+    from qts import QtCore
+
+    Qt = qts.util.enums(QtCore.Qt)
+
+    assert Qt.member("AlignmentFlag.AlignLeft") == QtCore.Qt.AlignmentFlag.AlignLeft
+    assert Qt.member("AlignLeft") == QtCore.Qt.AlignmentFlag.AlignLeft
+
+
+def test_enums_missing_name() -> None:
+    from qts import QtCore
+
+    Qt = qts.util.enums(QtCore.Qt)
+
+    with pytest.raises(AttributeError, match="NotAnEnumMember"):
+        Qt.NotAnEnumMember
+
+    with pytest.raises(AttributeError, match="AlignmentFlag.NotAnEnumMember"):
+        Qt.member("AlignmentFlag.NotAnEnumMember")
+
+
+class Color(enum.Enum):
+    red = 1
+    green = 2
+
+
+class Scoped:
+    Color = Color
+
+    class Other(enum.Enum):
+        red = 3
+        blue = 4
+
+
+def test_enums_ambiguous_name() -> None:
+    table = qts.util.EnumTable(namespace=Scoped)
+
+    assert table.green is Color.green
+    assert table.member("Other.red") is Scoped.Other.red
+
+    with pytest.raises(AttributeError, match="ambiguous"):
+        table.red
+
+
+def test_enum_int_round_trip() -> None:
+    from qts import QtCore
+
+    Qt = qts.util.enums(QtCore.Qt)
+    alignment_type = type(Qt.AlignLeft)
+
+    assert qts.util.enum_to_int(Qt.AlignLeft) == 0x1
+    assert qts.util.enum_to_int(Qt.AlignLeft | Qt.AlignTop) == 0x21
+    assert qts.util.int_to_enum(alignment_type, 0x1) == Qt.AlignLeft
+    assert qts.util.enum_to_int(qts.util.int_to_enum(alignment_type, 0x21)) == 0x21
+
+
+def test_python_enum_int_round_trip() -> None:
+    class Flags(enum.Flag):
+        a = 1
+        b = 2
+
+    assert qts.util.enum_to_int(Flags.a | Flags.b) == 3
+    assert qts.util.int_to_enum(Flags, 3) == Flags.a | Flags.b
+    assert qts.util.int_to_enum(Flags, 2) is Flags.b
+
+
+def test_array_to_qimage_shares_memory() -> None:
+    numpy = pytest.importorskip("numpy")
+
+    array = numpy.zeros((3, 5, 4), dtype=numpy.uint8)
+    image = qts.util.array_to_qimage(array)
+    array[1, 2] = [0x10, 0x20, 0x30, 0x40]
+
+    assert (image.width(), image.height()) == (5, 3)
+    assert image.pixelColor(2, 1).getRgb() == (0x10, 0x20, 0x30, 0x40)
+
+
+def test_array_to_qimage_padded_rows() -> None:
+    numpy = pytest.importorskip("numpy")
+    from qts import QtGui
+
+    array = numpy.zeros((3, 8), dtype=numpy.uint8)[:, :5]
+    array[2, 4] = 0x7F
+    image = qts.util.array_to_qimage(array)
+
+    assert image.format() == QtGui.QImage.Format.Format_Grayscale8
+    assert image.bytesPerLine() == 8
+    assert image.pixelColor(4, 2).red() == 0x7F
+
+
+def test_array_to_qimage_read_only() -> None:
+    numpy = pytest.importorskip("numpy")
+
+    array = numpy.frombuffer(bytes(range(12)), dtype=numpy.uint8).reshape(2, 2, 3)
+    image = qts.util.array_to_qimage(array, format="Format_RGB888")
+
+    assert image.pixelColor(1, 1).getRgb() == (9, 10, 11, 255)
+
+
+def test_array_to_qimage_painting_keeps_read_only_array() -> None:
+    numpy = pytest.importorskip("numpy")
+    from qts import QtGui
+
+    array = numpy.zeros((2, 2, 3), dtype=numpy.uint8)
+    array.flags.writeable = False
+    image = qts.util.array_to_qimage(array, format="Format_RGB888")
+
+    painter = QtGui.QPainter(image)
+    painter.fillRect(0, 0, 2, 2, QtGui.QColor(0x10, 0x20, 0x30))
+    painter.end()
+
+    assert image.pixelColor(1, 1).getRgb() == (0x10, 0x20, 0x30, 255)
+    assert not array.any()
+
+
+def test_array_to_qimage_painting_changes_writable_array() -> None:
+    numpy = pytest.importorskip("numpy")
+    from qts import QtGui
+
+    array = numpy.zeros((2, 2, 3), dtype=numpy.uint8)
+    image = qts.util.array_to_qimage(array, format="Format_RGB888")
+
+    painter = QtGui.QPainter(image)
+    painter.fillRect(0, 0, 2, 2, QtGui.QColor(0x10, 0x20, 0x30))
+    painter.end()
+
+    assert array[1, 1].tolist() == [0x10, 0x20, 0x30]
+
+
+@pytest.mark.parametrize(
+    argnames=["shape", "dtype", "format", "match"],
+    argvalues=[
+        [(2, 2, 2), "u1", None, "No image format"],
+        [(2, 2), "f4", None, "No image format"],
+        [(2, 2, 3), "u1", "Format_RGBA8888", "does not match"],
+        [(2,), "u1", None, "dimensions"],
+        [(0, 2), "u1", None, "empty"],
+    ],
+)
+def test_array_to_qimage_invalid(
+    shape: typing.Tuple[int, ...],
+    dtype: str,
+    format: typing.Optional[str],
+    match: str,
+) -> None:
+    numpy = pytest.importorskip("numpy")
+
+    with pytest.raises(ValueError, match=match):
+        qts.util.array_to_qimage(numpy.zeros(shape, dtype=dtype), format=format)
+
+
+def test_array_to_qimage_rejects_non_contiguous_pixels() -> None:
+    numpy = pytest.importorskip("numpy")
+
+    array = numpy.zeros((4, 4, 4), dtype=numpy.uint8)[:, ::2]
+
+    with pytest.raises(ValueError, match="contiguous"):
+        qts.util.array_to_qimage(array)
+
+
+def test_array_to_qimage_byte_order() -> None:
+    numpy = pytest.importorskip("numpy")
+    from qts import QtGui
+
+    native, swapped = ("<", ">") if sys.byteorder == "little" else (">", "<")
+    array = numpy.array([[0x0102, 0x0304]], dtype=f"{native}u2")
+
+    image = qts.util.array_to_qimage(array)
+
+    assert image.format() == QtGui.QImage.Format.Format_Grayscale16
+
+    with pytest.raises(ValueError, match="native byte order"):
+        qts.util.array_to_qimage(array.astype(f"{swapped}u2"))
+
+
+def test_qimage_to_array_shares_memory() -> None:
+    pytest.importorskip("numpy")
+    from qts import QtGui
+
+    image = QtGui.QImage(5, 3, QtGui.QImage.Format.Format_RGB888)
+    image.fill(QtGui.QColor(1, 2, 3))
+
+    array = qts.util.qimage_to_array(image)
+    array[0, 0] = [7, 8, 9]
+
+    assert array.shape == (3, 5, 3)
+    assert array.strides[0] == image.bytesPerLine()
+    assert array[2, 4].tolist() == [1, 2, 3]
+    assert image.pixelColor(0, 0).getRgb() == (7, 8, 9, 255)
+
+
+def test_qimage_to_array_keeps_image_alive() -> None:
+    numpy = pytest.importorskip("numpy")
+
+    source = numpy.arange(2 * 3 * 4, dtype=numpy.uint8).reshape(2, 3, 4)
+    image = qts.util.array_to_qimage(source).copy()
+
+    array = qts.util.qimage_to_array(image, writable=False)
+    del image
+    gc.collect()
+
+    assert not array.flags.writeable
+    assert array.tolist() == source.tolist()
+
+
+def test_qimage_to_array_null_image() -> None:
+    pytest.importorskip("numpy")
+    from qts import QtGui
+
+    with pytest.raises(ValueError, match="null"):
+        qts.util.qimage_to_array(QtGui.QImage())
+
+
+def test_qbytearray_view_is_read_only() -> None:
+    from qts import QtCore
+
+    byte_array = QtCore.QByteArray(b"abcdef")
+    view = qts.util.qbytearray_view(byte_array)
+
+    assert bytes(view) == b"abcdef"
+    assert view.readonly
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="Read only views are copies before Python 3.8"
+)
+def test_qbytearray_view_does_not_copy() -> None:
+    from qts import QtCore
+
+    byte_array = QtCore.QByteArray(b"abcdef")
+
+    try:
+        memoryview(typing.cast(typing.Any, byte_array))
+    except TypeError:
+        pytest.skip("The wrapper does not support the buffer protocol for QByteArray")
+
+    view = qts.util.qbytearray_view(byte_array)
+    # The wrapper stubs disagree on the fill character type.
+    typing.cast(typing.Any, byte_array).fill(b"x")
+
+    assert bytes(view) == b"xxxxxx"
+
+
+def test_qbytearray_view_keeps_byte_array_alive() -> None:
+    from qts import QtCore
+
+    view = qts.util.qbytearray_view(QtCore.QByteArray(b"abc" * 1000))
+    gc.collect()
+
+    assert bytes(view) == b"abc" * 1000
+
+
+@pytest.mark.parametrize(
+    argnames="buffer",
+    argvalues=[
+        b"abcdef",
+        bytearray(b"abcdef"),
+        memoryview(b"abcdef"),
+        memoryview(b"abcdef")[1:4],
+        memoryview(b"a-b-c-d-e-f-")[::2],
+        memoryview(b"abcdefgh").cast("I"),
+        b"",
+    ],
+    ids=["bytes", "bytearray", "memoryview", "slice", "strided", "cast", "empty"],
+)
+def test_buffer_to_qbytearray(buffer: typing.Any) -> None:
+    byte_array = qts.util.buffer_to_qbytearray(buffer)
+
+    assert bytes(typing.cast(typing.Any, byte_array)) == memoryview(buffer).tobytes()
+
+
+def test_numpy_array_to_qbytearray() -> None:
+    numpy = pytest.importorskip("numpy")
+
+    array = numpy.arange(12, dtype=numpy.uint16).reshape(3, 4)[:, ::2]
+    byte_array = qts.util.buffer_to_qbytearray(array)
+
+    assert bytes(typing.cast(typing.Any, byte_array)) == array.tobytes()
@@ -0,0 +1,45 @@
+import collections
+import time
+import types
+import typing
+
+
+origin = time.perf_counter()
+"""The :func:`time.perf_counter` value when qts was imported."""
+
+max_records = 1000
+"""The number of most recent records kept so that programs repeatedly probing for
+wrappers do not grow the records without bound.
+"""
+
+records: typing.Deque[typing.Tuple[str, str, float, float]] = collections.deque(
+    maxlen=max_records
+)
+"""The recorded phases as ``(phase, detail, start, duration)`` tuples.  ``start`` is
+relative to :data:`origin`.  See :mod:`qts.diagnostics` for the public interface.
+"""
+
+
+class timed:
+    """A context manager recording the wall clock time spent in a phase of selecting
+    and importing a wrapper.  This is kept minimal since it runs at startup.
+    """
+
+    __slots__ = ("phase", "detail", "start")
+
+    def __init__(self, phase: str, detail: str = "") -> None:
+        self.phase = phase
+        self.detail = detail
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc_value: typing.Optional[BaseException],
+        traceback: typing.Optional[types.TracebackType],
+    ) -> None:
+        end = time.perf_counter()
+        records.append((self.phase, self.detail, self.start - origin, end - self.start))
@@ -0,0 +1,214 @@
+"""Diagnostics for understanding where time goes when selecting a wrapper and
+importing the Qt modules through qts.  Timings are recorded from the moment qts is
+imported so a report can be requested at any later point.
+
+:class:`StallMonitor` measures the responsiveness of a running event loop.  It is
+loaded on first access since it imports the Qt modules.
+"""
+import json
+import math
+import typing
+
+import attr
+
+import qts
+import qts._timing
+
+
+if typing.TYPE_CHECKING:
+    from qts._stall import StallMonitor as StallMonitor
+else:
+
+    def __getattr__(name):
+        if name != "StallMonitor":
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        import qts._stall
+
+        value = qts._stall.StallMonitor
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted({*globals(), "StallMonitor"})
+
+
+@attr.frozen
+class PhaseTiming:
+    """The wall clock timing of a single phase of selecting a wrapper or importing a
+    Qt module.
+    """
+
+    phase: str
+    """The kind of work such as ``"environment"``, ``"find_spec"``, ``"sys.modules"``,
+    or ``"import"``."""
+    detail: str
+    """What the phase worked on, such as the probed module name for ``"find_spec"``
+    or the wrapped module name for ``"import"``."""
+    start: float
+    """The start time in seconds relative to when qts was imported."""
+    duration: float
+    """The wall clock duration in seconds."""
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        """Get the timing as JSON compatible builtin types."""
+        return attr.asdict(self)
+
+
+@attr.frozen
+class ImportReport:
+    """The recorded timings of selecting a wrapper and importing Qt modules."""
+
+    wrapper_name: typing.Optional[str]
+    """The name of the selected wrapper, if any."""
+    phases: typing.Tuple[PhaseTiming, ...]
+    """The recorded phases in the order they completed.  Phases nested in other
+    phases, such as a probe triggered by an import, are recorded separately so
+    summing all durations may count some time twice."""
+
+    def total(self, phase: typing.Optional[str] = None) -> float:
+        """Get the summed duration in seconds.
+
+        :param phase: Only sum phases of this kind.  All phases if not specified.
+        """
+        return sum(
+            timing.duration
+            for timing in self.phases
+            if phase is None or timing.phase == phase
+        )
+
+    def totals(self) -> typing.Dict[str, float]:
+        """Get the summed duration in seconds for each kind of phase."""
+        result: typing.Dict[str, float] = {}
+
+        for timing in self.phases:
+            result[timing.phase] = result.get(timing.phase, 0) + timing.duration
+
+        return result
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        """Get the report as JSON compatible builtin types."""
+        return {
+            "wrapper": self.wrapper_name,
+            "phases": [timing.to_dict() for timing in self.phases],
+            "totals": self.totals(),
+        }
+
+    def to_json(self, indent: typing.Optional[int] = 4) -> str:
+        """Get the report serialized as JSON."""
+        return json.dumps(self.to_dict(), indent=indent)
+
+
+def import_report() -> ImportReport:
+    """Get a report of the phases recorded so far.  Only the most recent
+    1,000 are kept.
+    """
+    return ImportReport(
+        wrapper_name=None if qts.wrapper is None else qts.wrapper.name,
+        phases=tuple(
+            PhaseTiming(phase=phase, detail=detail, start=start, duration=duration)
+            for phase, detail, start, duration in qts._timing.records
+        ),
+    )
+
+
+def reset() -> None:
+    """Discard the phases recorded so far."""
+    qts._timing.records.clear()
+
+
+@attr.frozen
+class Stall:
+    """A period during which the event loop did not handle a heartbeat for longer
+    than the threshold of the :class:`StallMonitor`.
+    """
+
+    start: float
+    """When the heartbeat was posted, in seconds relative to the start of
+    monitoring."""
+    duration: float
+    """How long the heartbeat waited in seconds.  For an ongoing stall, how long it
+    has waited so far."""
+    stack: typing.Tuple[str, ...]
+    """The Python stack of the event loop thread when the threshold was crossed, as
+    formatted by :func:`traceback.format_stack`.  Empty if it could not be
+    captured."""
+    ongoing: bool = False
+    """Whether the heartbeat was still waiting when the report was made."""
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        """Get the stall as JSON compatible builtin types."""
+        return {**attr.asdict(self), "stack": list(self.stack)}
+
+
+@attr.frozen
+class ResponsivenessReport:
+    """The heartbeat latencies and stalls recorded by a :class:`StallMonitor`."""
+
+    wrapper_name: typing.Optional[str]
+    """The name of the selected wrapper, if any."""
+    duration: float
+    """The seconds monitored."""
+    interval: float
+    """The seconds between a heartbeat being handled and the next being posted."""
+    threshold: float
+    """The heartbeat latency in seconds at which a stall is recorded."""
+    bounds: typing.Tuple[float, ...]
+    """The upper bound in seconds of each histogram bucket.  The last is
+    infinite."""
+    counts: typing.Tuple[int, ...]
+    """The number of heartbeats with a latency up to each bound and above the
+    previous."""
+    max_latency: float
+    """The longest heartbeat latency in seconds."""
+    stalls: typing.Tuple[Stall, ...]
+    """The recorded stalls in order, including an ongoing stall."""
+    dropped_stalls: int
+    """The number of stalls not recorded since the limit was reached."""
+
+    @property
+    def heartbeats(self) -> int:
+        """The number of heartbeats handled."""
+        return sum(self.counts)
+
+    def percentile(self, percent: float) -> float:
+        """Get the upper bound of the histogram bucket holding the latency at this
+        percentile, which may be :data:`math.inf` for the last bucket.
+
+        :raises ValueError: When no heartbeats have been handled.
+        """
+        total = self.heartbeats
+        if total == 0:
+            raise ValueError("No heartbeats have been handled")
+
+        rank = max(1, math.ceil(total * percent / 100))
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+
+        return self.bounds[-1]
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        """Get the report as JSON compatible builtin types.  The infinite bound is
+        ``None``.
+        """
+        return {
+            "wrapper": self.wrapper_name,
+            "duration": self.duration,
+            "interval": self.interval,
+            "threshold": self.threshold,
+            "heartbeats": self.heartbeats,
+            "max_latency": self.max_latency,
+            "histogram": [
+                {"le": None if math.isinf(bound) else bound, "count": count}
+                for bound, count in zip(self.bounds, self.counts)
+            ],
+            "stalls": [stall.to_dict() for stall in self.stalls],
+            "dropped_stalls": self.dropped_stalls,
+        }
+
+    def to_json(self, indent: typing.Optional[int] = 4) -> str:
+        """Get the report serialized as JSON."""
+        return json.dumps(self.to_dict(), indent=indent)
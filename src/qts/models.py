@@ -0,0 +1,963 @@
+"""Item models for large data sets.  These build on :mod:`qts.QtCore` so they work
+with any wrapper.  NumPy is required and can be installed with the ``numpy`` extra.
+"""
+import array
+import collections
+import csv
+import mmap
+import os
+import threading
+import typing
+
+import numpy
+import typing_extensions
+
+import qts.util
+from qts import QtCore
+
+
+_display_role = qts.util.enum_to_int(QtCore.Qt.ItemDataRole.DisplayRole)
+_edit_role = qts.util.enum_to_int(QtCore.Qt.ItemDataRole.EditRole)
+_alignment_role = qts.util.enum_to_int(QtCore.Qt.ItemDataRole.TextAlignmentRole)
+_tool_tip_role = qts.util.enum_to_int(QtCore.Qt.ItemDataRole.ToolTipRole)
+_other_roles = frozenset([_edit_role, _alignment_role, _tool_tip_role])
+
+_numeric_alignment = (
+    QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
+)
+_text_alignment = (
+    QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter
+)
+
+_default_formats = {"f": "%.6g", "i": "%d", "u": "%d"}
+"""Display formats by NumPy type kind.  Other kinds are formatted with :class:`str`."""
+
+
+def _alignment(dtype: numpy.dtype) -> object:
+    return _numeric_alignment if dtype.kind in "biuf" else _text_alignment
+
+
+def format_values(
+    values: numpy.ndarray, format: typing.Optional[str]
+) -> typing.List[str]:
+    """Format an array of values as display strings.
+
+    The values are converted to Python objects in bulk, which is much cheaper than
+    indexing NumPy scalars one at a time, and then formatted without any per value
+    attribute lookups.  This is also several times faster than
+    :func:`numpy.char.mod`.
+
+    :param format: A printf style format such as ``"%.3f"``.  :class:`str` is used
+        for each value when :data:`None`.
+    """
+    if format is None:
+        return list(map(str, values.tolist()))
+
+    return list(map(format.__mod__, values.tolist()))
+
+
+class ArrayTableModel(QtCore.QAbstractTableModel):
+    """A read only table model backed by one NumPy array per column.
+
+    Display strings are formatted a block of rows at a time with a single vectorized
+    operation when any cell in the block is first shown.  The most recently used
+    blocks are kept and the rest are discarded so memory use does not grow with the
+    number of rows scrolled through.  :meth:`data` compares roles as integers and
+    checks the display role first since that is what views request most.
+
+    :param columns: The column arrays by header name.  All must have the same length.
+    :param formats: printf style display formats by header name, such as ``"%.2f"``.
+        Defaults are chosen from the type of each array.
+    :param block_rows: The number of rows formatted at once.  Rounded up to a power
+        of two.
+    :param max_blocks: The number of formatted blocks to keep.
+    :param parent: The parent object.
+
+    :raises ValueError: When the columns are not one dimensional or have different
+        lengths.
+    """
+
+    def __init__(
+        self,
+        columns: typing.Mapping[str, numpy.ndarray],
+        formats: typing.Optional[typing.Mapping[str, typing.Optional[str]]] = None,
+        block_rows: int = 64,
+        max_blocks: int = 256,
+        parent: typing.Optional[QtCore.QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+
+        self._block_shift = max(0, block_rows - 1).bit_length()
+        self._block_mask = (1 << self._block_shift) - 1
+        self._max_blocks = max_blocks
+        self._blocks: "collections.OrderedDict[typing.Tuple[int, int], typing.List[str]]"
+        self._blocks = collections.OrderedDict()
+
+        self._names: typing.List[str] = []
+        self._arrays: typing.List[numpy.ndarray] = []
+        self._buffers: typing.List[numpy.ndarray] = []
+        self._formats: typing.List[typing.Optional[str]] = []
+        self._formatted_names: typing.Set[str] = set()
+        self._alignments: typing.List[object] = []
+        self._row_count = 0
+        self._set_columns(columns=columns, formats=formats)
+
+    def _set_columns(
+        self,
+        columns: typing.Mapping[str, numpy.ndarray],
+        formats: typing.Optional[typing.Mapping[str, typing.Optional[str]]],
+    ) -> None:
+        arrays = [numpy.asarray(array) for array in columns.values()]
+        lengths = {len(array) for array in arrays}
+
+        if any(array.ndim != 1 for array in arrays):
+            raise ValueError("Each column must be one dimensional")
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, got {lengths}")
+
+        if formats is None:
+            formats = {}
+
+        self._names = list(columns)
+        self._arrays = arrays
+        self._buffers = list(arrays)
+        self._formats = [
+            formats[name] if name in formats else _default_formats.get(array.dtype.kind)
+            for name, array in zip(self._names, arrays)
+        ]
+        self._formatted_names = set(formats) & set(self._names)
+        self._alignments = [_alignment(dtype=array.dtype) for array in arrays]
+        self._row_count = lengths.pop() if lengths else 0
+        self._blocks.clear()
+
+    def set_columns(
+        self,
+        columns: typing.Mapping[str, numpy.ndarray],
+        formats: typing.Optional[typing.Mapping[str, typing.Optional[str]]] = None,
+    ) -> None:
+        """Replace all of the data and reset the model.
+
+        :raises ValueError: When the columns are not one dimensional or have
+            different lengths.
+        """
+        self.beginResetModel()
+        try:
+            self._set_columns(columns=columns, formats=formats)
+        finally:
+            self.endResetModel()
+
+    def append_rows(self, columns: typing.Mapping[str, numpy.ndarray]) -> None:
+        """Append rows to the end of the table.  The column arrays grow geometrically
+        so repeated appends copy each row a constant number of times on average.
+        Arrays returned by :meth:`column_array` before the append are not updated.
+        When the values promote the type of a column, such as floats appended to
+        integers, its default display format and alignment follow the new type.
+
+        :param columns: The values to append by header name, for every column.
+
+        :raises ValueError: When the column names do not match or the values have
+            different lengths.
+        """
+        if set(columns) != set(self._names):
+            raise ValueError(
+                f"Values must be passed for exactly the columns {self._names},"
+                f" got {list(columns)}"
+            )
+
+        values = [numpy.asarray(columns[name]) for name in self._names]
+        lengths = {len(array) for array in values}
+
+        if any(array.ndim != 1 for array in values):
+            raise ValueError("Each column must be one dimensional")
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, got {lengths}")
+
+        count = lengths.pop() if lengths else 0
+        if count == 0:
+            return
+
+        first = self._row_count
+        end = first + count
+
+        promoted: typing.Set[int] = set()
+        self.beginInsertRows(QtCore.QModelIndex(), first, end - 1)
+        for column, new_values in enumerate(values):
+            buffer = self._buffers[column]
+            dtype = numpy.result_type(buffer, new_values)
+
+            if dtype != buffer.dtype:
+                promoted.add(column)
+                if self._names[column] not in self._formatted_names:
+                    self._formats[column] = _default_formats.get(dtype.kind)
+                self._alignments[column] = _alignment(dtype=dtype)
+
+            if len(buffer) < end or dtype != buffer.dtype:
+                grown = numpy.empty(max(end, 2 * len(buffer)), dtype=dtype)
+                grown[:first] = buffer[:first]
+                buffer = self._buffers[column] = grown
+
+            buffer[first:end] = new_values
+            self._arrays[column] = buffer[:end]
+
+        self._row_count = end
+        # The last cached block may have been partial and the existing rows of
+        # promoted columns were formatted for the previous type.
+        first_block = first >> self._block_shift
+        for key in [
+            key for key in self._blocks if key[1] >= first_block or key[0] in promoted
+        ]:
+            del self._blocks[key]
+        self.endInsertRows()
+
+        if first > 0:
+            for column in sorted(promoted):
+                self.dataChanged.emit(
+                    self.index(0, column), self.index(first - 1, column)
+                )
+
+    def column_names(self) -> typing.List[str]:
+        """Get the header names of the columns."""
+        return list(self._names)
+
+    def column_array(self, column: int) -> numpy.ndarray:
+        """Get the array backing a column."""
+        return self._arrays[column]
+
+    def invalidate_display_cache(self) -> None:
+        """Discard all formatted display strings, such as after modifying the
+        arrays in place.
+        """
+        self._blocks.clear()
+
+    def prefetch(self, first_row: int, last_row: int) -> None:
+        """Format the display strings for all columns of a range of rows, such as the
+        rows about to be shown by a view, ahead of the :meth:`data` calls.
+        """
+        first_block = max(0, first_row) >> self._block_shift
+        last_block = min(last_row, self._row_count - 1) >> self._block_shift
+
+        for column in range(len(self._arrays)):
+            for block in range(first_block, last_block + 1):
+                if (column, block) not in self._blocks:
+                    self._format_block(column=column, block=block)
+
+    def _format_block(self, column: int, block: int) -> typing.List[str]:
+        start = block << self._block_shift
+        values = self._arrays[column][start : start + self._block_mask + 1]
+        strings = format_values(values=values, format=self._formats[column])
+
+        blocks = self._blocks
+        blocks[column, block] = strings
+        while len(blocks) > self._max_blocks:
+            blocks.popitem(last=False)
+
+        return strings
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return self._row_count
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self._arrays)
+
+    def data(
+        self,
+        index: QtCore.QModelIndex,
+        role: int = _display_role,
+    ) -> typing.Any:
+        row = index.row()
+        column = index.column()
+        # Views, delegates, and proxies may pass invalid or stale indexes.
+        if not index.isValid() or row >= self._row_count or column >= len(self._arrays):
+            return None
+
+        if role == _display_role:
+            key = (column, row >> self._block_shift)
+            blocks = self._blocks
+            strings = blocks.get(key)
+
+            if strings is None:
+                strings = self._format_block(column=key[0], block=key[1])
+            else:
+                blocks.move_to_end(key)
+
+            return strings[row & self._block_mask]
+
+        # Views request several other roles for every cell so those not handled
+        # here are rejected with a single lookup.
+        if role not in _other_roles:
+            return None
+
+        if role == _alignment_role:
+            return self._alignments[column]
+
+        if role == _tool_tip_role:
+            return self.data(index, _display_role)
+
+        return self._arrays[column][row].item()
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = _display_role,
+    ) -> typing.Any:
+        if role != _display_role:
+            return None
+
+        if orientation == QtCore.Qt.Orientation.Horizontal:
+            return self._names[section]
+
+        return str(section)
+
+
+Filter = typing.Callable[[typing.Sequence[numpy.ndarray]], numpy.ndarray]
+"""Takes the column arrays of a range of source rows and returns a boolean mask of the
+rows to accept."""
+
+
+class ColumnarModel(typing_extensions.Protocol):
+    """A model that provides the data of each column as a NumPy array, such as
+    :class:`ArrayTableModel`.
+    """
+
+    def column_array(self, column: int) -> numpy.ndarray:
+        ...
+
+
+def stable_argsort(keys: numpy.ndarray, descending: bool = False) -> numpy.ndarray:
+    """Get the permutation sorting the keys that keeps equal keys in their original
+    order, in both directions.
+    """
+    if not descending:
+        return numpy.argsort(keys, kind="stable")
+
+    # Sorting the reversed keys and reversing the result puts equal keys in reverse
+    # order so the positions are flipped back.
+    reversed_order = numpy.argsort(keys[::-1], kind="stable")[::-1]
+    order: numpy.ndarray = len(keys) - 1 - reversed_order
+    return order
+
+
+class ArraySortFilterProxyModel(QtCore.QAbstractProxyModel):
+    """A sorting and filtering proxy for a flat source model that provides its
+    columns as NumPy arrays through ``column_array()``, such as
+    :class:`ArrayTableModel`.
+
+    Unlike :class:`QSortFilterProxyModel`, which calls back into Python for every
+    comparison and every row, the sort permutation is computed with a single
+    :func:`numpy.argsort` and the filter with a single boolean mask.  Indexes are
+    mapped by looking up the resulting arrays.  Sorting is stable in both
+    directions.
+
+    Rows appended to the end of the source model are filtered and merged into the
+    current order without recomputing the existing rows.  Any other structural or
+    data change of the source model resets the proxy.
+
+    :param parent: The parent object.
+    """
+
+    max_insert_groups = 64
+    """The number of separate positions appended rows may be inserted at before the
+    proxy resets instead.  Each position is a separate row insertion for the views."""
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+
+        self._filter: typing.Optional[Filter] = None
+        self._sort_column = -1
+        self._descending = False
+        self._proxy_to_source = numpy.empty(0, dtype=numpy.intp)
+        self._source_to_proxy = numpy.empty(0, dtype=numpy.intp)
+        self._resetting = False
+        self._connections: typing.List[
+            typing.Tuple[QtCore.SignalInstance, typing.Callable[..., None]]
+        ] = []
+
+    def setSourceModel(
+        self, sourceModel: typing.Optional[QtCore.QAbstractItemModel]
+    ) -> None:
+        """Set the source model.
+
+        :raises TypeError: When the model does not provide ``column_array()``.
+        """
+        if sourceModel is not None and not callable(
+            getattr(sourceModel, "column_array", None)
+        ):
+            raise TypeError(
+                f"The source model must provide column_array(), got {sourceModel!r}"
+            )
+
+        self.beginResetModel()
+        for signal, slot in self._connections:
+            signal.disconnect(slot)
+
+        self._connections = []
+        super().setSourceModel(sourceModel)
+
+        if sourceModel is None:
+            self._rebuild()
+            self.endResetModel()
+            return
+
+        begin = self._begin_source_change
+        end = self._end_source_change
+        self._connections = [
+            (sourceModel.modelAboutToBeReset, begin),
+            (sourceModel.modelReset, end),
+            (sourceModel.layoutAboutToBeChanged, begin),
+            (sourceModel.layoutChanged, end),
+            (sourceModel.rowsAboutToBeRemoved, begin),
+            (sourceModel.rowsRemoved, end),
+            (sourceModel.rowsAboutToBeMoved, begin),
+            (sourceModel.rowsMoved, end),
+            (sourceModel.columnsAboutToBeInserted, begin),
+            (sourceModel.columnsInserted, end),
+            (sourceModel.columnsAboutToBeRemoved, begin),
+            (sourceModel.columnsRemoved, end),
+            (sourceModel.columnsAboutToBeMoved, begin),
+            (sourceModel.columnsMoved, end),
+            (sourceModel.rowsAboutToBeInserted, self._source_rows_about_to_be_inserted),
+            (sourceModel.rowsInserted, self._source_rows_inserted),
+            (sourceModel.dataChanged, self._source_data_changed),
+        ]
+        for signal, slot in self._connections:
+            signal.connect(slot)
+
+        self._rebuild()
+        self.endResetModel()
+
+    def _source(self) -> QtCore.QAbstractItemModel:
+        source = self.sourceModel()
+        assert source is not None
+        return source
+
+    def _columnar_source(self) -> ColumnarModel:
+        return typing.cast(ColumnarModel, self._source())
+
+    def set_filter(self, filter: typing.Optional[Filter]) -> None:
+        """Set the function selecting the source rows to show, or :data:`None` to
+        show all rows.  It is passed the column arrays of a range of source rows and
+        must return a boolean mask of the same length, such as
+        ``lambda columns: columns[1] > 0``.
+        """
+        self.beginResetModel()
+        self._filter = filter
+        self._rebuild()
+        self.endResetModel()
+
+    def sort_column(self) -> int:
+        """Get the column the rows are sorted by, or -1 for the source order."""
+        return self._sort_column
+
+    def sort(
+        self,
+        column: int,
+        order: QtCore.Qt.SortOrder = QtCore.Qt.SortOrder.AscendingOrder,
+    ) -> None:
+        """Sort the rows by the values of a column, or restore the source order
+        for a column of -1.
+        """
+        self.layoutAboutToBeChanged.emit()
+
+        persistent = self.persistentIndexList()
+        source_rows = [self._proxy_to_source[index.row()] for index in persistent]
+
+        self._sort_column = column
+        self._descending = order == QtCore.Qt.SortOrder.DescendingOrder
+        self._rebuild()
+
+        self.changePersistentIndexList(
+            persistent,
+            [
+                self.index(int(self._source_to_proxy[row]), index.column())
+                for row, index in zip(source_rows, persistent)
+            ],
+        )
+        self.layoutChanged.emit()
+
+    def _mask(self, first: int, end: int) -> numpy.ndarray:
+        assert self._filter is not None
+        source = self._columnar_source()
+        columns = [
+            source.column_array(column)[first:end]
+            for column in range(self._source().columnCount())
+        ]
+
+        mask = numpy.asarray(self._filter(columns), dtype=bool)
+        if mask.shape != (end - first,):
+            raise ValueError(
+                f"The filter must return a mask of shape {(end - first,)},"
+                f" got {mask.shape}"
+            )
+
+        return mask
+
+    def _rebuild(self) -> None:
+        source_model = self.sourceModel()
+        source_row_count = 0 if source_model is None else source_model.rowCount()
+        rows = numpy.arange(source_row_count, dtype=numpy.intp)
+
+        if self._filter is not None and source_row_count > 0:
+            rows = rows[self._mask(first=0, end=source_row_count)]
+
+        if self._sort_column >= 0 and len(rows) > 0:
+            keys = self._columnar_source().column_array(self._sort_column)[rows]
+            rows = rows[stable_argsort(keys, descending=self._descending)]
+
+        self._proxy_to_source = rows
+        self._source_to_proxy = numpy.full(source_row_count, -1, dtype=numpy.intp)
+        self._source_to_proxy[rows] = numpy.arange(len(rows), dtype=numpy.intp)
+
+    def _begin_source_change(self, *args: object) -> None:
+        if not self._resetting:
+            self._resetting = True
+            self.beginResetModel()
+
+    def _end_source_change(self, *args: object) -> None:
+        if self._resetting:
+            self._resetting = False
+            self._rebuild()
+            self.endResetModel()
+
+    def _source_data_changed(self, *args: object) -> None:
+        self._begin_source_change()
+        self._end_source_change()
+
+    def _source_rows_about_to_be_inserted(
+        self, parent: QtCore.QModelIndex, first: int, last: int
+    ) -> None:
+        if first != len(self._source_to_proxy):
+            self._begin_source_change()
+
+    def _source_rows_inserted(
+        self, parent: QtCore.QModelIndex, first: int, last: int
+    ) -> None:
+        if self._resetting:
+            self._end_source_change()
+            return
+
+        end = last + 1
+        rows = numpy.arange(first, end, dtype=numpy.intp)
+        if self._filter is not None:
+            rows = rows[self._mask(first=first, end=end)]
+
+        self._source_to_proxy = numpy.concatenate(
+            [self._source_to_proxy, numpy.full(end - first, -1, dtype=numpy.intp)]
+        )
+
+        if len(rows) == 0:
+            return
+
+        if self._sort_column < 0:
+            positions = numpy.full(len(rows), len(self._proxy_to_source))
+        else:
+            column = self._columnar_source().column_array(self._sort_column)
+            keys = column[rows]
+            order = stable_argsort(keys, descending=self._descending)
+            rows = rows[order]
+            keys = keys[order]
+            # Appended rows come after the existing rows with equal keys.
+            sorted_keys = column[self._proxy_to_source]
+            if self._descending:
+                positions = len(sorted_keys) - numpy.searchsorted(
+                    sorted_keys[::-1], keys, side="left"
+                )
+            else:
+                positions = numpy.searchsorted(sorted_keys, keys, side="right")
+
+        starts = numpy.flatnonzero(numpy.diff(positions, prepend=-1))
+        if len(starts) > self.max_insert_groups:
+            self.beginResetModel()
+            self._rebuild()
+            self.endResetModel()
+            return
+
+        ends = [*starts[1:].tolist(), len(rows)]
+        for inserted, (start, stop) in enumerate(zip(starts.tolist(), ends)):
+            proxy_first = int(positions[start]) + start
+            self.beginInsertRows(
+                QtCore.QModelIndex(), proxy_first, proxy_first + stop - start - 1
+            )
+            self._proxy_to_source = numpy.insert(
+                self._proxy_to_source, proxy_first, rows[start:stop]
+            )
+            self._source_to_proxy[self._proxy_to_source[proxy_first:]] = numpy.arange(
+                proxy_first, len(self._proxy_to_source), dtype=numpy.intp
+            )
+            self.endInsertRows()
+
+    def mapToSource(self, proxyIndex: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        if not proxyIndex.isValid():
+            return QtCore.QModelIndex()
+
+        return self._source().index(
+            int(self._proxy_to_source[proxyIndex.row()]), proxyIndex.column()
+        )
+
+    def mapFromSource(self, sourceIndex: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        if not sourceIndex.isValid():
+            return QtCore.QModelIndex()
+
+        row = int(self._source_to_proxy[sourceIndex.row()])
+        if row < 0:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(row, sourceIndex.column())
+
+    def index(
+        self,
+        row: int,
+        column: int,
+        parent: QtCore.QModelIndex = QtCore.QModelIndex(),
+    ) -> QtCore.QModelIndex:
+        if (
+            parent.isValid()
+            or not 0 <= row < len(self._proxy_to_source)
+            or not 0 <= column < self.columnCount()
+        ):
+            return QtCore.QModelIndex()
+
+        return self.createIndex(row, column)
+
+    @typing.overload
+    def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        ...
+
+    @typing.overload
+    def parent(self) -> typing.Optional[QtCore.QObject]:
+        ...
+
+    def parent(
+        self, child: typing.Optional[QtCore.QModelIndex] = None
+    ) -> typing.Union[QtCore.QModelIndex, typing.Optional[QtCore.QObject]]:
+        if child is None:
+            return super().parent()
+
+        return QtCore.QModelIndex()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self._proxy_to_source)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        source = self.sourceModel()
+        if parent.isValid() or source is None:
+            return 0
+
+        return source.columnCount()
+
+
+class MappedFileModel(QtCore.QAbstractTableModel):
+    """A read only model of the lines of a text file, such as a log or a CSV file,
+    for files too large to load.
+
+    A background thread scans a memory map of the file for line breaks and records
+    where every ``stride`` th line starts, so the index is a small fraction of the
+    size of a full line offset index.  Scanned pages are released again where the
+    platform supports it.  Rows are read and decoded a block of ``stride`` lines at
+    a time when first shown and only the most recently used blocks are kept, so
+    memory use does not grow with the size of the file.
+
+    Rows become available as the scan progresses.  Views add them with
+    :meth:`fetchMore` when scrolled to the end and the first ``fetch_rows`` rows are
+    added as soon as they have been scanned.  :attr:`indexing_progressed` reports
+    the number of lines scanned so far.
+
+    The encoding must encode a line feed as the single byte ``0x0a``, as UTF-8 and
+    the single byte encodings do.  A trailing carriage return is removed from each
+    line.  Call :meth:`close` to stop the scan and unmap the file.
+
+    :param path: The file to show.
+    :param encoding: The encoding of the file.  Undecodable bytes are replaced.
+    :param delimiter: Split each line into columns with :mod:`csv` using this
+        delimiter.  Each line is a single column when :data:`None`.
+    :param header: Use the first line as the column names rather than as a row.
+        Without a delimiter the whole line is the name of the single column.
+    :param stride: The number of lines per index entry and per decoded block.
+        Rounded up to a power of two.
+    :param max_blocks: The number of decoded blocks to keep.
+    :param fetch_rows: The number of rows added by each :meth:`fetchMore`.
+    :param parent: The parent object.
+
+    :raises OSError: When the file can not be opened.
+    """
+
+    indexing_progressed = QtCore.Signal(int)
+    """Emitted in the model's thread with the number of lines scanned so far."""
+
+    indexing_finished = QtCore.Signal()
+    """Emitted in the model's thread once the whole file has been scanned."""
+
+    _scanned = QtCore.Signal(int, bool)
+
+    chunk_bytes = 1 << 22
+    """The number of bytes scanned at once."""
+
+    def __init__(
+        self,
+        path: typing.Union[str, "os.PathLike[str]"],
+        encoding: str = "utf-8",
+        delimiter: typing.Optional[str] = None,
+        header: bool = False,
+        stride: int = 64,
+        max_blocks: int = 256,
+        fetch_rows: int = 100_000,
+        parent: typing.Optional[QtCore.QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+
+        self._encoding = encoding
+        self._delimiter = delimiter
+        self._stride_shift = max(0, stride - 1).bit_length()
+        self._stride_mask = (1 << self._stride_shift) - 1
+        self._max_blocks = max_blocks
+        self._fetch_rows = fetch_rows
+        self._blocks: "collections.OrderedDict[int, typing.List[typing.Any]]"
+        self._blocks = collections.OrderedDict()
+
+        self._file = open(path, "rb", buffering=0)
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._mmap: typing.Optional[mmap.mmap] = None
+        if self._size > 0:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Guarded by the lock and written by the scanning thread.
+        self._lock = threading.Lock()
+        self._checkpoints = array.array("q", [0])
+        self._scanned_lines = 0
+        self._scanned_end = 0
+        self._finished = False
+
+        self._first_row = 0
+        self._row_count = 0
+        self._names: typing.List[str] = []
+        if delimiter is not None:
+            first_line = self._read_first_line()
+            self._names = next(csv.reader([first_line], delimiter=delimiter), [])
+            if not header:
+                self._names = [str(column) for column in range(len(self._names))]
+        elif header:
+            # The whole line names the single column.
+            self._names = [self._read_first_line()]
+        if header:
+            self._first_row = 1
+
+        # Emitted from the scanning thread so the connection is queued.
+        self._scanned.connect(self._on_scanned)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._scan, name=f"qts index {path}", daemon=True
+        )
+        self._thread.start()
+
+    def _read_first_line(self) -> str:
+        if self._mmap is None:
+            return ""
+
+        end = self._mmap.find(b"\n")
+        if end < 0:
+            end = self._size
+
+        return self._decode(self._mmap[:end])[0]
+
+    def _decode(self, data: bytes) -> typing.List[str]:
+        lines = data.decode(self._encoding, errors="replace").split("\n")
+        return [line[:-1] if line.endswith("\r") else line for line in lines]
+
+    def _scan(self) -> None:
+        mapped = self._mmap
+        stride = self._stride_mask + 1
+        newline_count = 0
+        offset = 0
+        can_release = hasattr(mapped, "madvise") and hasattr(mmap, "MADV_DONTNEED")
+
+        while mapped is not None and offset < self._size:
+            if self._stop.is_set():
+                return
+
+            end = min(self._size, offset + self.chunk_bytes)
+            chunk = numpy.frombuffer(
+                mapped, dtype=numpy.uint8, count=end - offset, offset=offset
+            )
+            positions = numpy.flatnonzero(chunk == ord("\n"))
+            # The buffer export must be released before the map can be closed.
+            del chunk
+            if can_release:
+                mapped.madvise(mmap.MADV_DONTNEED, offset, end - offset)
+
+            # The line after newline number n, counting from zero, is line n + 1.
+            first = -(newline_count + 1) % stride
+            starts = positions[first::stride] + (offset + 1)
+
+            with self._lock:
+                self._checkpoints.extend(starts.tolist())
+                newline_count += len(positions)
+                self._scanned_lines = newline_count
+                if len(positions) > 0:
+                    self._scanned_end = offset + int(positions[-1]) + 1
+
+            self._scanned.emit(newline_count, False)
+            offset = end
+
+        with self._lock:
+            if self._scanned_end < self._size:
+                # The last line has no line break.
+                self._scanned_lines += 1
+                self._scanned_end = self._size
+            self._finished = True
+            newline_count = self._scanned_lines
+
+        self._scanned.emit(newline_count, True)
+
+    def _on_scanned(self, lines: int, finished: bool) -> None:
+        if self._row_count < self._fetch_rows and self.canFetchMore():
+            self.fetchMore()
+
+        self.indexing_progressed.emit(lines)
+        if finished:
+            self.indexing_finished.emit()
+
+    def is_indexed(self) -> bool:
+        """Check if the whole file has been scanned."""
+        with self._lock:
+            return self._finished
+
+    def wait(self, timeout: typing.Optional[float] = None) -> bool:
+        """Block until the whole file has been scanned.  The rows are only added
+        to the model by :meth:`fetchMore`.
+
+        :returns: If the scan finished within the timeout.
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def scanned_lines(self) -> int:
+        """Get the number of complete lines found so far."""
+        with self._lock:
+            return self._scanned_lines
+
+    def close(self) -> None:
+        """Stop scanning and unmap the file.  The model is empty afterwards."""
+        self._stop.set()
+        self._thread.join()
+
+        self.beginResetModel()
+        self._row_count = 0
+        self._blocks.clear()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+        self.endResetModel()
+
+    def _available_rows(self) -> int:
+        with self._lock:
+            return max(0, self._scanned_lines - self._first_row)
+
+    def canFetchMore(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        if parent.isValid() or self._mmap is None:
+            return False
+
+        return self._row_count < self._available_rows()
+
+    def fetchMore(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> None:
+        if parent.isValid() or self._mmap is None:
+            return
+
+        first = self._row_count
+        end = min(self._available_rows(), first + self._fetch_rows)
+        if end <= first:
+            return
+
+        self.beginInsertRows(QtCore.QModelIndex(), first, end - 1)
+        self._row_count = end
+        # The last decoded block may have been missing lines that were not scanned
+        # yet.
+        last_block = (first + self._first_row) >> self._stride_shift
+        self._blocks.pop(last_block, None)
+        self.endInsertRows()
+
+    def _block(self, block: int) -> typing.List[typing.Any]:
+        blocks = self._blocks
+        rows = blocks.get(block)
+        if rows is not None:
+            blocks.move_to_end(block)
+            return rows
+
+        assert self._mmap is not None
+        with self._lock:
+            start = self._checkpoints[block]
+            if block + 1 < len(self._checkpoints):
+                end = self._checkpoints[block + 1]
+            else:
+                end = self._scanned_end
+
+        # Reading rather than slicing the map keeps the pages, and the pages read
+        # ahead around them, out of the resident set of the process.
+        self._file.seek(start)
+        lines = self._decode(self._file.read(end - start))
+        if self._delimiter is None:
+            rows = lines
+        else:
+            rows = list(csv.reader(lines, delimiter=self._delimiter))
+
+        blocks[block] = rows
+        while len(blocks) > self._max_blocks:
+            blocks.popitem(last=False)
+
+        return rows
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return self._row_count
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return max(1, len(self._names))
+
+    def data(
+        self,
+        index: QtCore.QModelIndex,
+        role: int = _display_role,
+    ) -> typing.Any:
+        if role != _display_role and role != _tool_tip_role:
+            return None
+
+        # Views, delegates, and proxies may pass invalid or stale indexes.
+        if not index.isValid() or index.row() >= self._row_count:
+            return None
+
+        line = index.row() + self._first_row
+        row = self._block(line >> self._stride_shift)[line & self._stride_mask]
+
+        if self._delimiter is None:
+            return row
+
+        column = index.column()
+        return row[column] if column < len(row) else ""
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = _display_role,
+    ) -> typing.Any:
+        if role != _display_role:
+            return None
+
+        if orientation == QtCore.Qt.Orientation.Horizontal and self._names:
+            return self._names[section]
+
+        return str(section)
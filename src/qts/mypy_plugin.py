@@ -0,0 +1,136 @@
+"""A mypy plugin that makes the ``qts.is_*_wrapper`` conditions static for a chosen
+wrapper.  Branches for the other wrappers, such as the import chains in
+``qts.QtCore``, become unreachable so mypy never loads the stubs of the other
+wrappers.  Enable it in the mypy configuration.
+
+.. code-block:: ini
+
+    [mypy]
+    plugins = qts.mypy_plugin
+
+    [qts-mypy]
+    wrapper = pyside6
+
+For ``pyproject.toml`` the equivalent sections are ``[tool.mypy]`` and
+``[tool.qts-mypy]``.  Before Python 3.11 reading ``pyproject.toml`` requires
+:mod:`tomli`, installed with the ``mypy_plugin`` extra of qts, or :mod:`toml`.  The
+wrapper is chosen from, in order of precedence, the ``QTS_WRAPPER`` environment
+variable, the configuration, and finally the first available wrapper.
+
+The plugin replaces the ``--always-true`` and ``--always-false`` flags generated by
+``qts mypy args``, so do not pass both.  Any such flags for the ``qts.is_*_wrapper``
+conditions are overridden in mypy's global options while other names passed in them
+are kept.
+"""
+import configparser
+import importlib
+import os
+import sys
+import typing
+
+import mypy.options
+import mypy.plugin
+
+import qts
+import qts._mypy
+
+
+config_section = "qts-mypy"
+"""The section of the mypy configuration file holding the plugin settings."""
+
+
+def _load_toml(path: str) -> typing.Dict[str, typing.Any]:
+    # tomllib is in the standard library from Python 3.11 and tomli is the same
+    # parser for earlier versions.  Older versions of mypy depend on toml instead.
+    for module_name in ["tomllib", "tomli"]:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+
+        with open(path, "rb") as file:
+            data: typing.Dict[str, typing.Any] = module.load(file)
+        return data
+
+    try:
+        module = importlib.import_module("toml")
+    except ImportError:
+        raise ModuleNotFoundError(
+            f"Reading {path} before Python 3.11 requires tomli, such as from the"
+            f" mypy_plugin extra of qts, or toml"
+        ) from None
+
+    with open(path, encoding="utf-8") as file:
+        data = module.load(file)
+    return data
+
+
+def _read_configured_wrapper_name(config_file: str) -> typing.Optional[str]:
+    if config_file.endswith(".toml"):
+        data = _load_toml(path=config_file)
+        section = data.get("tool", {}).get(config_section, {})
+        name = section.get("wrapper")
+        return None if name is None else str(name)
+
+    parser = configparser.ConfigParser()
+    parser.read(config_file, encoding="utf-8")
+
+    return parser.get(config_section, "wrapper", fallback=None)
+
+
+def selected_wrapper(options: mypy.options.Options) -> qts.Wrapper:
+    """Get the wrapper to type check against.
+
+    :raises qts.InvalidWrapperError: When an unknown wrapper name is configured.
+    :raises qts.NoWrapperAvailableError: When nothing is configured and no wrapper is
+        installed.
+    """
+    name = os.environ.get("QTS_WRAPPER")
+
+    if name is None and options.config_file is not None:
+        name = _read_configured_wrapper_name(config_file=options.config_file)
+
+    if name is None:
+        return qts.an_available_wrapper()
+
+    try:
+        return qts.wrapper_by_name(name=name.strip())
+    except KeyError:
+        raise qts.InvalidWrapperError(wrapper=name) from None
+
+
+class QtsPlugin(mypy.plugin.Plugin):
+    """Sets ``always_true`` and ``always_false`` for the ``qts.is_*_wrapper``
+    conditions as if ``qts mypy args`` had been passed on the command line, replacing
+    any already passed for them.
+    """
+
+    def __init__(self, options: mypy.options.Options) -> None:
+        super().__init__(options)
+
+        self.wrapper = selected_wrapper(options=options)
+        conditions = qts._mypy.conditions(wrapper=self.wrapper)
+
+        # Replace rather than add to any conditions already passed to mypy.
+        options.always_true = [
+            name for name in options.always_true if name not in conditions
+        ]
+        options.always_false = [
+            name for name in options.always_false if name not in conditions
+        ]
+        for name, value in conditions.items():
+            if value:
+                options.always_true.append(name)
+            else:
+                options.always_false.append(name)
+
+    def report_config_data(
+        self, ctx: mypy.plugin.ReportConfigContext
+    ) -> typing.Dict[str, str]:
+        # Invalidate the mypy cache when a different wrapper is selected.
+        return {"wrapper": self.wrapper.name}
+
+
+def plugin(version: str) -> typing.Type[mypy.plugin.Plugin]:
+    """The entry point used by mypy to load the plugin."""
+    return QtsPlugin
@@ -1,6 +1,60 @@
+import enum
+import importlib
+import operator
+import sys
+import typing
+
 import typing_extensions
 
 import qts
+import qts._lazy
+
+
+if typing.TYPE_CHECKING:
+    import numpy
+
+    from qts import QtCore, QtGui
+    import qts._coalesce
+    from qts._asyncio import QtEventLoop as QtEventLoop
+    from qts._asyncio import QtEventLoopPolicy as QtEventLoopPolicy
+    from qts._asyncio import QtSelector as QtSelector
+    from qts._asyncio import run as run
+    from qts._calls import CallQueue as CallQueue
+    from qts._coalesce import Coalescer as Coalescer
+    from qts._executor import ThreadPoolExecutor as ThreadPoolExecutor
+    from qts._process import ProcessPoolExecutor as ProcessPoolExecutor
+
+    CoalesceMode = qts._coalesce.Mode
+else:
+    # These import the Qt modules of the wrapper so they are only loaded on first
+    # access.
+
+    _lazy_names = {
+        "QtEventLoop": ("qts._asyncio", "QtEventLoop"),
+        "QtEventLoopPolicy": ("qts._asyncio", "QtEventLoopPolicy"),
+        "QtSelector": ("qts._asyncio", "QtSelector"),
+        "run": ("qts._asyncio", "run"),
+        "CallQueue": ("qts._calls", "CallQueue"),
+        "Coalescer": ("qts._coalesce", "Coalescer"),
+        "CoalesceMode": ("qts._coalesce", "Mode"),
+        "ThreadPoolExecutor": ("qts._executor", "ThreadPoolExecutor"),
+        "ProcessPoolExecutor": ("qts._process", "ProcessPoolExecutor"),
+    }
+
+    def __getattr__(name):
+        try:
+            module_name, attribute = _lazy_names[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+        value = getattr(importlib.import_module(module_name), attribute)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted({*globals(), *_lazy_names})
 
 
 class ExecProtocol(typing_extensions.Protocol):
@@ -38,3 +92,472 @@ def exec(execable: "ExecProtocol") -> int:
         return execable.exec_()
 
     return execable.exec()
+
+
+_T = typing.TypeVar("_T")
+
+
+class EnumTable:
+    """Enum members of a Qt namespace, such as :class:`QtCore.Qt`, by their short
+    names.  Qt5 wrappers provide members directly on the namespace, such as
+    ``Qt.AlignLeft``, while PyQt6 only provides them on the scoped enum, such as
+    ``Qt.AlignmentFlag.AlignLeft``.  Either way, ``table.AlignLeft`` resolves to the
+    member.  Qualified names such as ``"AlignmentFlag.AlignLeft"`` are also accepted
+    by :meth:`member`.  Use :func:`enums` to get the shared table for a namespace.
+
+    The table is built on first use and stored as instance attributes so later
+    lookups are plain attribute hits.
+    """
+
+    def __init__(self, namespace: object) -> None:
+        self._namespace = namespace
+        self._ambiguous: typing.Set[str] = set()
+        self._qualified: typing.Dict[str, object] = {}
+        self._built = False
+
+    def _build(self) -> None:
+        namespace = self._namespace
+        flat: typing.Dict[str, object] = {}
+        scoped: typing.Dict[str, typing.List[object]] = {}
+        values = {}
+
+        for name in dir(namespace):
+            if not name.startswith("_"):
+                values[name] = getattr(namespace, name)
+
+        namespace_types = {
+            value for value in values.values() if isinstance(value, type)
+        }
+
+        for name, value in values.items():
+            if isinstance(value, type):
+                # enum.Enum based as in PyQt6 and PySide6, or the values mapping of
+                # older shiboken enums
+                members = getattr(value, "__members__", None)
+                if members is None:
+                    members = getattr(value, "values", None)
+                if not isinstance(members, typing.Mapping):
+                    continue
+
+                for member_name, member in members.items():
+                    scoped.setdefault(member_name, []).append(member)
+                    self._qualified[f"{name}.{member_name}"] = member
+            elif type(value) in namespace_types:
+                # directly on the namespace as in the Qt5 wrappers
+                flat[name] = value
+                self._qualified[f"{type(value).__name__}.{name}"] = value
+
+        for name, members in scoped.items():
+            if name in flat:
+                continue
+
+            if len({id(member) for member in members}) > 1:
+                self._ambiguous.add(name)
+            else:
+                flat[name] = members[0]
+
+        vars(self).update(flat)
+        self._built = True
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name.startswith("_") or self._built:
+            return self._missing(name=name)
+
+        self._build()
+        return getattr(self, name)
+
+    def _missing(self, name: str) -> typing.NoReturn:
+        if name in self._ambiguous:
+            raise AttributeError(
+                f"{name!r} is ambiguous in {self._namespace!r}, use the qualified"
+                f" name such as 'EnumName.{name}' with .member()"
+            )
+
+        raise AttributeError(f"No enum member {name!r} in {self._namespace!r}")
+
+    def member(self, name: str) -> typing.Any:
+        """Get a member by short name, such as ``"AlignLeft"``, or by qualified name,
+        such as ``"AlignmentFlag.AlignLeft"``.
+
+        :raises AttributeError: When there is no such member or the short name is
+            used by multiple enums in the namespace.
+        """
+        if "." not in name:
+            return getattr(self, name)
+
+        if not self._built:
+            self._build()
+
+        try:
+            return self._qualified[name]
+        except KeyError:
+            raise AttributeError(
+                f"No enum member {name!r} in {self._namespace!r}"
+            ) from None
+
+    def __dir__(self) -> typing.List[str]:
+        if not self._built:
+            self._build()
+
+        return sorted(name for name in vars(self) if not name.startswith("_"))
+
+
+_enum_tables: typing.Dict[object, EnumTable] = {}
+
+
+def enums(namespace: object) -> EnumTable:
+    """Get the :class:`EnumTable` for a Qt namespace such as :class:`QtCore.Qt` or
+    :class:`QtWidgets.QSizePolicy`.  Tables are shared so each is only built once.
+
+    .. code-block:: python
+
+        Qt = qts.util.enums(QtCore.Qt)
+        painter.drawText(rect, Qt.AlignLeft | Qt.AlignTop, text)
+    """
+    try:
+        return _enum_tables[namespace]
+    except KeyError:
+        table = _enum_tables[namespace] = EnumTable(namespace=namespace)
+        return table
+
+
+_to_int_by_type: typing.Dict[type, typing.Callable[[typing.Any], int]] = {}
+_from_int_by_type: typing.Dict[type, typing.Callable[[int], typing.Any]] = {}
+
+
+def enum_to_int(value: object) -> int:
+    """Get the integer value of an enum member or flags.  PyQt6 and newer PySide6
+    use :class:`enum.Enum` members while the Qt5 wrappers use integer like values.
+    The conversion is chosen once per type.
+    """
+    value_type = type(value)
+    to_int = _to_int_by_type.get(value_type)
+
+    if to_int is None:
+        if issubclass(value_type, enum.Enum):
+            to_int = operator.attrgetter("value")
+        else:
+            to_int = typing.cast(typing.Callable[[typing.Any], int], int)
+        _to_int_by_type[value_type] = to_int
+
+    return to_int(value)
+
+
+def _make_from_int(enum_type: type) -> typing.Callable[[int], typing.Any]:
+    if not issubclass(enum_type, enum.Enum):
+        return enum_type
+
+    # The value lookup table of enum.Enum is much faster than calling the type.  It
+    # also collects combined flags once they have been created.
+    get_member = enum_type._value2member_map_.get
+
+    def from_int(value: int) -> typing.Any:
+        member = get_member(value)
+        if member is None:
+            return enum_type(value)
+        return member
+
+    return from_int
+
+
+def int_to_enum(enum_type: typing.Type[_T], value: int) -> _T:
+    """Get the member, or combined flags, of an enum type for an integer value.  The
+    conversion is chosen once per type.
+
+    .. code-block:: python
+
+        alignment = qts.util.int_to_enum(QtCore.Qt.AlignmentFlag, 0x21)
+    """
+    from_int = _from_int_by_type.get(enum_type)
+
+    if from_int is None:
+        from_int = _from_int_by_type[enum_type] = _make_from_int(enum_type=enum_type)
+
+    result: _T = from_int(value)
+    return result
+
+
+_image_layouts = {
+    "Format_Alpha8": (1, "u1"),
+    "Format_Grayscale8": (1, "u1"),
+    "Format_Grayscale16": (1, "u2"),
+    "Format_RGB888": (3, "u1"),
+    "Format_BGR888": (3, "u1"),
+    "Format_RGB32": (4, "u1"),
+    "Format_ARGB32": (4, "u1"),
+    "Format_ARGB32_Premultiplied": (4, "u1"),
+    "Format_RGBX8888": (4, "u1"),
+    "Format_RGBA8888": (4, "u1"),
+    "Format_RGBA8888_Premultiplied": (4, "u1"),
+    "Format_RGBX64": (4, "u2"),
+    "Format_RGBA64": (4, "u2"),
+    "Format_RGBA64_Premultiplied": (4, "u2"),
+}
+"""The channel count and NumPy type of each supported :class:`QtGui.QImage` format.
+Not every format is available in every Qt version."""
+
+_default_image_formats = {
+    (1, "u1"): "Format_Grayscale8",
+    (1, "u2"): "Format_Grayscale16",
+    (3, "u1"): "Format_RGB888",
+    (4, "u1"): "Format_RGBA8888",
+    (4, "u2"): "Format_RGBA64",
+}
+"""The format used for each array layout when none is specified."""
+
+
+class _ArrayInterface:
+    """Exposes memory owned by another object through the NumPy array interface.
+    Arrays created from it reference it as their base so the owner is kept alive as
+    long as any view of the memory exists.
+    """
+
+    __slots__ = ("__array_interface__", "owner")
+
+    def __init__(self, interface: typing.Dict[str, object], owner: object) -> None:
+        self.__array_interface__ = interface
+        self.owner = owner
+
+
+def _image_layout(image_format: object) -> typing.Tuple[int, str]:
+    from qts import QtGui
+
+    formats = enums(QtGui.QImage)
+    for name, layout in _image_layouts.items():
+        if getattr(formats, name, None) == image_format:
+            return layout
+
+    raise ValueError(f"Unsupported image format: {image_format!r}")
+
+
+def _image_format(name: str) -> "QtGui.QImage.Format":
+    from qts import QtGui
+
+    try:
+        image_format: QtGui.QImage.Format = getattr(enums(QtGui.QImage), name)
+    except AttributeError:
+        raise ValueError(f"Image format not available in this Qt: {name}") from None
+
+    return image_format
+
+
+def qimage_to_array(image: "QtGui.QImage", writable: bool = True) -> "numpy.ndarray":
+    """Get a NumPy view of the pixels of a :class:`QtGui.QImage` without copying.  The
+    array has the shape ``(height, width)`` for single channel formats and
+    ``(height, width, channels)`` otherwise.  Each row of the array starts on a
+    scan line of the image so any padding at the end of the lines is skipped via the
+    strides.  The array keeps the image alive.
+
+    Note that 32 bit formats such as ``Format_ARGB32`` store each pixel as a native
+    integer so the channel order is B, G, R, A on little endian systems.
+
+    :param writable: A writable view may make the image detach from any other image
+        it implicitly shares data with, just as :meth:`QtGui.QImage.bits` does.
+        Otherwise a read only view of the shared data is returned.
+
+    :raises ValueError: When the image is null or the format is not supported.
+    """
+    import numpy
+
+    if image.isNull():
+        raise ValueError("Can not view the pixels of a null image")
+
+    channels, type_code = _image_layout(image_format=image.format())
+    dtype = numpy.dtype(type_code)
+
+    # This differs per wrapper so it is not worth hinting.
+    bits: typing.Any = image.bits() if writable else image.constBits()
+    if qts.is_pyqt_5_wrapper or qts.is_pyqt_6_wrapper:
+        # a sip.voidptr
+        address = int(bits)
+    else:
+        # a buffer such as a memoryview
+        address = numpy.frombuffer(bits, dtype=numpy.uint8).ctypes.data
+
+    shape: typing.Tuple[int, ...] = (image.height(), image.width())
+    strides: typing.Tuple[int, ...] = (image.bytesPerLine(), channels * dtype.itemsize)
+    if channels > 1:
+        shape = (*shape, channels)
+        strides = (*strides, dtype.itemsize)
+
+    interface = {
+        "version": 3,
+        "shape": shape,
+        "typestr": dtype.str,
+        "data": (address, not writable),
+        "strides": strides,
+    }
+    result: numpy.ndarray = numpy.asarray(
+        _ArrayInterface(interface=interface, owner=image)
+    )
+    return result
+
+
+def array_to_qimage(
+    array: "numpy.ndarray",
+    format: typing.Optional[str] = None,
+) -> "QtGui.QImage":
+    """Create a :class:`QtGui.QImage` that uses the memory of a NumPy array without
+    copying.  The array must have the shape ``(height, width)`` or
+    ``(height, width, channels)`` with the pixels of each row contiguous.  Rows may
+    be padded.  The array is referenced from the image object so it is kept alive as
+    long as the image object is.  Images copied from it on the C++ side, such as by
+    painting or passing it to Qt, do not keep the array alive so use
+    :meth:`QtGui.QImage.copy` for images that should outlive the array.  Changing the
+    image, such as by painting on it, changes a writable array.  A read-only array is
+    never changed, the image data is copied first.
+
+    :param format: The name of the format such as ``"Format_RGB888"``.  Chosen from
+        the shape and type of the array when not specified, ``Format_Grayscale8``,
+        ``Format_Grayscale16``, ``Format_RGB888``, ``Format_RGBA8888``, or
+        ``Format_RGBA64``.
+
+    :raises ValueError: When the layout of the array is not supported, does not
+        match the format, or is not in native byte order.
+    """
+    import ctypes
+
+    from qts import QtGui
+
+    if array.ndim == 2:
+        channels = 1
+    elif array.ndim == 3:
+        channels = array.shape[2]
+    else:
+        raise ValueError(f"Expected 2 or 3 dimensions but got {array.ndim}")
+
+    # Qt reads the pixels in native byte order and the layout ignores the order.
+    if array.dtype.byteorder not in "=|":
+        raise ValueError(
+            f"The array must be in native byte order, got {array.dtype.str}.  Convert"
+            f" it with array.astype(array.dtype.newbyteorder('='))"
+        )
+
+    layout = (channels, array.dtype.str[1:])
+    if format is None:
+        try:
+            format = _default_image_formats[layout]
+        except KeyError:
+            raise ValueError(
+                f"No image format for {channels} channels of {array.dtype}"
+            ) from None
+    elif _image_layouts.get(format) != layout:
+        raise ValueError(
+            f"{format} does not match {channels} channels of {array.dtype}"
+        )
+
+    height, width = array.shape[:2]
+    if height == 0 or width == 0:
+        raise ValueError("The array must not be empty")
+
+    pixel_size = channels * array.dtype.itemsize
+    if array.strides[1] != pixel_size or (
+        channels > 1 and array.strides[2] != array.dtype.itemsize
+    ):
+        raise ValueError("The pixels of each row of the array must be contiguous")
+    if array.strides[0] < width * pixel_size:
+        raise ValueError("The rows of the array must not overlap")
+
+    is_pyqt = qts.is_pyqt_5_wrapper or qts.is_pyqt_6_wrapper
+    if not is_pyqt and not array.flags.writeable:
+        # PySide treats every buffer as writable data so painting would change the
+        # array.
+        array = array.copy()
+
+    address = array.ctypes.data
+    if is_pyqt and array.flags.writeable:
+        # PyQt treats a sip.voidptr as writable data and other buffers as read only,
+        # for which the image copies the data before it is first changed.
+        sip = importlib.import_module(qts._lazy.wrapped_name(name="sip"))
+        data: typing.Any = sip.voidptr(address)
+    else:
+        size = array.strides[0] * (height - 1) + width * pixel_size
+        data = (ctypes.c_ubyte * size).from_address(address)
+
+    image: QtGui.QImage = QtGui.QImage(
+        data, width, height, array.strides[0], _image_format(name=format)
+    )
+    setattr(image, "_qts_array", array)
+
+    return image
+
+
+def qbytearray_view(byte_array: "QtCore.QByteArray") -> memoryview:
+    """Get a read only :class:`memoryview` of the contents of a
+    :class:`QtCore.QByteArray`.  The view references the byte array so it is kept
+    alive.  The byte array must not be modified while the view is in use since Qt
+    may reallocate the memory.
+
+    ========  ======
+    Wrapper   Copies
+    ========  ======
+    PyQt5     0
+    PyQt6     0
+    PySide2   0, or 1 if the buffer protocol is not supported
+    PySide6   0, or 1 if the buffer protocol is not supported
+    ========  ======
+
+    ``bytes(byte_array)`` and ``byte_array.data()`` always copy.  On Python 3.7 a
+    writable view is copied once more to make it read only, so it does not follow
+    later changes to the byte array.
+    """
+    try:
+        # Not all wrapper stubs declare the buffer protocol.
+        view = memoryview(typing.cast(typing.Any, byte_array))
+    except TypeError:
+        view = memoryview(byte_array.data())
+
+    if sys.version_info >= (3, 8):
+        view = view.toreadonly()
+    elif not view.readonly:
+        # memoryview.toreadonly() is new in Python 3.8 and bytes are read only.
+        view = memoryview(view.tobytes())
+
+    return view
+
+
+def buffer_to_qbytearray(buffer: typing.Any) -> "QtCore.QByteArray":
+    """Create a :class:`QtCore.QByteArray` holding a copy of the contents of any
+    object supporting the buffer protocol such as :class:`bytes`,
+    :class:`bytearray`, :class:`memoryview`, or NumPy arrays.  Qt always owns the
+    memory of a byte array so one copy is required.  The data is copied directly
+    into the byte array where possible instead of first making an intermediate
+    :class:`bytes`.
+
+    ========  ======
+    Wrapper   Copies
+    ========  ======
+    PyQt5     1
+    PyQt6     1
+    PySide2   1, or 2 if the byte array is not a writable buffer
+    PySide6   1, or 2 if the byte array is not a writable buffer
+    ========  ======
+
+    Buffers that are not contiguous, such as strided NumPy views, take one extra
+    copy to make them contiguous.
+    """
+    from qts import QtCore
+
+    if isinstance(buffer, bytes):
+        return QtCore.QByteArray(buffer)
+
+    source = memoryview(buffer)
+    if not source.c_contiguous:
+        source = memoryview(source.tobytes())
+    source = source.cast("B")
+
+    byte_array = QtCore.QByteArray()
+    byte_array.resize(source.nbytes)
+
+    try:
+        target = memoryview(typing.cast(typing.Any, byte_array))
+    except TypeError:
+        return QtCore.QByteArray(source.tobytes())
+
+    with target:
+        if target.readonly:
+            return QtCore.QByteArray(source.tobytes())
+
+        target.cast("B")[:] = source
+
+    return byte_array